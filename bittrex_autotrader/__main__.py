@@ -10,9 +10,14 @@
 """
 
 # Standard libraries.
-import csv
-import io
+import atexit
+import concurrent.futures
+import heapq
+import os
+import queue
+import sys
 import time
+import traceback
 
 # External modules.
 import humanfriendly.prompts
@@ -22,8 +27,15 @@ import humanfriendly.terminal.spinners
 import numpy
 
 # Package modules.
-from .config  import values as BittrexAutoTraderConfig
-from .request import BittrexAutoTraderRequest
+from .config     import values as BittrexAutoTraderConfig
+from .errors     import AuthError, BittrexAutoTraderError, OrderNotFound, TransportError
+from .marketdata import MarketData
+from .orderbook  import OrderBook
+from .orderstore import OrderRecord, OrderStore
+from .services   import TraderServices
+from .           import metrics as BittrexAutoTraderMetrics
+from .           import trades as BittrexAutoTraderTrades
+from .           import tracing as BittrexAutoTraderTracing
 
 #
 # Bittrex API autotrader.
@@ -40,46 +52,106 @@ class BittrexAutoTrader:
     # Percent Bittrex charges for BUY/SELL trades.
     TRADE_FEES = .0025
 
-    def __init__(self, options):
+    def __init__(self, options, services=None):
         """
         Create a new instance of BittrexAutoTrader
 
         Args:
             options (dict):
                 Dictionary of options.
+            services (TraderServices):
+                Services shared by the traders of many markets (optional).
 
         Attributes:
-            api_req (BittrexApiRequest):
-                Instance of BittrexApiRequest.
+            services (TraderServices):
+                API client, polling schedule, stream and order journal.
+            data (MarketData):
+                Market trades and the rates orders are priced from.
             market (str):
                 String literal for the market (ie. BTC-LTC).
             units (float):
                 BUY/SELL total units.
             spread (array):
                 BUY/SELL markup/markdown percentage.
-            method (str):
-                Moving Average calculation method.
-            delay (str):
-                Seconds to delay order status requests (default: 30).
             prompt (bool):
                 Require user interaction to begin trading.
         """
-        self.api_req = BittrexAutoTraderRequest(options['apikey'], options['secret'])
-        self.market  = options['market']
-        self.units   = options['units']
-        self.spread  = options['spread'].split('/')
-        self.method  = options['method']
-        self.delay   = options['delay']
-        self.prompt  = options['prompt']
+        self.services = services or TraderServices(options)
+        self.data     = MarketData(options)
+        self.market   = options['market']
+        self.units    = options['units']
+        self.spread   = options['spread'].split('/')
+        self.prompt   = options['prompt']
+
+        # Latest orders (bounded), spilled to disk if set.
+        self._orders = OrderStore(
+            options.get('order_history') or 1000,
+            os.path.join(options['order_spill'], self.market + '.log')
+            if options.get('order_spill') else None
+        )
+
+        # Type of the next order to submit (None until open orders are loaded).
+        self._next_trade = None
+
+    @property
+    def api_req(self):
+        """
+        Returns the API client.
 
-        # List of orders as dictionary items.
-        self._orders = []
+        Returns:
+            BittrexAutoTraderRequest
+        """
+        return self.services.api_req
 
     def run(self):
         """
         Get open orders, prompt if necessary / determine next trade type and start trading.
         """
-        self._orders = self.api_req.market_open_orders(self.market)
+        try:
+            while True:
+                try:
+                    seconds = self.tick()
+
+                except BittrexAutoTraderError as error:
+                    seconds = self.recover(error)
+
+                if not seconds:
+                    continue
+
+                # Wake as soon as the stream reports the order has completed.
+                if self.services.stream and self._orders:
+                    self.services.stream.orders.wait(self.last_order().id, seconds)
+                else:
+                    BittrexAutoTrader._wait(
+                        label='Order in progress. Waiting',
+                        seconds=seconds
+                    )
+        finally:
+            self.close()
+
+            self.services.close()
+
+    def close(self):
+        """
+        Close the order spill file.
+        """
+        self._orders.close()
+
+    def start(self):
+        """
+        Get open orders, prompt if necessary / determine next trade type.
+        """
+        if self.services.stream:
+            self.services.stream.start()
+
+        # Orders (and reinvested units) survive a restart when journaled.
+        if self.services.journal:
+            self._orders.extend(self.services.journal.market_orders(self.market))
+
+        if self._orders:
+            self.units = self.last_order().quantity
+        else:
+            self._orders.extend(self.api_req.market_open_orders(self.market))
 
         if not self._orders and self.prompt == 'True':
             prompt_choice = humanfriendly.prompts.prompt_for_choice(
@@ -94,33 +166,86 @@ class BittrexAutoTrader:
         else:
             next_trade = 'SELL'
 
-            if self._orders and self.last_order()['type'] == 'LIMIT_SELL':
+            if self._orders and self.last_order().type == 'SELL':
                 next_trade = 'BUY'
 
-        while True:
+            # Remotely cancelled orders are submitted again.
+            if self._orders and self.last_order().outcome == 'CANCELLED':
+                next_trade = self.last_order().type
+
+        self._next_trade = next_trade
 
-            # Check for open orders.
-            if self._orders:
-                order = self.api_req.account_order(
-                    self.last_order()['id']
+    def tick(self):
+        """
+        Check the last order status, submit a new order once it has completed.
+
+        Returns:
+            float (seconds to wait before the next tick)
+
+        Raises:
+            BittrexAutoTraderError
+        """
+
+        # Get open orders on the first tick.
+        if self._next_trade is None:
+            self.start()
+
+        # Check for open orders.
+        if self._orders:
+            with BittrexAutoTraderTracing.TRACER.span('poll', market=self.market):
+                order = self.order_status(self.last_order().id)
+
+            BittrexAutoTraderMetrics.ORDER_POLLS.inc(self.market)
+
+            if order['status'] == 'OPEN':
+                return self.services.scheduler.delay(
+                    order, self.market_ticker(cached=True),
+                    cached=self.services.open_orders is not None
                 )
 
-                if order['status'] == 'OPEN':
-                    BittrexAutoTrader._wait(
-                        label='Order in progress. Waiting',
-                        seconds=float(self.delay)
-                    )
-                    continue
+            self.services.scheduler.forget(order['id'])
+
+            self._complete(order)
 
-                if order['status'] == 'CLOSED' and order['fillQuantity'] == '0.00000000':
-                    next_trade = 'BUY' if next_trade == 'SELL' else 'SELL'
+        # Submit a new order.
+        with BittrexAutoTraderTracing.TRACER.span(
+                'submit_order', market=self.market, type=self._next_trade):
+            self.submit_order(self._next_trade)
 
-                    print('Order remotely cancelled.', "\n")
+        self._next_trade = 'BUY' if self._next_trade == 'SELL' else 'SELL'
 
-            # Submit a new order.
-            self.submit_order(next_trade)
+        return 0
 
-            next_trade = 'BUY' if next_trade == 'SELL' else 'SELL'
+    def recover(self, error):
+        """
+        Handle a failed request, returns seconds to wait before the next tick.
+
+        Authentication errors are raised, since every market shares the API key.
+
+        Args:
+            error (BittrexAutoTraderError):
+                Exception raised by the request.
+
+        Returns:
+            float
+        """
+        if isinstance(error, AuthError):
+            raise error
+
+        print(f'{self.market} {type(error).__name__}: {error}', file=sys.stderr)
+
+        # Treat a missing order as remotely cancelled.
+        if isinstance(error, OrderNotFound) and self._orders:
+            order = self._orders.pop()
+
+            if self.services.journal:
+                self.services.journal.remove(self.market, order.id)
+
+            self._next_trade = 'BUY' if self._next_trade == 'SELL' else 'SELL'
+
+            return 0
+
+        return self.services.scheduler.max_delay
 
     def submit_order(self, trade_type='BUY'):
         """
@@ -132,19 +257,21 @@ class BittrexAutoTrader:
         """
         print(f'Created new {trade_type} order.')
 
-        # Get BUY/SELL orders market totals.
-        market_totals = self.market_totals(trade_type)
+        tracer = BittrexAutoTraderTracing.TRACER
 
-        market_max = round(market_totals.max(), 8)
+        # Get latest BUY/SELL market trades and current ASK/BID orders.
+        with tracer.span('fetch_market'):
+            ticker = self._fetch_market()
 
-        # Calculate Moving Average (TODO: weighted average).
-        if self.method == 'weighted':
-            moving_avg = round(market_totals.average(weights=None), 8)
-        else:
-            moving_avg = round(market_totals.mean(), 8)
+            # Rates that fill the order quantity against the book, if deeper than the ticker.
+            if str(self.data.depth_pricing) == 'True':
+                ticker = dict(ticker, **self._depth_rates())
 
-        # Get current ASK/BID orders.
-        ticker = self.api_req.public_ticker(self.market)
+        with tracer.span('compute_stats'):
+            market_max = round(self.data.trades.max(BittrexAutoTraderTrades.side_of(trade_type)), 8)
+
+            # Calculate Moving Average.
+            moving_avg = round(self.moving_average(trade_type), 8)
 
         # Format human-friendly results.
         stdout = {
@@ -200,30 +327,150 @@ class BittrexAutoTrader:
         stdout['rows'].append(['Qty', format(float(self.units), '.8f')])
 
         # Output human-friendly results.
-        print(humanfriendly.tables.format_pretty_table(
-            stdout['rows'],
-            stdout['cols']
-        ), "\n", time.strftime(' %Y-%m-%d %H:%M:%S '), "\n")
+        with tracer.span('render'):
+            print(humanfriendly.tables.format_pretty_table(
+                stdout['rows'],
+                stdout['cols']
+            ), "\n", time.strftime(' %Y-%m-%d %H:%M:%S '), "\n")
 
-    def market_totals(self, trade_type='BUY'):
+    def order_status(self, order_id):
         """
-        Returns BUY/SELL order market totals as ndarray.
+        Returns the current state of an order, from the stream once completed or
+        the shared open orders if open.
+
+        Args:
+            order_id (str):
+                Order id.
+
+        Returns:
+            dict
+        """
+        stream      = self.services.stream
+        open_orders = self.services.open_orders
+
+        order = stream.orders.closed(order_id) if stream else None
+
+        if order is None and open_orders:
+            order = open_orders.order(order_id, cached=True)
+
+        # Only filled or cancelled orders are requested.
+        return order or self.api_req.account_order(order_id)
+
+    def market_ticker(self, cached=False):
+        """
+        Returns the current tick values, from the stream if connected.
+
+        Args:
+            cached (bool):
+                Only return tick values available without a market request
+                (default: False).
+
+        Returns:
+            dict (None if cached and not available)
+        """
+        stream  = self.services.stream
+        tickers = self.services.tickers
+
+        ticker = stream.ticker(self.market) if stream else None
+
+        if ticker is None and tickers:
+            ticker = tickers.ticker(self.market, cached)
+
+        # Markets missing from the snapshot are requested on their own.
+        if ticker is None and not cached:
+            ticker = self.api_req.public_ticker(self.market)
+
+        return ticker
+
+    def market_book(self):
+        """
+        Returns the market order book, from the stream if in sync.
+
+        Returns:
+            OrderBook
+        """
+        book = self.services.stream.book(self.market) if self.services.stream else None
+
+        if book is None:
+            book = OrderBook()
+            book.snapshot(self.api_req.public_order_book(self.market))
+
+        return book
+
+    def market_totals(self, trade_type='BUY', column='rate'):
+        """
+        Returns BUY/SELL order market totals (buffered trades) as ndarray.
 
         Args:
             trade_type (str):
                 BUY or SELL (default: BUY).
+            column (str):
+                Trade column to return (default: rate).
 
         Returns:
             ndarray
         """
-        market_history = self.api_req.public_market_history(self.market)
+        return self.data.totals(trade_type, column)
 
-        return BittrexAutoTrader._numpy_loadtxt(
-            BittrexAutoTrader._list_of_dict_filter_by(
-                market_history, 'takerSide', trade_type
-            ),
-            ['rate']
-        )
+    def market_trades(self):
+        """
+        Fetch the latest market trades, add those not seen before to the buffer.
+
+        Returns:
+            ndarray (new trades; id, timestamp, rate, quantity, side)
+        """
+        stream = self.services.stream
+
+        # Read streamed trades once the buffer has been filled.
+        if stream and stream.connected.is_set() and len(self.data.trades):
+            market_history = stream.trades(self.market)
+        else:
+            market_history = self.api_req.public_market_history(self.market)
+
+        return self.data.extend(market_history)
+
+    def _fetch_market(self):
+        """
+        Fetch the latest market trades and current tick values, requested at
+        the same time unless either is read from the stream or the shared
+        ticker snapshot.
+
+        Returns:
+            dict (tick values)
+        """
+        stream    = self.services.stream
+        async_req = self.services.async_req
+
+        ticker = self.market_ticker(cached=True)
+
+        streaming = stream and stream.connected.is_set() and len(self.data.trades)
+
+        if ticker is None and not streaming and async_req:
+            market_history, ticker = async_req.gather(
+                async_req.api_req.public_market_history(self.market),
+                async_req.api_req.public_ticker(self.market)
+            )
+
+            self.data.extend(market_history)
+
+            return ticker
+
+        self.market_trades()
+
+        return ticker or self.market_ticker()
+
+    def moving_average(self, trade_type='BUY'):
+        """
+        Returns BUY/SELL Moving Average of buffered trades by calculation method.
+
+        Args:
+            trade_type (str):
+                BUY or SELL (default: BUY).
+
+        Returns:
+            float (nan if there are no trades)
+        """
+        return self.data.moving_average(trade_type)
 
     def last_order(self, trade_type=None):
         """
@@ -234,13 +481,9 @@ class BittrexAutoTrader:
                 BUY or SELL (optional).
 
         Returns:
-            dict
+            OrderRecord (None if not found)
         """
-        for order in reversed(self._orders):
-            if not trade_type or trade_type in order['type']:
-                return order
-
-        return None
+        return self._orders.last(trade_type)
 
     def last_buy_price(self):
         """
@@ -251,7 +494,7 @@ class BittrexAutoTrader:
         """
         order = self.last_order('BUY')
 
-        return float(order['price']) if order else 0
+        return float(order.price) if order else 0
 
     def last_sell_price(self):
         """
@@ -262,7 +505,7 @@ class BittrexAutoTrader:
         """
         order = self.last_order('SELL')
 
-        return float(order['price']) if order else 0
+        return float(order.price) if order else 0
 
     def _reinvest(self, last_price):
         """
@@ -272,29 +515,58 @@ class BittrexAutoTrader:
             last_price (float):
                 Latest market SELL price.
         """
-        quantity = float(self.units)
+        earnings, quantity = BittrexAutoTrader._calc_reinvest(
+            float(self.units), self.last_sell_price(), self.last_buy_price(), last_price
+        )
 
-        sell_price = self.last_sell_price()
-        buy_price = self.last_buy_price()
+        if earnings > 0:
 
-        if sell_price and buy_price:
-            earnings = (sell_price - buy_price) * quantity
-            if earnings > 0:
-                processed = quantity * sell_price
-                available = (processed - \
-                    (processed * BittrexAutoTrader.TRADE_FEES)) + earnings
+            # Output human-friendly results.
+            print(humanfriendly.terminal.ansi_wrap(
+                ''.join(['Total earnings: ', str(earnings)]),
+                bold=True
+            ), "\n")
 
-                # Output human-friendly results.
-                print(humanfriendly.terminal.ansi_wrap(
-                    ''.join(['Total earnings: ', str(earnings)]),
-                    bold=True
-                ), "\n")
+            self.units = quantity
 
-                # Check balance can cover purchase.
-                quantity = available / last_price
-                if (quantity * last_price) <= available:
-                    self.units = quantity
+    def _complete(self, order):
+        """
+        Record the outcome of the last order, once per order.
+
+        Args:
+            order (dict):
+                Completed order as returned by the API.
+        """
+        record = self.last_order()
+
+        # Completed before a failed submission (recover) or a restart.
+        if record.outcome is not None:
+            return
+
+        if order['status'] == 'CLOSED' and order['fillQuantity'] == '0.00000000':
+            record.outcome = 'CANCELLED'
+
+            self._next_trade = 'BUY' if self._next_trade == 'SELL' else 'SELL'
+
+            print('Order remotely cancelled.', "\n")
+        else:
+            record.outcome = 'FILLED'
+
+            BittrexAutoTraderMetrics.ORDER_FILL_SECONDS.observe(
+                time.time() - record.created, self.market, record.type
+            )
+
+            if record.type == 'SELL' and self.last_buy_price():
+                pnl = BittrexAutoTrader._calc_pnl(
+                    float(order['fillQuantity']), float(record.price), self.last_buy_price()
+                )
+
+                BittrexAutoTraderMetrics.REALIZED_PNL.inc(self.market, amount=pnl)
+
+        if self.services.journal:
+            self.services.journal.complete(self.market, record.id, record.outcome)
 
+    @BittrexAutoTraderTracing.TRACER.traced('submit')
     def _submit(self, trade_type, price):
         """
         Submit the API request and store order details.
@@ -303,83 +575,139 @@ class BittrexAutoTrader:
             trade_type (str):
                 BUY or SELL (default: SELL).
         """
-        if trade_type == 'BUY':
-            uuid = self.api_req.market_buy_limit(
-                self.market, self.units, price
-            )['id']
-        else:
-            uuid = self.api_req.market_sell_limit(
-                self.market, self.units, price
-            )['id']
+        try:
+            if trade_type == 'BUY':
+                order = self.api_req.market_buy_limit(
+                    self.market, self.units, price
+                )
+            else:
+                order = self.api_req.market_sell_limit(
+                    self.market, self.units, price
+                )
+
+            uuid = order['id']
 
-        self._orders.append({
-            'id': uuid,
-            'type': trade_type,
-            'price': price,
-            'quantity': self.units
-        })
+            if self.services.open_orders:
+                self.services.open_orders.track(order)
+
+        except TransportError:
+
+            # The order may have been placed, adopt it rather than submit twice.
+            uuid = self._find_open_order(trade_type, price)
+
+            if uuid is None:
+                raise
+
+        record = self._orders.append(OrderRecord(uuid, trade_type, price, self.units))
+
+        BittrexAutoTraderMetrics.ORDERS_SUBMITTED.inc(self.market, trade_type)
+
+        if self.services.journal:
+            self.services.journal.add(self.market, record.as_dict())
+
+    def _find_open_order(self, trade_type, price):
+        """
+        Returns the ID of an open order matching the type and price.
+
+        Args:
+            trade_type (str):
+                BUY or SELL.
+            price (float):
+                Order limit price.
+
+        Returns:
+            str (None if not found)
+        """
+        for order in self.api_req.market_open_orders(self.market):
+            if order['direction'] == trade_type and float(order['limit']) == price:
+                return order['id']
+
+        return None
+
+    def _depth_rates(self):
+        """
+        Returns BID/ASK rates that fill the order units against the order book.
+
+        Returns:
+            dict (bidRate, askRate if the book is deep enough)
+        """
+        book  = self.market_book()
+        rates = {
+            'bidRate': book.price_to_fill('SELL', float(self.units)),
+            'askRate': book.price_to_fill('BUY', float(self.units))
+        }
+
+        return {key: rate for key, rate in rates.items() if rate is not None}
 
     @staticmethod
-    def _calc_decimal_percent(num):
+    def _calc_pnl(quantity, sell_price, buy_price):
         """
-        Returns string percentage as a decimal percent.
+        Returns the realized PnL of a SELL against the preceding BUY, net of fees.
 
         Args:
-            num (str):
-                Percentage as string.
+            quantity (float):
+                SELL filled units.
+            sell_price (float):
+                SELL price.
+            buy_price (float):
+                Preceding BUY price.
 
         Returns:
             float
         """
-        num = float(num)
+        fees = BittrexAutoTrader.TRADE_FEES
 
-        return num if num < 1 else num / 100
+        return quantity * (sell_price * (1 - fees) - buy_price * (1 + fees))
 
     @staticmethod
-    def _list_of_dict_filter_by(data, key, value):
+    def _calc_reinvest(quantity, sell_price, buy_price, last_price):
         """
-        Returns list of dictionary items filtered by key/value.
+        Returns earnings of the last SELL/BUY and units to purchase reinvesting them.
 
         Args:
-            data (dict):
-                Data to filter.
-            key (str):
-                Dictionary key search.
-            value (str):
-                Dictionary key value match.
+            quantity (float):
+                BUY/SELL total units.
+            sell_price (float):
+                Last SELL price (0 if none).
+            buy_price (float):
+                Last BUY price (0 if none).
+            last_price (float):
+                Latest market SELL price.
 
         Returns:
-            list
+            tuple (earnings, units)
         """
-        return [
-            item for i, item in enumerate(data) if data[i].get(key) == value
-        ]
+        earnings = 0
+
+        if sell_price and buy_price:
+            earnings = (sell_price - buy_price) * quantity
+            if earnings > 0:
+                processed = quantity * sell_price
+                available = (processed - \
+                    (processed * BittrexAutoTrader.TRADE_FEES)) + earnings
+
+                # Check balance can cover purchase.
+                units = available / last_price
+                if (units * last_price) <= available:
+                    quantity = units
+
+        return earnings, quantity
 
     @staticmethod
-    def _list_of_dict_to_csv(data, keys=None):
+    def _calc_decimal_percent(num):
         """
-        Returns list of prefiltered dictionary items as CSV string.
+        Returns string percentage as a decimal percent.
 
         Args:
-            data (dict):
-                Data to convert.
-            keys (list):
-                Columns to exclude from result.
+            num (str):
+                Percentage as string.
 
         Returns:
-            string
+            float
         """
-        output = io.StringIO()
-
-        # Filter items by key names.
-        writer = csv.DictWriter(output, fieldnames=keys)
-        for item in data:
-            filtered_item = dict(
-                (key, value) for key, value in item.items() if key in keys
-            )
-            writer.writerow(filtered_item)
+        num = float(num)
 
-        return output.getvalue()
+        return num if num < 1 else num / 100
 
     @staticmethod
     def _numpy_calc_sma(arr, num):
@@ -397,29 +725,6 @@ class BittrexAutoTrader:
         """
         return numpy.convolve(arr, numpy.ones((num,)) / num, mode='valid')
 
-    @staticmethod
-    def _numpy_loadtxt(data, keys=None, converters=None):
-        """
-        Returns list of prefiltered dictionary items as ndarray.
-
-        Args:
-            data: dict
-                Data to convert.
-            keys: list
-                Columns to exclude from result.
-
-        Returns:
-            ndarray
-        """
-        return numpy.loadtxt(
-            io.StringIO(
-                BittrexAutoTrader._list_of_dict_to_csv(data, keys)
-            ),
-            converters=converters,
-            delimiter=',',
-            unpack=True
-        )
-
     @staticmethod
     def _wait(label='Waiting', seconds=10, timer=False):
         """
@@ -436,12 +741,246 @@ class BittrexAutoTrader:
         with humanfriendly.terminal.spinners.AutomaticSpinner(label, show_time=timer):
             time.sleep(seconds)
 
+#
+# Bittrex API multi-market autotrader.
+#
+class BittrexAutoTraderEngine:
+    """
+    Bittrex API multi-market autotrader.
+
+    Runs a BittrexAutoTrader per market in a single process; order status
+    checks and submissions are scheduled on a shared worker pool and share
+    one API client (and connection pool) and stream.  A market is scheduled
+    as soon as the stream reports its order has completed.
+    """
+
+    def __init__(self, options):
+        """
+        Create a new instance of BittrexAutoTraderEngine
+
+        Args:
+            options (dict):
+                Dictionary of options.
+
+        Attributes:
+            services (TraderServices):
+                API client, ticker snapshot, open orders, polling schedule,
+                stream and order journal, shared by all markets.
+            traders (list):
+                BittrexAutoTrader instance per market.
+            workers (int):
+                Total worker threads (default: one per market, max 8).
+        """
+        market_options = BittrexAutoTraderEngine._market_options(options)
+
+        # Completed ticks and completed orders, in the order received.
+        self._events = queue.Queue()
+
+        self.services = TraderServices(
+            options, markets=[values['market'] for values in market_options],
+            on_order=self._order_update
+        )
+
+        self.traders = [BittrexAutoTrader(values, self.services) for values in market_options]
+
+        self.workers = int(options.get('workers') or min(len(self.traders), 8))
+
+    def run(self):
+        """
+        Get open orders for each market and start trading.
+        """
+        try:
+            self._run()
+        finally:
+            self.close()
+
+    def _run(self):
+        """
+        Schedule order status checks / submissions for each market.
+        """
+
+        if self.services.stream:
+            self.services.stream.start()
+
+        markets = {trader.market: i for i, trader in enumerate(self.traders)}
+
+        # Markets ordered by the time their next tick is due (stale once rescheduled).
+        due   = dict.fromkeys(range(len(self.traders)), 0)
+        ticks = [(0, i) for i in due]
+
+        pending  = {}
+        woken    = set()
+        failures = {}
+
+        with concurrent.futures.ThreadPoolExecutor(self.workers) as executor:
+            while True:
+                now = time.monotonic()
+
+                if ticks and ticks[0][0] <= now:
+                    self._refresh()
+
+                while ticks and ticks[0][0] <= now:
+                    when, i = heapq.heappop(ticks)
+
+                    if due.get(i) == when:
+                        del due[i]
+
+                        future = executor.submit(self.traders[i].tick)
+                        future.add_done_callback(self._events.put)
+
+                        pending[future] = i
+
+                try:
+                    event = self._events.get(
+                        timeout=max(ticks[0][0] - now, 0) if ticks else None
+                    )
+
+                except queue.Empty:
+                    continue
+
+                if isinstance(event, concurrent.futures.Future):
+                    i = pending.pop(event)
+
+                    seconds = self._tick_result(i, event, failures)
+
+                    # Completed while ticking, so possibly polled still open.
+                    if i in woken:
+                        woken.discard(i)
+
+                        seconds = 0
+
+                # Tick a market as soon as its order has completed.
+                elif event['marketSymbol'] in markets:
+                    i, seconds = markets[event['marketSymbol']], 0
+
+                    if i not in due:
+                        woken.add(i)
+                        continue
+                else:
+                    continue
+
+                due[i] = time.monotonic() + seconds
+
+                heapq.heappush(ticks, (due[i], i))
+
+    def _tick_result(self, i, future, failures):
+        """
+        Returns seconds to wait before the next tick of a market, once its
+        tick has completed.
+
+        Unexpected errors are logged and the market is retried with backoff,
+        so the other markets keep trading.
+
+        Args:
+            i (int):
+                Index of the market trader.
+            future (concurrent.futures.Future):
+                Completed tick.
+            failures (dict):
+                Consecutive failed ticks per market index.
+
+        Returns:
+            float
+        """
+        try:
+            seconds = future.result()
+
+        except BittrexAutoTraderError as error:
+            return self.traders[i].recover(error)
+
+        except Exception as error: # pylint: disable=broad-except
+            failures[i] = failures.get(i, 0) + 1
+
+            print(f'{self.traders[i].market} {type(error).__name__}: {error}', file=sys.stderr)
+
+            traceback.print_exception(type(error), error, error.__traceback__)
+
+            scheduler = self.services.scheduler
+
+            return min(scheduler.min_delay * 2 ** (failures[i] - 1), scheduler.max_delay)
+
+        failures.pop(i, None)
+
+        return seconds
+
+    def _refresh(self):
+        """
+        Refresh the ticker snapshot and open orders read by the due markets,
+        if older than a poll cycle.
+        """
+        try:
+            self.services.refresh()
+
+        except AuthError:
+            raise
+
+        # Markets read the previous snapshot (or request their order) instead.
+        except BittrexAutoTraderError as error:
+            print(f'{type(error).__name__}: {error}', file=sys.stderr)
+
+    def _order_update(self, order):
+        """
+        Queue a completed order reported by the stream, to wake its market.
+
+        Args:
+            order (dict):
+                Order in the API format.
+        """
+        if order['status'] != 'OPEN':
+            self._events.put(order)
+
+    def close(self):
+        """
+        Close the order spill files and the shared API client, stream and
+        order journal.
+        """
+        for trader in self.traders:
+            trader.close()
+
+        self.services.close()
+
+    @staticmethod
+    def _market_options(options):
+        """
+        Returns options per market, merged with market specific overrides.
+
+        Args:
+            options (dict):
+                Dictionary of options.
+
+        Returns:
+            list
+        """
+        overrides = options.get('markets') or {}
+
+        market_options = []
+        for market in options['market'].split(','):
+            market = market.strip()
+
+            values = dict(options, market=market, prompt='False')
+            values.update(overrides.get(market, {}))
+
+            market_options.append(values)
+
+        return market_options
+
 #
 # Start program.
 #
 if __name__ == '__main__':
 
     # Let's get this party started.
-    BittrexAutoTrader(
-        BittrexAutoTraderConfig()
-    ).run()
+    BittrexAutoTraderOptions = BittrexAutoTraderConfig()
+
+    if BittrexAutoTraderOptions.get('trace'):
+        BittrexAutoTraderTracing.TRACER.enabled = True
+
+        atexit.register(BittrexAutoTraderTracing.TRACER.dump, BittrexAutoTraderOptions['trace'])
+
+    if BittrexAutoTraderOptions.get('metrics'):
+        BittrexAutoTraderMetrics.REGISTRY.serve(BittrexAutoTraderOptions['metrics'])
+
+    if ',' in BittrexAutoTraderOptions['market']:
+        BittrexAutoTraderEngine(BittrexAutoTraderOptions).run()
+    else:
+        BittrexAutoTrader(BittrexAutoTraderOptions).run()
@@ -0,0 +1,872 @@
+"""
+  bittrex_autotrader
+  Bittrex currency exchange autotrading script in a nutshell.
+
+  Copyright 2018-2020, Marc S. Brooks (https://mbrooks.info)
+  Licensed under the MIT license:
+  http://www.opensource.org/licenses/mit-license.php
+"""
+
+# Standard libraries.
+import hashlib
+import hmac
+import json
+import time
+
+# Package modules.
+from .cache   import ResponseCache
+from .flight  import SingleFlight
+from .limiter import RateLimiter
+from .retry   import RetryPolicy
+from .        import errors as BittrexAutoTraderErrors
+from .        import metrics as BittrexAutoTraderMetrics
+from .        import tracing as BittrexAutoTraderTracing
+
+class BittrexAutoTraderApi:
+    """
+    Bittrex API endpoints shared by the request handlers.
+
+    Requests are sent by send_request(), which serves cached responses and
+    coalesces identical public requests.  Rate limiting, signing, retries and
+    backoff are generated by _attempts(), so a subclass only provides _send(),
+    the transport that sends each attempt.
+    """
+
+    # Bittrex API URL
+    BASE_URL = 'https://api.bittrex.com/v3'
+
+    # Total attempts per request.
+    CONNECT_RETRIES = 10
+
+    # Maximum delay between failed requests.
+    CONNECT_WAIT = 5
+
+    # Initial delay between failed requests.
+    RETRY_BACKOFF = 0.1
+
+    # Maximum seconds to spend retrying a request.
+    RETRY_DEADLINE = 60
+
+    # Seconds to wait for a connection.
+    CONNECT_TIMEOUT = 5
+
+    # Seconds to wait between bytes of a response.
+    READ_TIMEOUT = 30
+
+    # Total connection pools (one per host) to cache.
+    POOL_CONNECTIONS = 10
+
+    # Maximum connections to keep alive per host.
+    POOL_MAXSIZE = 10
+
+    def __init__(self, apikey, secret, options=None):
+        """
+        Create a new instance of the Api
+
+        Args:
+            apikey (str):
+                Bittrex issued API key.
+            secret (str):
+                Bittrex issued API secret.
+            options (dict):
+                Dictionary of options (optional).
+
+        Options:
+            cache (bool):
+                Cache public endpoint responses (default: False).
+            cache_size (int):
+                Maximum responses to cache (default: 256).
+            rate_limit (float):
+                Public requests per second, 0 to disable (default: 1).
+            auth_rate_limit (float):
+                Authenticated requests per second, 0 to disable (default: 1).
+            rate_burst (int):
+                Maximum requests at once per budget (default: 10).
+            retries (int):
+                Total attempts per request (default: 10).
+            retry_deadline (float):
+                Maximum seconds to spend retrying a request (default: 60).
+            connect_timeout (float):
+                Seconds to wait for a connection (default: 5).
+            read_timeout (float):
+                Seconds to wait between bytes of a response (default: 30).
+
+        Attributes:
+            apikey (str):
+                Bittrex issued API key.
+            secret (str):
+                Bittrex issued API secret.
+            cache (ResponseCache):
+                Public endpoint response cache (None if disabled).
+            limiter (RateLimiter):
+                Request rate limiter, shared by all callers.
+            retry (RetryPolicy):
+                Failed request retry policy.
+            timeout (tuple):
+                Connect and read timeouts in seconds.
+            flight (SingleFlight):
+                Coalesces concurrent identical public requests.
+        """
+        options = options or {}
+
+        self.apikey = apikey
+        self.secret = secret
+        self.cache  = None
+
+        if str(options.get('cache')) == 'True':
+            self.cache = ResponseCache(maxsize=options.get('cache_size') or 256)
+
+        self.limiter = RateLimiter(
+            options.get('rate_limit', 1),
+            options.get('auth_rate_limit', 1),
+            options.get('rate_burst') or 10
+        )
+
+        self.retry = RetryPolicy(
+            options.get('retries') or BittrexAutoTraderApi.CONNECT_RETRIES,
+            BittrexAutoTraderApi.RETRY_BACKOFF,
+            BittrexAutoTraderApi.CONNECT_WAIT,
+            options.get('retry_deadline', BittrexAutoTraderApi.RETRY_DEADLINE)
+        )
+
+        self.timeout = (
+            float(options.get('connect_timeout') or BittrexAutoTraderApi.CONNECT_TIMEOUT),
+            float(options.get('read_timeout') or BittrexAutoTraderApi.READ_TIMEOUT)
+        )
+
+        self.flight = SingleFlight()
+
+    def public_markets(self):
+        """
+        Get the open and available trading markets along with other meta data.
+
+        Returns:
+            list
+
+        .. seealso:: https://bittrex.github.io/api/v3#/definitions/Market
+        """
+        return self.get('markets')
+
+    def public_currencies(self):
+        """
+        Get all supported currencies along with other meta data.
+
+        Returns:
+            list
+
+        .. seealso:: https://bittrex.github.io/api/v3#/definitions/Currency
+        """
+        return self.get('currencies')
+
+    def public_ticker(self, market_symbol):
+        """
+        Get the current tick values for a market.
+
+        Args:
+            market_symbol (str):
+                String literal (ie. BTC-LTC).
+
+        Returns:
+            list
+
+        .. seealso:: https://bittrex.github.io/api/v3#/definitions/Ticker
+        """
+        return self.get(f'markets/{market_symbol}/ticker')
+
+    def public_tickers(self):
+        """
+        Get the current tick values for all markets.
+
+        Returns:
+            list
+
+        .. seealso:: https://bittrex.github.io/api/v3#/definitions/Ticker
+        """
+        return self.get('markets/tickers')
+
+    def public_market_summaries(self):
+        """
+        Get the last 24 hour summary of all active exchanges.
+
+        Returns:
+            list
+
+        .. seealso:: https://bittrex.github.io/api/v3#/definitions/MarketSummary
+        """
+        return self.get('markets/summaries')
+
+    def public_market_summary(self, market_symbol):
+        """
+        Get the last 24 hour summary of all active exchanges.
+
+        Args:
+            market_symbol (str):
+                String literal (ie. BTC-LTC). If omitted, return all markets.
+
+        Returns:
+            list
+
+        .. seealso:: https://bittrex.github.io/api/v3#/definitions/MarketSummary
+        """
+        return self.get(f'markets/{market_symbol}/summary')
+
+    def public_market_history(self, market_symbol):
+        """
+        Get the latest trades that have occured for a specific market.
+
+        Args:
+            market_symbol (str):
+                String literal (ie. BTC-LTC). If omitted, return all markets.
+
+        Returns:
+            list
+
+        .. seealso:: https://bittrex.github.io/api/v3#/definitions/Trade
+        """
+        return self.get(f'markets/{market_symbol}/trades')
+
+    def public_order_book(self, market_symbol, depth=25):
+        """
+        Get the orderbook for a given market.
+
+        Args:
+            market_symbol (str):
+                String literal (ie. BTC-LTC). If omitted, return all markets.
+            depth (int):
+                Maximum depth to return (allowed values are [1, 25, 500])
+
+        Returns:
+            list
+
+        .. seealso:: https://bittrex.github.io/api/v3#/definitions/OrderBook
+        """
+        return self.get(f'markets/{market_symbol}/orderbook', {
+            'depth': depth
+        })
+
+    def market_buy_limit(self, market_symbol, quantity, rate, time_in_force='GOOD_TIL_CANCELLED'):
+        """
+        Send a buy order in a specific market.
+
+        Args:
+            market_symbol (str):
+                String literal (ie. BTC-LTC). If omitted, return all markets.
+            quantity (float):
+                The amount to purchase.
+            rate (float):
+                Rate at which to place the order.
+
+        Returns:
+            list
+
+        .. seealso:: https://bittrex.github.io/api/v3#/definitions/Order
+        """
+        return self.post('orders', {
+            'marketSymbol': market_symbol,
+            'direction': 'BUY',
+            'type': 'LIMIT',
+            'quantity': quantity,
+            'limit': rate,
+            'timeInForce': time_in_force
+        }, auth=True)
+
+    def market_sell_limit(self, market_symbol, quantity, rate, time_in_force='GOOD_TIL_CANCELLED'):
+        """
+        Send a sell order in a specific market.
+
+        Args:
+            market_symbol (str):
+                String literal (ie. BTC-LTC). If omitted, return all markets.
+            quantity (float):
+                The amount to sell.
+            rate: (float)
+                Rate at which to place the order.
+
+        Returns:
+            list
+
+        .. seealso:: https://bittrex.github.io/api/v3#/definitions/Order
+        """
+        return self.post('orders', {
+            'marketSymbol': market_symbol,
+            'direction': 'SELL',
+            'type': 'LIMIT',
+            'quantity': quantity,
+            'limit': rate,
+            'timeInForce': time_in_force
+        }, auth=True)
+
+    def market_cancel(self, orderid):
+        """
+        Send a cancel a buy or sell order.
+
+        Args:
+            orderid (str):
+                ID of buy or sell order.
+
+        .. seealso:: https://bittrex.github.io/api/v3#/definitions/Order
+        """
+        return self.delete(f'orders/{orderid}', auth=True)
+
+    def market_open_orders(self, market_symbol=None):
+        """
+        Get all orders that you currently have opened.
+
+        Args:
+            market_symbol (str):
+                String literal (ie. BTC-LTC). If omitted, return all markets.
+
+        Returns:
+            list
+
+        .. seealso:: https://bittrex.github.io/api/v3#/definitions/Order
+        """
+        return self.get('orders/open', {
+            'marketSymbol': market_symbol
+        } if market_symbol else None, auth=True)
+
+    def account_balances(self):
+        """
+        Get all balances from your account.
+
+        Returns:
+            list
+
+        .. seealso:: https://bittrex.github.io/api/v3#/definitions/Balance
+        """
+        return self.get('balances', auth=True)
+
+    def account_balance(self, currency_symbol):
+        """
+        Get the balance from your account for a specific currency.
+
+        Args:
+            currency_symbol (str):
+                String literal (ie. BTC). If omitted, return all currency.
+
+        Returns:
+            list
+
+        .. seealso:: https://bittrex.github.io/api/v3#/definitions/Balance
+        """
+        return self.get(f'balances/{currency_symbol}', auth=True)
+
+    def account_deposit_address(self, currency_symbol):
+        """
+        Get existing, or generate new address for a specific currency.
+
+        Args:
+            currency_symbol (str):
+                String literal (ie. BTC). If omitted, return all currency.
+
+        Returns:
+            list
+
+        .. seealso:: https://bittrex.github.io/api/v3#/definitions/Address
+        """
+        return self.get(f'addresses/{currency_symbol}', auth=True)
+
+    def account_withdraw(self, currency_symbol, quantity, crypto_address, paymentid):
+        """
+        Send request to withdraw funds from your account.
+
+        Args:
+            currency_symbol (str):
+                String literal (ie. BTC). If omitted, return all currency.
+            quantity (str):
+                The amount to withdrawl.
+            crypto_address (str):
+                The address where to send the funds.
+            paymentid (str):
+                CryptoNotes/BitShareX/Nxt field (memo/paymentid optional).
+
+        Returns:
+            list
+
+        .. seealso:: https://bittrex.github.io/api/v3#/definitions/Withdrawal
+        """
+        return self.post('withdrawals', {
+            'currencySymbol': currency_symbol,
+            'quantity': quantity,
+            'cryptoAddress': crypto_address,
+            'cryptoAddressTag': paymentid
+        }, auth=True)
+
+    def account_order(self, orderid):
+        """
+        Get a single order by ID.
+
+        Args:
+            orderid (str):
+                ID of buy or sell order.
+
+        Return:
+            list
+
+        .. seealso:: https://bittrex.github.io/api/v3#/definitions/Order
+        """
+        return self.get(f'orders/{orderid}', auth=True)
+
+    def account_order_history(self, market_symbol):
+        """
+        Get order history.
+
+        Args:
+            market_symbol (str):
+                String literal (ie. BTC-LTC). If omitted, return all markets.
+
+        Returns:
+            list
+
+        .. seealso:: https://bittrex.github.io/api/v3#/definitions/Order
+        """
+        return self.get('orders/closed', {
+            'marketSymbol': market_symbol
+        }, auth=True)
+
+    def account_deposit_history(self, currency_symbol):
+        """
+        Get deposit history.
+
+        Args:
+            currency_symbol (str):
+                String literal (ie. BTC). If omitted, return all currency.
+
+        Returns:
+            list
+
+        .. seealso:: https://bittrex.github.io/api/v3#/definitions/Withdrawal
+        """
+        return self.get('deposits/closed', {
+            'currencySymbol': currency_symbol
+        }, auth=True)
+
+    def account_withdrawl_history(self, currency_symbol):
+        """
+        Get withdrawl history.
+
+        Args:
+            currency_symbol (str):
+                String literal (ie. BTC). If omitted, return all currency.
+
+        Returns:
+            list
+
+        .. seealso:: https://bittrex.github.io/api/v3#/definitions/Withdrawal
+        """
+        return self.get('withdrawals/closed', {
+            'currencySymbol': currency_symbol
+        }, auth=True)
+
+    def get(self, uri, params=None, headers=None, auth=False, *, deadline=None):
+        """
+        Construct and send a HTTP GET request to the Bittrex API.
+
+        Args:
+            uri (str):
+                URI that references an API service.
+            params (dict):
+                Dictionary that contains HTTP request name/value parameters (optional).
+            headers (dict):
+                Dictionary that contains HTTP request header key/values (optional).
+            auth (bool):
+                Authenticate with a signed request (default: False).
+            deadline (float):
+                Maximum seconds to spend on the request, including retries (optional).
+
+        Returns:
+            list
+        """
+        return self.send_request('GET', uri, params, headers, auth, deadline=deadline)
+
+    def post(self, uri, body=None, headers=None, auth=False, *, deadline=None):
+        """
+        Construct and send a HTTP POST request to the Bittrex API.
+
+        Args:
+            uri (str):
+                URI that references an API service.
+            body (dict):
+                Dictionary that contains HTTP request body key/values (optional).
+            headers (dict):
+                Dictionary that contains HTTP request header key/values (optional).
+            auth (bool):
+                Authenticate with a signed request (default: False).
+            deadline (float):
+                Maximum seconds to spend on the request, including retries (optional).
+
+        Returns:
+            list
+        """
+        return self.send_request('POST', uri, body, headers, auth, deadline=deadline)
+
+    def delete(self, uri, body=None, headers=None, auth=False, *, deadline=None):
+        """
+        Construct and send a HTTP DELETE request to the Bittrex API.
+
+        Args:
+            uri (str):
+                URI that references an API service.
+            body (dict):
+                Dictionary that contains HTTP request body key/values (optional).
+            headers (dict):
+                Dictionary that contains HTTP request header key/values (optional).
+            auth (bool):
+                Authenticate with a signed request (default: False).
+            deadline (float):
+                Maximum seconds to spend on the request, including retries (optional).
+
+        Returns:
+            list
+        """
+        return self.send_request('DELETE', uri, body, headers, auth, deadline=deadline)
+
+    def send_request(self, method, uri, values=None, headers=None, auth=False, *, deadline=None):
+        """
+        Construct and send a HTTP request to the Bittrex API.
+
+        Args:
+            method (str):
+                HTTP request method (e.g. GET, POST, DELETE).
+            uri (str):
+                URI that references an API service.
+            values (dict):
+                Dictionary that contains request values (optional).
+            headers (dict):
+                Dictionary that contains HTTP header key/values (optional).
+            auth (bool):
+                Authenticate with a signed request (default: False).
+            deadline (float):
+                Maximum seconds to spend on the request, including retries
+                (default: retry deadline).
+
+        Returns:
+            list
+        """
+        url = BittrexAutoTraderApi._create_url(method, uri, values)
+
+        # Return cached public responses.
+        endpoint, res = self._cache_lookup(method, uri, url, auth)
+
+        if res is not None:
+            return res
+
+        retry = self.retry.start(method, uri, deadline)
+
+        # Share one in-flight request between identical public requests.
+        if method == 'GET' and auth is not True:
+            res = self.flight.call(url, lambda: self._send(retry, url, values, headers))
+        else:
+            res = self._send(retry, url, values, headers, auth)
+
+        if endpoint:
+            self.cache.set(url, endpoint, res)
+
+        return res
+
+    def _send(self, retry, url, values=None, headers=None, auth=False):
+        """
+        Send a HTTP request, retrying failed attempts (transport of the subclass).
+
+        Args:
+            retry (RetryState):
+                Retry state of the request.
+            url (str):
+                Request URL.
+            values (dict):
+                Dictionary that contains request values (optional).
+            headers (dict):
+                Dictionary that contains HTTP header key/values (optional).
+            auth (bool):
+                Authenticate with a signed request (default: False).
+
+        Returns:
+            list
+        """
+        raise NotImplementedError
+
+    def _attempts(self, retry, url, values=None, headers=None, auth=False):
+        """
+        Generate the attempts of a request: rate limit, sign and back off.
+
+        Yields seconds to wait (float) or the headers and timeouts of an attempt
+        to send (tuple).  The transport records the outcome of each attempt
+        (RetryState.record) before the next step; the generator stops once
+        the request is complete or must not be retried.
+
+        Args:
+            retry (RetryState):
+                Retry state of the request.
+            url (str):
+                Request URL.
+            values (dict):
+                Dictionary that contains request values (optional).
+            headers (dict):
+                Dictionary that contains HTTP header key/values (optional).
+            auth (bool):
+                Authenticate with a signed request (default: False).
+
+        Yields:
+            float|tuple
+        """
+        while True:
+
+            # Wait for the shared rate limiter, sign once ready to send.
+            seconds = self.limiter.reserve(auth, retry.remaining())
+
+            # Give up, rather than wait for the limiter past the deadline.
+            if seconds is None:
+                retry.record(error=BittrexAutoTraderErrors.DeadlineExceeded.__name__)
+                return
+
+            if seconds:
+                yield seconds
+
+            # Sign authentication requests.
+            if auth is True:
+                headers = self._sign_headers(retry.method, url, values, headers)
+
+            retry.begin()
+
+            yield headers, self._attempt_timeout(retry)
+
+            if retry.backoff is None:
+                return
+
+            yield retry.backoff
+
+    def _cache_lookup(self, method, uri, url, auth=False):
+        """
+        Returns the endpoint of a cacheable request and its cached response.
+
+        Only unauthenticated GET requests to endpoints with a TTL are cached.
+
+        Args:
+            method (str):
+                HTTP request method (e.g. GET, POST, DELETE).
+            uri (str):
+                URI that references an API service.
+            url (str):
+                Request URL.
+            auth (bool):
+                Authenticate with a signed request (default: False).
+
+        Returns:
+            tuple (endpoint, response), None if not cacheable or not cached
+        """
+        if self.cache is None or method != 'GET' or auth is True:
+            return None, None
+
+        endpoint = BittrexAutoTraderApi._endpoint(uri)
+
+        if not self.cache.cacheable(endpoint):
+            return None, None
+
+        return endpoint, self.cache.get(url)
+
+    def _attempt_timeout(self, retry):
+        """
+        Returns connect and read timeouts of an attempt, bounded by the deadline.
+
+        Args:
+            retry (RetryState):
+                Retry state of the request.
+
+        Returns:
+            tuple
+        """
+        remaining = retry.remaining()
+
+        if remaining is None:
+            return self.timeout
+
+        return tuple(min(seconds, remaining) for seconds in self.timeout)
+
+    @BittrexAutoTraderTracing.TRACER.traced('sign')
+    def _sign_headers(self, method, url, values=None, headers=None):
+        """
+        Returns HTTP headers that authenticate a signed request.
+
+        Args:
+            method (str):
+                HTTP request method (e.g. GET, POST, DELETE).
+            url (str):
+                Request URL (including query string).
+            values (dict):
+                Dictionary that contains request values (optional).
+            headers (dict):
+                Dictionary that contains HTTP header key/values (optional).
+
+        Returns:
+            dict
+        """
+        timestamp = str(round(time.time() * 1000))
+
+        content_hash = BittrexAutoTraderApi._hash_content(
+            BittrexAutoTraderApi._create_body(method, values)
+        )
+
+        signature = BittrexAutoTraderApi._sign_request(
+            self.secret, method, url, timestamp, content_hash
+        )
+
+        if headers is None:
+            headers = {}
+
+        headers['Api-Key']          = self.apikey
+        headers['Api-Timestamp']    = timestamp
+        headers['Api-Signature']    = signature
+        headers['Api-Content-Hash'] = content_hash
+
+        return headers
+
+    @staticmethod
+    def _endpoint(uri):
+        """
+        Returns the URI with market/currency symbols and IDs replaced by {}.
+
+        Args:
+            uri (str):
+                URI that references an API service (ie. markets/BTC-LTC/ticker).
+
+        Returns:
+            str (ie. markets/{}/ticker)
+        """
+        return '/'.join(
+            name if name.isalpha() and name.islower() else '{}'
+            for name in uri.split('/')
+        )
+
+    @staticmethod
+    def _create_url(method, uri, values=None):
+        """
+        Returns the request URL (including query string for GET requests).
+
+        Args:
+            method (str):
+                HTTP request method (e.g. GET, POST, DELETE).
+            uri (str):
+                URI that references an API service.
+            values (dict):
+                Dictionary that contains request values (optional).
+
+        Returns:
+            str
+        """
+        url = BittrexAutoTraderApi.BASE_URL + '/' + uri
+
+        if method == 'GET' and values:
+            url += BittrexAutoTraderApi._create_query_str(values)
+
+        return url
+
+    @staticmethod
+    def _create_body(method, values=None):
+        """
+        Returns the request body as a JSON string (empty for GET requests).
+
+        Args:
+            method (str):
+                HTTP request method (e.g. GET, POST, DELETE).
+            values (dict):
+                Dictionary that contains request values (optional).
+
+        Returns:
+            str
+        """
+        return '' if method == 'GET' else json.dumps(values)
+
+    @staticmethod
+    def _parse_response(is_ok, res, retry):
+        """
+        Returns the decoded response body, raise an exception on failure.
+
+        Args:
+            is_ok (bool):
+                Response HTTP status is successful.
+            res (list|dict):
+                Decoded JSON response body (None if no response).
+            retry (RetryState):
+                Retry state of the request.
+
+        Returns:
+            list
+
+        Raises:
+            BittrexAutoTraderError
+        """
+        endpoint = BittrexAutoTraderApi._endpoint(retry.uri)
+
+        BittrexAutoTraderMetrics.REQUEST_SECONDS.observe(
+            retry.elapsed(), retry.method, endpoint, str(retry.status() or 'error')
+        )
+
+        if len(retry.attempts) > 1:
+            BittrexAutoTraderMetrics.REQUEST_RETRIES.inc(
+                retry.method, endpoint, amount=len(retry.attempts) - 1
+            )
+
+        if res is None or is_ok is False:
+            raise BittrexAutoTraderErrors.from_response(
+                retry.uri, retry.status(), res, retry.elapsed(), len(retry.attempts),
+                error=retry.error()
+            )
+
+        # Return list of dicts.
+        return res
+
+    @staticmethod
+    def _create_query_str(data):
+        """
+        Returns a query string of name/value pairs.
+
+        Args:
+            data (dict):
+                Dictionary that contains request data.
+
+        Returns:
+            str
+        """
+        params = []
+        for name, value in data.items():
+            params.append(name + '=' + str(value))
+
+        return '?' + '&'.join(params)
+
+    @staticmethod
+    def _hash_content(data):
+        """
+        Returns hex-encoded SHA-512 hash for the given data.
+
+        Args:
+            data (dict):
+                Dictionary that contains request data.
+
+        Returns:
+            str
+        """
+        return hashlib.sha512(str(data).encode('utf-8')).hexdigest()
+
+    @staticmethod
+    def _sign_request(secret, method, url, timestamp, content_hash=None):
+        """
+        Returns signed request using the HMAC SHA-512 algorithm.
+
+        Args:
+            secret (str):
+                Bittrex issued API secret.
+            method (str):
+                HTTP request method (e.g. GET, POST, DELETE).
+            url (str):
+                Request URL (including query string).
+            timestamp (str):
+                Epoch timestamp in milliseconds.
+            content_hash (str):
+                Hex-encoded SHA-512 hash of the request body (optional).
+
+        Returns:
+            str
+        """
+        message = f'{timestamp}{url}{method}{content_hash}'
+
+        return hmac.new(secret.encode('utf-8'), message.encode('utf-8'), hashlib.sha512).hexdigest()
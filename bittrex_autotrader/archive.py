@@ -0,0 +1,306 @@
+"""
+  bittrex_autotrader
+  Bittrex currency exchange autotrading script in a nutshell.
+
+  Copyright 2018-2020, Marc S. Brooks (https://mbrooks.info)
+  Licensed under the MIT license:
+  http://www.opensource.org/licenses/mit-license.php
+"""
+
+# Standard libraries.
+import json
+import os
+import threading
+
+# External modules.
+import numpy
+
+# Package modules.
+from . import trades as BittrexAutoTraderTrades
+
+class TradeArchive:
+    """
+    Append-only columnar archive of market trades.
+
+    Each market is stored in a directory of fixed-width binary column files
+    (timestamp, rate, quantity, side) that can be memory-mapped, plus a
+    sparse timestamp index for range slicing.  Column files are written
+    first and the committed length last (atomic rename), so bytes past the
+    committed length after a crash are discarded on the next append.
+
+    Dependencies:
+        numpy
+    """
+
+    # Column names and types, stored as <name>.bin files.
+    COLUMNS = (
+        ('timestamp', 'M8[ms]'),
+        ('rate', 'f8'),
+        ('quantity', 'f8'),
+        ('side', 'i1')
+    )
+
+    # Rows between sparse timestamp index entries.
+    INDEX_STRIDE = 4096
+
+    def __init__(self, path):
+        """
+        Create a new instance of TradeArchive
+
+        Args:
+            path (str):
+                Archive directory.
+
+        Attributes:
+            path (str):
+                Archive directory.
+        """
+        self.path = path
+
+        self._lock = threading.Lock()
+
+    def append(self, market, data):
+        """
+        Append trades newer than those archived for a market.
+
+        Args:
+            market (str):
+                String literal for the market (ie. BTC-LTC).
+            data (list):
+                Trades as returned by the API (markets/{symbol}/trades).
+
+        Returns:
+            int (total trades appended)
+        """
+        with self._lock:
+            path = self._market_path(market)
+            meta = TradeArchive._read_meta(path)
+
+            # API trades are newest first, keep same time trades in order.
+            trades = BittrexAutoTraderTrades.to_array(data)[::-1]
+            trades = trades[numpy.argsort(trades['timestamp'], kind='stable')]
+
+            # Skip trades already archived (same timestamp and id) or older.
+            if meta['length']:
+                latest = numpy.datetime64(meta['latest'], 'ms')
+
+                trades = trades[
+                    (trades['timestamp'] > latest) |
+                    ((trades['timestamp'] == latest) & ~numpy.isin(trades['id'], meta['ids']))
+                ]
+
+            if not trades.size:
+                return 0
+
+            for name, dtype in TradeArchive.COLUMNS:
+                TradeArchive._write_column(
+                    os.path.join(path, name + '.bin'),
+                    trades[name].astype(dtype),
+                    meta['length']
+                )
+
+            # Sparse index of every INDEX_STRIDE-th row timestamp.
+            rows = numpy.arange(meta['length'], meta['length'] + trades.size)
+
+            TradeArchive._write_column(
+                os.path.join(path, 'index.bin'),
+                trades['timestamp'][rows % TradeArchive.INDEX_STRIDE == 0],
+                -(-meta['length'] // TradeArchive.INDEX_STRIDE)
+            )
+
+            latest = trades['timestamp'][-1]
+            ids    = [str(item) for item in trades['id'][trades['timestamp'] == latest]]
+
+            # Keep the ids of earlier batches with the same latest timestamp.
+            if meta['length'] and int(latest.astype('i8')) == meta['latest']:
+                ids = meta['ids'] + ids
+
+            TradeArchive._write_meta(path, {
+                'length': meta['length'] + int(trades.size),
+                'latest': int(latest.astype('i8')),
+                'ids': ids
+            })
+
+        return int(trades.size)
+
+    def length(self, market):
+        """
+        Returns total trades archived for a market.
+
+        Args:
+            market (str):
+                String literal for the market (ie. BTC-LTC).
+
+        Returns:
+            int
+        """
+        return TradeArchive._read_meta(self._market_path(market))['length']
+
+    def read(self, market, start=None, end=None):
+        """
+        Returns memory-mapped trade columns for a market, sliced by time.
+
+        Args:
+            market (str):
+                String literal for the market (ie. BTC-LTC).
+            start (datetime64):
+                Earliest trade time, inclusive (optional).
+            end (datetime64):
+                Latest trade time, exclusive (optional).
+
+        Returns:
+            dict (timestamp, rate, quantity, side ndarrays)
+        """
+        path   = self._market_path(market)
+        length = TradeArchive._read_meta(path)['length']
+
+        columns = dict(
+            (name, TradeArchive._map_column(os.path.join(path, name + '.bin'), dtype, length))
+            for name, dtype in TradeArchive.COLUMNS
+        )
+
+        index = TradeArchive._map_column(
+            os.path.join(path, 'index.bin'), 'M8[ms]',
+            -(-length // TradeArchive.INDEX_STRIDE)
+        )
+
+        lower, upper = 0, length
+
+        if start is not None:
+            lower = TradeArchive._search(columns['timestamp'], index, start, 'left')
+
+        if end is not None:
+            upper = TradeArchive._search(columns['timestamp'], index, end, 'left')
+
+        return dict((name, column[lower:upper]) for name, column in columns.items())
+
+    def _market_path(self, market):
+        """
+        Returns the market directory, create it if necessary.
+
+        Args:
+            market (str):
+                String literal for the market (ie. BTC-LTC).
+
+        Returns:
+            str
+        """
+        path = os.path.join(self.path, market)
+
+        os.makedirs(path, exist_ok=True)
+
+        return path
+
+    @staticmethod
+    def _search(timestamps, index, value, side):
+        """
+        Returns the row where a timestamp would be inserted, using the sparse index.
+
+        Args:
+            timestamps (ndarray):
+                Trade timestamps (oldest first).
+            index (ndarray):
+                Timestamp of every INDEX_STRIDE-th row.
+            value (datetime64):
+                Timestamp to search for.
+            side (str):
+                left or right (see numpy.searchsorted).
+
+        Returns:
+            int
+        """
+        value = numpy.datetime64(value, 'ms')
+        block = int(numpy.searchsorted(index, value, side))
+
+        if not block:
+            return 0
+
+        lower = (block - 1) * TradeArchive.INDEX_STRIDE
+        upper = min(block * TradeArchive.INDEX_STRIDE, timestamps.size)
+
+        return lower + int(numpy.searchsorted(timestamps[lower:upper], value, side))
+
+    @staticmethod
+    def _map_column(path, dtype, length):
+        """
+        Returns a read-only memory-mapped column.
+
+        Args:
+            path (str):
+                Column file.
+            dtype (str):
+                Column type.
+            length (int):
+                Committed rows.
+
+        Returns:
+            ndarray
+        """
+        if not length:
+            return numpy.empty(0, dtype=dtype)
+
+        return numpy.memmap(path, dtype=dtype, mode='r', shape=(length,))
+
+    @staticmethod
+    def _write_column(path, values, length):
+        """
+        Append values to a column file after its committed rows.
+
+        Args:
+            path (str):
+                Column file.
+            values (ndarray):
+                Values to append.
+            length (int):
+                Committed rows.
+        """
+        with open(path, 'ab+') as file:
+
+            # Discard uncommitted bytes of an interrupted append.
+            file.truncate(length * values.dtype.itemsize)
+
+            file.write(values.tobytes())
+            file.flush()
+
+            os.fsync(file.fileno())
+
+    @staticmethod
+    def _read_meta(path):
+        """
+        Returns the committed archive state of a market.
+
+        Args:
+            path (str):
+                Market directory.
+
+        Returns:
+            dict
+        """
+        try:
+            with open(os.path.join(path, 'meta.json'), 'r', encoding='utf-8') as file:
+                return json.load(file)
+
+        except FileNotFoundError:
+            return {'length': 0, 'latest': 0, 'ids': []}
+
+    @staticmethod
+    def _write_meta(path, meta):
+        """
+        Commit the archive state of a market (atomic rename).
+
+        Args:
+            path (str):
+                Market directory.
+            meta (dict):
+                Committed length, latest timestamp and its trade ids.
+        """
+        tmp_path = os.path.join(path, 'meta.json.tmp')
+
+        with open(tmp_path, 'w', encoding='utf-8') as file:
+            json.dump(meta, file)
+
+            file.flush()
+
+            os.fsync(file.fileno())
+
+        os.replace(tmp_path, os.path.join(path, 'meta.json'))
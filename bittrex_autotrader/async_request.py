@@ -0,0 +1,356 @@
+"""
+  bittrex_autotrader
+  Bittrex currency exchange autotrading script in a nutshell.
+
+  Copyright 2018-2020, Marc S. Brooks (https://mbrooks.info)
+  Licensed under the MIT license:
+  http://www.opensource.org/licenses/mit-license.php
+"""
+
+# Standard libraries.
+import asyncio
+import threading
+
+# External modules.
+import aiohttp
+
+# Package modules.
+from .api import BittrexAutoTraderApi
+
+class AsyncBittrexAutoTraderRequest(BittrexAutoTraderApi):
+    """
+    Bittrex API request handler (asyncio).
+
+    Provides the same public methods as BittrexAutoTraderRequest as
+    coroutines, sharing one connection pool between concurrent callers:
+
+        async with AsyncBittrexAutoTraderRequest(apikey, secret) as api_req:
+            trades, ticker = await asyncio.gather(
+                api_req.public_market_history(market),
+                api_req.public_ticker(market)
+            )
+
+    Dependencies:
+        aiohttp
+    """
+
+    # Errors raised before a request is sent (ConnectionTimeoutError since aiohttp 3.10).
+    CONNECT_ERRORS = (aiohttp.ClientConnectorError,) + (
+        (aiohttp.ConnectionTimeoutError,) if hasattr(aiohttp, 'ConnectionTimeoutError') else ()
+    )
+
+    def __init__(self, apikey, secret, options=None):
+        """
+        Create a new instance of the Api
+
+        Args:
+            apikey (str):
+                Bittrex issued API key.
+            secret (str):
+                Bittrex issued API secret.
+            options (dict):
+                Dictionary of options (optional).
+
+        Options:
+            pool_connections (int):
+                Total connection pools (one per host) to cache (default: 10).
+            pool_maxsize (int):
+                Maximum connections to keep alive per host (default: 10).
+            cache (bool):
+                Cache public endpoint responses (default: False).
+            cache_size (int):
+                Maximum responses to cache (default: 256).
+            rate_limit (float):
+                Public requests per second, 0 to disable (default: 1).
+            auth_rate_limit (float):
+                Authenticated requests per second, 0 to disable (default: 1).
+            rate_burst (int):
+                Maximum requests at once per budget (default: 10).
+            retries (int):
+                Total attempts per request (default: 10).
+            retry_deadline (float):
+                Maximum seconds to spend retrying a request (default: 60).
+            connect_timeout (float):
+                Seconds to wait for a connection (default: 5).
+            read_timeout (float):
+                Seconds to wait between bytes of a response (default: 30).
+
+        Attributes:
+            apikey (str):
+                Bittrex issued API key.
+            secret (str):
+                Bittrex issued API secret.
+            cache (ResponseCache):
+                Public endpoint response cache (None if disabled).
+            limiter (RateLimiter):
+                Request rate limiter, shared by all callers.
+            retry (RetryPolicy):
+                Failed request retry policy.
+            timeout (tuple):
+                Connect and read timeouts in seconds.
+            flight (SingleFlight):
+                Coalesces concurrent identical public requests.
+            session (aiohttp.ClientSession):
+                Pooled keep-alive HTTP session (created on first request).
+        """
+        super().__init__(apikey, secret, options)
+
+        options = options or {}
+
+        self.session = None
+
+        self._pool_connections = int(
+            options.get('pool_connections') or AsyncBittrexAutoTraderRequest.POOL_CONNECTIONS
+        )
+        self._pool_maxsize = int(
+            options.get('pool_maxsize') or AsyncBittrexAutoTraderRequest.POOL_MAXSIZE
+        )
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *args):
+        await self.close()
+
+    async def close(self):
+        """
+        Close the session and release pooled connections.
+        """
+        if self.session is not None:
+            await self.session.close()
+
+            self.session = None
+
+    async def send_request( # pylint: disable=invalid-overridden-method
+            self, method, uri, values=None, headers=None, auth=False, *, deadline=None
+    ):
+        """
+        Construct and send a HTTP request to the Bittrex API.
+
+        Args:
+            method (str):
+                HTTP request method (e.g. GET, POST, DELETE).
+            uri (str):
+                URI that references an API service.
+            values (dict):
+                Dictionary that contains request values (optional).
+            headers (dict):
+                Dictionary that contains HTTP header key/values (optional).
+            auth (bool):
+                Authenticate with a signed request (default: False).
+            deadline (float):
+                Maximum seconds to spend on the request, including retries
+                (default: retry deadline).
+
+        Returns:
+            list
+        """
+        url = AsyncBittrexAutoTraderRequest._create_url(method, uri, values)
+
+        # Return cached public responses.
+        endpoint, res = self._cache_lookup(method, uri, url, auth)
+
+        if res is not None:
+            return res
+
+        retry = self.retry.start(method, uri, deadline)
+
+        # Share one in-flight request between identical public requests.
+        if method != 'GET' or auth is True:
+            res = await self._send(retry, url, values, headers, auth)
+        else:
+            res = await self.flight.call_async(url, lambda: self._send(retry, url, values, headers))
+
+        if endpoint:
+            self.cache.set(url, endpoint, res)
+
+        return res
+
+    async def _send( # pylint: disable=invalid-overridden-method
+            self, retry, url, values=None, headers=None, auth=False
+    ):
+        """
+        Send a HTTP request, retrying failed attempts.
+
+        Args:
+            retry (RetryState):
+                Retry state of the request.
+            url (str):
+                Request URL.
+            values (dict):
+                Dictionary that contains request values (optional).
+            headers (dict):
+                Dictionary that contains HTTP header key/values (optional).
+            auth (bool):
+                Authenticate with a signed request (default: False).
+
+        Returns:
+            list
+        """
+        data = AsyncBittrexAutoTraderRequest._create_body(retry.method, values)
+
+        is_ok, res = False, None
+
+        for step in self._attempts(retry, url, values, headers, auth):
+
+            # Wait for the rate limiter or between attempts without blocking the loop.
+            if not isinstance(step, tuple):
+                await asyncio.sleep(step)
+                continue
+
+            headers, (connect_timeout, read_timeout) = step
+
+            if data:
+                headers = dict(headers or {}, **{'Content-Type': 'application/json'})
+
+            try:
+                async with self._get_session().request(
+                    retry.method, url, data=data or None, headers=headers,
+                    timeout=aiohttp.ClientTimeout(
+                        sock_connect=connect_timeout, sock_read=read_timeout
+                    )
+                ) as req:
+                    is_ok, res = await AsyncBittrexAutoTraderRequest._decode_response(req)
+
+                    retry.record(req.status, retry_after=req.headers.get('Retry-After'))
+
+            # Any client failure (ie. ClientPayloadError) is a transport error.
+            except (asyncio.TimeoutError, aiohttp.ClientError) as err:
+                is_ok, res = False, None
+
+                retry.record(
+                    error=type(err).__name__,
+                    sent=AsyncBittrexAutoTraderRequest._request_sent(err)
+                )
+
+        return AsyncBittrexAutoTraderRequest._parse_response(is_ok, res, retry)
+
+    @staticmethod
+    def _request_sent(err):
+        """
+        Returns True if a failed request may have been sent.
+
+        Only a connect timeout or a failure to open a connection ensure that
+        nothing was sent; a dropped connection (ie. ServerDisconnectedError)
+        or read timeout may follow a complete request.
+
+        Args:
+            err (Exception):
+                Transport error.
+
+        Returns:
+            bool
+        """
+        return not isinstance(err, AsyncBittrexAutoTraderRequest.CONNECT_ERRORS)
+
+    @staticmethod
+    async def _decode_response(req):
+        """
+        Returns the response status and decoded JSON response body.
+
+        Args:
+            req (aiohttp.ClientResponse):
+                Response of the current attempt.
+
+        Returns:
+            tuple (is_ok, list|dict)
+        """
+        try:
+            return req.status < 400, await req.json(content_type=None)
+
+        except ValueError:
+            return False, {'code': str(req.status)}
+
+    def _get_session(self):
+        """
+        Returns the pooled session, create it within the running event loop.
+
+        Returns:
+            aiohttp.ClientSession
+        """
+        if self.session is None:
+            connector = aiohttp.TCPConnector(
+                limit=self._pool_connections * self._pool_maxsize,
+                limit_per_host=self._pool_maxsize
+            )
+
+            self.session = aiohttp.ClientSession(connector=connector)
+
+        return self.session
+
+class AsyncBittrexAutoTraderRunner:
+    """
+    Runs requests of an AsyncBittrexAutoTraderRequest at the same time from
+    synchronous callers (ie. trader threads), on an event loop in a daemon
+    thread:
+
+        runner = AsyncBittrexAutoTraderRunner(AsyncBittrexAutoTraderRequest(apikey, secret))
+
+        trades, ticker = runner.gather(
+            runner.api_req.public_market_history(market),
+            runner.api_req.public_ticker(market)
+        )
+
+    Dependencies:
+        aiohttp
+    """
+
+    def __init__(self, api_req):
+        """
+        Create a new instance of AsyncBittrexAutoTraderRunner
+
+        Args:
+            api_req (AsyncBittrexAutoTraderRequest):
+                Instance of AsyncBittrexAutoTraderRequest.
+
+        Attributes:
+            api_req (AsyncBittrexAutoTraderRequest):
+                Instance of AsyncBittrexAutoTraderRequest.
+        """
+        self.api_req = api_req
+
+        self._loop   = asyncio.new_event_loop()
+        self._thread = threading.Thread(target=self._loop.run_forever, daemon=True)
+        self._thread.start()
+
+    def gather(self, *coros):
+        """
+        Run request coroutines at the same time, block until all have completed.
+
+        Args:
+            coros (coroutine):
+                Requests of api_req.
+
+        Returns:
+            list (results, in argument order)
+
+        Raises:
+            BittrexAutoTraderError
+        """
+        return asyncio.run_coroutine_threadsafe(
+            AsyncBittrexAutoTraderRunner._gather(coros), self._loop
+        ).result()
+
+    def close(self):
+        """
+        Close the API client session and stop the event loop.
+        """
+        asyncio.run_coroutine_threadsafe(self.api_req.close(), self._loop).result()
+
+        self._loop.call_soon_threadsafe(self._loop.stop)
+        self._thread.join()
+        self._loop.close()
+
+    @staticmethod
+    async def _gather(coros):
+        """
+        Returns the results of coroutines run at the same time.
+
+        Args:
+            coros (tuple):
+                Coroutines to run.
+
+        Returns:
+            list
+        """
+        return await asyncio.gather(*coros)
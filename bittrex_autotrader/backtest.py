@@ -0,0 +1,303 @@
+"""
+  bittrex_autotrader
+  Bittrex currency exchange autotrading script in a nutshell.
+
+  Copyright 2018-2020, Marc S. Brooks (https://mbrooks.info)
+  Licensed under the MIT license:
+  http://www.opensource.org/licenses/mit-license.php
+"""
+
+# Standard libraries.
+import argparse
+import json
+import os
+import time
+
+# External modules.
+import humanfriendly.tables
+import numpy
+
+# Package modules.
+from .__main__ import BittrexAutoTrader
+from .archive  import TradeArchive
+from .         import trades as BittrexAutoTraderTrades
+
+# Pricing and reinvestment are shared with the trader.
+# pylint: disable=protected-access
+
+#
+# Bittrex API autotrader backtest.
+#
+class BittrexAutoTraderBacktest:
+    """
+    Replay the autotrader BUY/SELL alternation against historical trades.
+
+    Orders are priced from the trade rate at the time they are submitted
+    (standing in for the ticker BID/ASK) with the configured markup/markdown,
+    and fill once a later trade reaches the limit price.  Fills are located
+    with vectorized scans over the rate series, so the Python work is per
+    order rather than per trade.
+
+    Dependencies:
+        humanfriendly
+        numpy
+    """
+
+    # Initial scan size when looking for an order fill.
+    SCAN_SIZE = 1024
+
+    def __init__(self, options):
+        """
+        Create a new instance of BittrexAutoTraderBacktest
+
+        Args:
+            options (dict):
+                Dictionary of options.
+
+        Attributes:
+            units (float):
+                BUY/SELL total units.
+            spread (array):
+                BUY/SELL markup/markdown percentage.
+            start (str):
+                Type of the first order, BUY or SELL (default: SELL).
+        """
+        self.units  = float(options['units'])
+        self.spread = options['spread'].split('/')
+        self.start  = options.get('start') or 'SELL'
+
+    def run(self, trades):
+        """
+        Replay trades and return the strategy results.
+
+        Args:
+            trades (ndarray):
+                Trades (structured array, oldest first) or trade rates.
+
+        Returns:
+            dict
+        """
+        rates = trades['rate'] if trades.dtype.names else trades
+        rates = numpy.ascontiguousarray(rates, dtype='f8')
+
+        markup   = BittrexAutoTrader._calc_decimal_percent(self.spread[0])
+        markdown = BittrexAutoTrader._calc_decimal_percent(self.spread[1])
+
+        units      = self.units
+        next_trade = self.start
+        prices     = {'BUY': 0, 'SELL': 0}
+
+        fills = []
+        index = 0
+        total = 0
+
+        while index < rates.size:
+            last_price = rates[index]
+
+            if next_trade == 'BUY':
+
+                # Reinvest earnings.
+                earnings, quantity = BittrexAutoTrader._calc_reinvest(
+                    units, prices['SELL'], prices['BUY'], last_price
+                )
+
+                if earnings > 0:
+                    units = quantity
+
+                price = round(last_price - (last_price * markdown), 8)
+            else:
+                price = round(last_price + (last_price * markup), 8)
+
+            total += 1
+
+            index = BittrexAutoTraderBacktest._find_fill(
+                rates, index + 1, price, next_trade == 'SELL'
+            )
+
+            if index < 0:
+                break
+
+            fills.append((index, 1 if next_trade == 'BUY' else -1, price, units))
+
+            prices[next_trade] = price
+
+            next_trade = 'BUY' if next_trade == 'SELL' else 'SELL'
+
+        return BittrexAutoTraderBacktest._report(rates, fills, total, units)
+
+    @staticmethod
+    def load(path):
+        """
+        Returns historical trades from a file, oldest first.
+
+        Args:
+            path (str):
+                JSON file of trades (as returned by the API), NumPy .npy file
+                or trade archive market directory (ie. archive/BTC-LTC).
+
+        Returns:
+            ndarray
+        """
+        if os.path.isdir(path):
+            path = os.path.normpath(path)
+
+            return TradeArchive(os.path.dirname(path)).read(
+                os.path.basename(path)
+            )['rate']
+
+        if path.endswith('.npy'):
+            trades = numpy.load(path, mmap_mode='r')
+        else:
+            with open(path, 'r', encoding='utf-8') as file:
+                trades = BittrexAutoTraderTrades.to_array(json.load(file))
+
+        if trades.dtype.names:
+            trades = trades[numpy.argsort(trades['timestamp'], kind='stable')]
+
+        return trades
+
+    @staticmethod
+    def arg_parser(description):
+        """
+        Returns a command-line argument parser with the historical trade options.
+
+        Args:
+            description (str):
+                Program description.
+
+        Returns:
+            argparse.ArgumentParser
+        """
+        arg_parser = argparse.ArgumentParser(description=description)
+
+        arg_parser.add_argument(
+            '--history',
+            help='Historical trades; JSON (API format), .npy file or archive market directory',
+            metavar='FILE',
+            required=True
+        )
+
+        arg_parser.add_argument(
+            '--start',
+            help='Type of the first order (default: SELL)',
+            choices=['BUY', 'SELL'],
+            default='SELL'
+        )
+
+        return arg_parser
+
+    @staticmethod
+    def _find_fill(rates, start, price, is_sell):
+        """
+        Returns the index of the first trade to reach a limit price.
+
+        Args:
+            rates (ndarray):
+                Trade rates (oldest first).
+            start (int):
+                Index of the first trade after the order was submitted.
+            price (float):
+                Order limit price.
+            is_sell (bool):
+                SELL order, filled at or above the price (BUY at or below).
+
+        Returns:
+            int (-1 if never filled)
+        """
+        size = BittrexAutoTraderBacktest.SCAN_SIZE
+
+        # Scan chunks of doubling size, so total work stays O(trades).
+        while start < rates.size:
+            chunk = rates[start:start + size]
+            match = chunk >= price if is_sell else chunk <= price
+
+            offset = int(match.argmax())
+            if match[offset]:
+                return start + offset
+
+            start += size
+            size  *= 2
+
+        return -1
+
+    @staticmethod
+    def _report(rates, fills, total, units):
+        """
+        Returns PnL, fill rate and drawdown of the replayed orders.
+
+        Args:
+            rates (ndarray):
+                Trade rates (oldest first).
+            fills (list):
+                Filled orders as (index, side, price, units) tuples.
+            total (int):
+                Total orders submitted.
+            units (float):
+                BUY/SELL total units after the last order.
+
+        Returns:
+            dict
+        """
+        fills = numpy.array(fills, dtype=[
+            ('index', 'i8'), ('side', 'i1'), ('price', 'f8'), ('units', 'f8')
+        ])
+
+        fees = BittrexAutoTrader.TRADE_FEES
+
+        # Base (units) and quote (BTC) balance after each fill.
+        base  = numpy.cumsum(fills['side'] * fills['units'])
+        quote = numpy.cumsum(
+            -fills['side'] * fills['units'] * fills['price'] * (1 + fills['side'] * fees)
+        )
+
+        # Mark-to-market equity over every trade.
+        state  = numpy.searchsorted(fills['index'], numpy.arange(rates.size), side='right')
+        base   = numpy.concatenate(([0.], base))[state]
+        quote  = numpy.concatenate(([0.], quote))[state]
+        equity = quote + base * rates
+
+        drawdown = numpy.maximum.accumulate(equity) - equity if rates.size else equity
+
+        return {
+            'trades': int(rates.size),
+            'orders': int(total),
+            'fills': int(fills.size),
+            'fill_rate': fills.size / total if total else 0.,
+            'pnl': float(equity[-1]) if rates.size else 0.,
+            'max_drawdown': float(drawdown.max()) if rates.size else 0.,
+            'units': float(units)
+        }
+
+#
+# Start program.
+#
+if __name__ == '__main__':
+    ARG_PARSER = BittrexAutoTraderBacktest.arg_parser(
+        'Replay the autotrader strategy against historical trades.'
+    )
+
+    ARG_PARSER.add_argument(
+        '--units',
+        help='BUY/SELL total units (default: 1.0)',
+        default='1.0'
+    )
+
+    ARG_PARSER.add_argument(
+        '--spread',
+        help='BUY/SELL markup/markdown percentage (default: 0.1/0.1)',
+        default='0.1/0.1'
+    )
+
+    ARGS = ARG_PARSER.parse_args()
+
+    TRADES = BittrexAutoTraderBacktest.load(ARGS.history)
+
+    STARTED = time.monotonic()
+    RESULTS = BittrexAutoTraderBacktest(vars(ARGS)).run(TRADES)
+    RESULTS['seconds'] = round(time.monotonic() - STARTED, 3)
+
+    # Output human-friendly results.
+    print(humanfriendly.tables.format_pretty_table(
+        [[name, value] for name, value in RESULTS.items()],
+        ['Backtest', ARGS.history]
+    ))
@@ -0,0 +1,8 @@
+"""
+  bittrex_autotrader
+  Bittrex currency exchange autotrading script in a nutshell.
+
+  Copyright 2018-2020, Marc S. Brooks (https://mbrooks.info)
+  Licensed under the MIT license:
+  http://www.opensource.org/licenses/mit-license.php
+"""
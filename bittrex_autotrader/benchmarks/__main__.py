@@ -0,0 +1,81 @@
+"""
+  bittrex_autotrader
+  Bittrex currency exchange autotrading script in a nutshell.
+
+  Copyright 2018-2020, Marc S. Brooks (https://mbrooks.info)
+  Licensed under the MIT license:
+  http://www.opensource.org/licenses/mit-license.php
+"""
+
+# Standard libraries.
+import argparse
+import json
+import sys
+
+# External modules.
+import humanfriendly.tables
+
+# Package modules.
+from .suite import BittrexAutoTraderBenchmark
+
+#
+# Start program.
+#
+if __name__ == '__main__':
+    ARG_PARSER = argparse.ArgumentParser(
+        description='Benchmark request signing, parsing, trade statistics and order submission.'
+    )
+
+    ARG_PARSER.add_argument(
+        '--output',
+        help='JSON file to write the results to (optional)'
+    )
+
+    ARG_PARSER.add_argument(
+        '--baseline',
+        help='JSON results file to compare against (optional)'
+    )
+
+    ARG_PARSER.add_argument(
+        '--threshold',
+        help='Slowdown ratio reported as a regression (default: 0.1)',
+        default='0.1'
+    )
+
+    ARG_PARSER.add_argument(
+        '--repeat',
+        help='Timing repeats per case (default: 5)',
+        default='5'
+    )
+
+    ARG_PARSER.add_argument(
+        '--min-time',
+        help='Minimum seconds per timing repeat (default: 0.2)',
+        default='0.2'
+    )
+
+    ARG_PARSER.add_argument(
+        '--cases',
+        help='Comma separated case name prefixes to run (default: all)'
+    )
+
+    ARGS = ARG_PARSER.parse_args()
+
+    RESULTS = BittrexAutoTraderBenchmark(vars(ARGS)).run()
+
+    if ARGS.output:
+        with open(ARGS.output, 'w', encoding='utf-8') as FILE:
+            json.dump(RESULTS, FILE, indent=2)
+
+    COMPARISON = BittrexAutoTraderBenchmark.compare(
+        RESULTS, BittrexAutoTraderBenchmark.load(ARGS.baseline), float(ARGS.threshold)
+    ) if ARGS.baseline else {}
+
+    # Output human-friendly results.
+    print(humanfriendly.tables.format_pretty_table(
+        *BittrexAutoTraderBenchmark.table(RESULTS, COMPARISON)
+    ))
+
+    # Fail on regression, ie. in a deployment pipeline.
+    if any(result['regression'] for result in COMPARISON.values()):
+        sys.exit(1)
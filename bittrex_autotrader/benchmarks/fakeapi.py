@@ -0,0 +1,231 @@
+"""
+  bittrex_autotrader
+  Bittrex currency exchange autotrading script in a nutshell.
+
+  Copyright 2018-2020, Marc S. Brooks (https://mbrooks.info)
+  Licensed under the MIT license:
+  http://www.opensource.org/licenses/mit-license.php
+"""
+
+# Standard libraries.
+import datetime
+import json
+import random
+import uuid
+
+class FakeSession:
+    """
+    In-process stand-in for requests.Session, serving realistic Bittrex API
+    response bodies without network I/O.
+
+    Response bodies are encoded once and decoded on each response.json()
+    call, so JSON decoding is measured as with a real response.
+    """
+
+    # Maximum submitted orders kept.
+    MAX_ORDERS = 100
+
+    def __init__(self, trades=100, depth=25, seed=0):
+        """
+        Create a new instance of FakeSession
+
+        Args:
+            trades (int):
+                Total trades served by markets/{symbol}/trades (default: 100).
+            depth (int):
+                Order book levels per side (default: 25).
+            seed (int):
+                Random seed of the generated payloads (default: 0).
+
+        Attributes:
+            bodies (dict):
+                Encoded response bodies by endpoint.
+            orders (dict):
+                Latest submitted orders by order id (MAX_ORDERS).
+        """
+        rng = random.Random(seed)
+
+        self.bodies = {
+            'trades': json.dumps(trades_payload(trades, rng=rng)).encode(),
+            'ticker': json.dumps(ticker_payload()).encode(),
+            'orderbook': json.dumps(order_book_payload(depth, rng=rng)).encode()
+        }
+
+        self.orders = {}
+
+    def get(self, url, headers=None, timeout=None): # pylint: disable=unused-argument
+        """
+        Returns the response of a GET request.
+
+        Returns:
+            FakeResponse
+        """
+        path = url.split('?', 1)[0]
+        name = path.rsplit('/', 1)[-1]
+
+        if name in self.bodies:
+            return FakeResponse(200, self.bodies[name])
+
+        if name == 'open':
+            return FakeResponse(200, json.dumps(list(self.orders.values())).encode())
+
+        order = self.orders.get(name)
+
+        if order is None:
+            return FakeResponse(404, b'{"code": "NOT_FOUND"}')
+
+        return FakeResponse(200, json.dumps(order).encode())
+
+    def request(self, method, url, **kwargs): # pylint: disable=unused-argument
+        """
+        Returns the response of a POST/DELETE request.
+
+        Returns:
+            FakeResponse
+        """
+        if method != 'POST':
+            return FakeResponse(200, b'{}')
+
+        now = datetime.datetime.now(datetime.timezone.utc)
+
+        order = dict(
+            kwargs.get('json') or {},
+            id=str(uuid.uuid4()),
+            status='OPEN',
+            fillQuantity='0.00000000',
+            createdAt=now.strftime('%Y-%m-%dT%H:%M:%S.000Z')
+        )
+
+        self.orders[order['id']] = order
+
+        # Keep the latest orders only, so repeated submissions use constant memory.
+        while len(self.orders) > FakeSession.MAX_ORDERS:
+            del self.orders[next(iter(self.orders))]
+
+        return FakeResponse(201, json.dumps(order).encode())
+
+    def close(self):
+        """
+        Release resources (none).
+        """
+
+class FakeResponse: # pylint: disable=too-few-public-methods
+    """
+    Response of a FakeSession request.
+    """
+
+    def __init__(self, status_code, body):
+        """
+        Create a new instance of FakeResponse
+
+        Args:
+            status_code (int):
+                HTTP status.
+            body (bytes):
+                JSON response body.
+
+        Attributes:
+            status_code (int):
+                HTTP status.
+            ok (bool):
+                HTTP status is successful.
+            headers (dict):
+                HTTP response headers.
+        """
+        self.status_code = status_code
+        self.ok          = status_code < 400
+        self.headers     = {'Content-Type': 'application/json'}
+
+        self._body = body
+
+    def json(self):
+        """
+        Returns the decoded response body.
+
+        Returns:
+            list|dict
+        """
+        return json.loads(self._body)
+
+def trades_payload(total, rate=0.004, rng=None):
+    """
+    Returns market trades as returned by the API, newest first.
+
+    Args:
+        total (int):
+            Total trades.
+        rate (float):
+            Starting trade rate (default: 0.004).
+        rng (random.Random):
+            Random number generator (optional).
+
+    Returns:
+        list
+    """
+    rng   = rng or random.Random(0)
+    start = datetime.datetime(2020, 1, 1)
+
+    trades = []
+    for i in range(total):
+        rate = max(rate + rng.gauss(0, rate / 1000), rate / 2)
+
+        trades.append({
+            'id': str(uuid.UUID(int=rng.getrandbits(128))),
+            'executedAt': (start + datetime.timedelta(seconds=i)).strftime(
+                '%Y-%m-%dT%H:%M:%S.000Z'
+            ),
+            'quantity': format(rng.uniform(0.1, 5), '.8f'),
+            'rate': format(rate, '.8f'),
+            'takerSide': rng.choice(['BUY', 'SELL'])
+        })
+
+    return trades[::-1]
+
+def order_book_payload(depth, rate=0.004, rng=None):
+    """
+    Returns an order book as returned by the API.
+
+    Args:
+        depth (int):
+            Levels per side.
+        rate (float):
+            Mid rate (default: 0.004).
+        rng (random.Random):
+            Random number generator (optional).
+
+    Returns:
+        dict
+    """
+    rng  = rng or random.Random(0)
+    tick = rate / 1000
+
+    return {
+        side: [
+            {
+                'quantity': format(rng.uniform(0.1, 10), '.8f'),
+                'rate': format(rate + sign * tick * (i + 1), '.8f')
+            }
+            for i in range(depth)
+        ]
+        for side, sign in (('bid', -1), ('ask', 1))
+    }
+
+def ticker_payload(symbol='BTC-LTC', rate=0.004):
+    """
+    Returns market tick values as returned by the API.
+
+    Args:
+        symbol (str):
+            String literal for the market (default: BTC-LTC).
+        rate (float):
+            Last trade rate (default: 0.004).
+
+    Returns:
+        dict
+    """
+    return {
+        'symbol': symbol,
+        'lastTradeRate': format(rate, '.8f'),
+        'bidRate': format(rate * 0.999, '.8f'),
+        'askRate': format(rate * 1.001, '.8f')
+    }
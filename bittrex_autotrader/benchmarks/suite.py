@@ -0,0 +1,350 @@
+"""
+  bittrex_autotrader
+  Bittrex currency exchange autotrading script in a nutshell.
+
+  Copyright 2018-2020, Marc S. Brooks (https://mbrooks.info)
+  Licensed under the MIT license:
+  http://www.opensource.org/licenses/mit-license.php
+"""
+
+# Standard libraries.
+import contextlib
+import datetime
+import io
+import json
+import platform
+import statistics
+import timeit
+
+# External modules.
+import numpy
+
+# Package modules.
+from ..__main__ import BittrexAutoTrader
+from ..api      import BittrexAutoTraderApi
+from ..request  import BittrexAutoTraderRequest
+from ..services import TraderServices
+from ..         import trades as BittrexAutoTraderTrades
+from .fakeapi   import FakeSession, order_book_payload, trades_payload
+
+#
+# Bittrex API autotrader benchmarks.
+#
+class BittrexAutoTraderBenchmark:
+    """
+    Times request signing, response parsing, trade statistics and a full
+    order submission against an in-process fake API.
+
+    Each case is run in loops of at least min_time seconds, repeat times;
+    the result is the median seconds per call.
+
+    Dependencies:
+        numpy
+    """
+
+    # Trade buffer sizes timed by the trades_cold and market_totals cases.
+    TRADE_SIZES = (100, 1000, 100000)
+
+    def __init__(self, options=None):
+        """
+        Create a new instance of BittrexAutoTraderBenchmark
+
+        Args:
+            options (dict):
+                Dictionary of options (optional).
+
+        Options:
+            repeat (int):
+                Timing repeats per case (default: 5).
+            min_time (float):
+                Minimum seconds per timing repeat (default: 0.2).
+            cases (str):
+                Comma separated case name prefixes to run (default: all).
+
+        Attributes:
+            repeat (int):
+                Timing repeats per case.
+            min_time (float):
+                Minimum seconds per timing repeat.
+            cases (list):
+                Case name prefixes to run (empty for all).
+        """
+        options = options or {}
+
+        self.repeat   = int(options.get('repeat') or 5)
+        self.min_time = float(options.get('min_time') or 0.2)
+        self.cases    = [name for name in (options.get('cases') or '').split(',') if name]
+
+    def run(self):
+        """
+        Run the benchmark cases.
+
+        Returns:
+            dict (environment and results by case name)
+        """
+        results = {}
+
+        for name, func in BittrexAutoTraderBenchmark._cases().items():
+            if self.cases and not any(name.startswith(prefix) for prefix in self.cases):
+                continue
+
+            results[name] = self.measure(func)
+
+        return {
+            'created': datetime.datetime.now(datetime.timezone.utc).strftime('%Y-%m-%dT%H:%M:%SZ'),
+            'python': platform.python_version(),
+            'numpy': numpy.__version__,
+            'machine': platform.machine(),
+            'results': results
+        }
+
+    def measure(self, func):
+        """
+        Returns the timing of a case.
+
+        Args:
+            func (callable):
+                Case to time.
+
+        Returns:
+            dict (median/min seconds per call, loops per repeat)
+        """
+        timer = timeit.Timer(func)
+
+        # Loops per repeat, doubled until a repeat takes min_time.
+        loops = 1
+        while timer.timeit(loops) < self.min_time:
+            loops *= 2
+
+        times = [seconds / loops for seconds in timer.repeat(self.repeat, loops)]
+
+        return {
+            'seconds': statistics.median(times),
+            'min': min(times),
+            'loops': loops,
+            'ops_per_second': 1 / statistics.median(times)
+        }
+
+    @staticmethod
+    def compare(results, baseline, threshold=0.1):
+        """
+        Returns results compared to a baseline, by case name.
+
+        Args:
+            results (dict):
+                Benchmark results (run).
+            baseline (dict):
+                Saved benchmark results.
+            threshold (float):
+                Slowdown ratio reported as a regression (default: 0.1).
+
+        Returns:
+            dict (seconds, baseline seconds, change ratio, regression)
+        """
+        comparison = {}
+
+        for name, result in results['results'].items():
+            saved = baseline['results'].get(name)
+
+            if saved is None:
+                continue
+
+            change = result['seconds'] / saved['seconds'] - 1
+
+            comparison[name] = {
+                'seconds': result['seconds'],
+                'baseline': saved['seconds'],
+                'change': change,
+                'regression': change > threshold
+            }
+
+        return comparison
+
+    @staticmethod
+    def load(path):
+        """
+        Returns saved benchmark results.
+
+        Args:
+            path (str):
+                JSON results file.
+
+        Returns:
+            dict
+        """
+        with open(path, encoding='utf-8') as file:
+            return json.load(file)
+
+    @staticmethod
+    def table(results, comparison=None):
+        """
+        Returns table rows and column names of results, with their changes
+        if compared to a baseline.
+
+        Args:
+            results (dict):
+                Benchmark results (run).
+            comparison (dict):
+                Comparison to a baseline (compare, optional).
+
+        Returns:
+            tuple (rows, column names)
+        """
+        rows    = []
+        columns = ['Case', 'Microseconds', 'Ops/sec']
+
+        if comparison:
+            columns.extend(['Change', ''])
+
+        for name, result in results['results'].items():
+            row = [name, f"{result['seconds'] * 1e6:.3f}", f"{result['ops_per_second']:.1f}"]
+
+            if comparison:
+                change = comparison.get(name)
+
+                row.extend([
+                    f"{change['change']:+.1%}" if change else '',
+                    'REGRESSION' if change and change['regression'] else ''
+                ])
+
+            rows.append(row)
+
+        return rows, columns
+
+    @staticmethod
+    def _cases():
+        """
+        Returns benchmark cases by name.
+
+        Returns:
+            dict
+        """
+        secret = 'X' * 32
+        url    = BittrexAutoTraderApi.BASE_URL + '/orders'
+        body   = json.dumps({
+            'marketSymbol': 'BTC-LTC',
+            'direction': 'BUY',
+            'type': 'LIMIT',
+            'quantity': '1.00000000',
+            'limit': '0.00400000',
+            'timeInForce': 'GOOD_TIL_CANCELLED'
+        })
+
+        content_hash = BittrexAutoTraderApi._hash_content(body) # pylint: disable=protected-access
+
+        trades_body = json.dumps(trades_payload(100)).encode()
+        book_body   = json.dumps(order_book_payload(500)).encode()
+
+        cases = {
+            'sign_request': lambda: BittrexAutoTraderApi._sign_request( # pylint: disable=protected-access
+                secret, 'POST', url, '1577836800000', content_hash
+            ),
+            'hash_content': lambda: BittrexAutoTraderApi._hash_content(body), # pylint: disable=protected-access
+            'json_decode_trades': lambda: json.loads(trades_body),
+            'json_decode_orderbook': lambda: json.loads(book_body)
+        }
+
+        # Each case has its own trader, so no case reads another's trades.
+        for size in BittrexAutoTraderBenchmark.TRADE_SIZES:
+            data = trades_payload(size)
+
+            cases[f'trades_cold_{size}'] = BittrexAutoTraderBenchmark._trades_cold(data)
+
+            cases[f'market_totals_{size}'] = BittrexAutoTraderBenchmark._market_totals(
+                BittrexAutoTraderBenchmark._trader(), data
+            )
+
+        rates = 0.004 + numpy.cumsum(numpy.random.default_rng(0).normal(0, 1e-6, 1000000))
+
+        cases['numpy_calc_sma'] = lambda: BittrexAutoTrader._numpy_calc_sma(rates, 100) # pylint: disable=protected-access
+
+        cases['submit_order'] = BittrexAutoTraderBenchmark._submit_order(
+            BittrexAutoTraderBenchmark._trader()
+        )
+
+        return cases
+
+    @staticmethod
+    def _trader():
+        """
+        Returns a trader whose API client uses a fake session.
+
+        Returns:
+            BittrexAutoTrader
+        """
+        options = {
+            'apikey': 'X' * 32,
+            'secret': 'X' * 32,
+            'market': 'BTC-LTC',
+            'units': '1',
+            'spread': '0.1/0.1',
+            'method': 'arithmetic',
+            'delay': '30',
+            'prompt': 'False',
+            'rate_limit': '0',
+            'auth_rate_limit': '0'
+        }
+
+        api_req = BittrexAutoTraderRequest(options['apikey'], options['secret'], options)
+
+        api_req.session.close()
+        api_req.session = FakeSession()
+
+        return BittrexAutoTrader(options, TraderServices(options, api_req))
+
+    @staticmethod
+    def _trades_cold(data):
+        """
+        Returns a case that ingests the first batch of trades into an empty buffer.
+
+        Args:
+            data (list):
+                Trades as returned by the API.
+
+        Returns:
+            callable
+        """
+        def case():
+            return BittrexAutoTraderTrades.TradeBuffer(len(data)).extend(data)
+
+        return case
+
+    @staticmethod
+    def _market_totals(trader, data):
+        """
+        Returns a case that buffers trades and reads their BUY rates.
+
+        Args:
+            trader (BittrexAutoTrader):
+                Trader instance, not shared with other cases.
+            data (list):
+                Trades as returned by the API.
+
+        Returns:
+            callable
+        """
+        def case():
+            trader.data.trades = BittrexAutoTraderTrades.TradeBuffer(len(data))
+            trader.data.trades.extend(data)
+
+            return trader.market_totals('BUY')
+
+        return case
+
+    @staticmethod
+    def _submit_order(trader):
+        """
+        Returns a case that submits a BUY order (output discarded).
+
+        Args:
+            trader (BittrexAutoTrader):
+                Trader instance.
+
+        Returns:
+            callable
+        """
+        def case():
+            with contextlib.redirect_stdout(io.StringIO()):
+                trader.submit_order('BUY')
+
+        return case
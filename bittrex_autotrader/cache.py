@@ -0,0 +1,135 @@
+"""
+  bittrex_autotrader
+  Bittrex currency exchange autotrading script in a nutshell.
+
+  Copyright 2018-2020, Marc S. Brooks (https://mbrooks.info)
+  Licensed under the MIT license:
+  http://www.opensource.org/licenses/mit-license.php
+"""
+
+# Standard libraries.
+import collections
+import threading
+import time
+
+class ResponseCache:
+    """
+    In-process LRU cache of public API responses with per-endpoint TTLs.
+
+    Only endpoints listed in the TTLs are cached; cached responses are shared
+    between callers and must not be modified.
+    """
+
+    # Seconds to cache responses by endpoint ({} is a market symbol).
+    TTLS = {
+        'markets': 60,
+        'currencies': 300,
+        'markets/summaries': 1,
+        'markets/tickers': 1,
+        'markets/{}/ticker': 1
+    }
+
+    def __init__(self, ttls=None, maxsize=256):
+        """
+        Create a new instance of ResponseCache
+
+        Args:
+            ttls (dict):
+                Seconds to cache responses by endpoint (default: TTLS).
+            maxsize (int):
+                Maximum responses to cache (default: 256).
+
+        Attributes:
+            ttls (dict):
+                Seconds to cache responses by endpoint.
+            maxsize (int):
+                Maximum responses to cache.
+            hits (int):
+                Total responses returned from the cache.
+            misses (int):
+                Total cacheable responses not found (or expired).
+        """
+        self.ttls    = ResponseCache.TTLS if ttls is None else ttls
+        self.maxsize = int(maxsize)
+        self.hits    = 0
+        self.misses  = 0
+
+        self._items = collections.OrderedDict()
+        self._lock  = threading.Lock()
+
+    def cacheable(self, endpoint):
+        """
+        Returns True if responses for the endpoint are cached.
+
+        Args:
+            endpoint (str):
+                Endpoint (ie. markets/{}/ticker).
+
+        Returns:
+            bool
+        """
+        return endpoint in self.ttls
+
+    def get(self, key):
+        """
+        Returns a cached response, None if not found or expired.
+
+        Args:
+            key (str):
+                Request URL.
+
+        Returns:
+            list|dict
+        """
+        with self._lock:
+            item = self._items.get(key)
+
+            if item is None or item[0] < time.monotonic():
+                self.misses += 1
+
+                return None
+
+            self._items.move_to_end(key)
+
+            self.hits += 1
+
+            return item[1]
+
+    def set(self, key, endpoint, value):
+        """
+        Cache a response, evict the least recently used when full.
+
+        Args:
+            key (str):
+                Request URL.
+            endpoint (str):
+                Endpoint (ie. markets/{}/ticker).
+            value (list|dict):
+                Decoded response body.
+        """
+        with self._lock:
+            self._items[key] = (time.monotonic() + self.ttls[endpoint], value)
+            self._items.move_to_end(key)
+
+            while len(self._items) > self.maxsize:
+                self._items.popitem(last=False)
+
+    def clear(self):
+        """
+        Remove all cached responses.
+        """
+        with self._lock:
+            self._items.clear()
+
+    def stats(self):
+        """
+        Returns cache hit/miss counters.
+
+        Returns:
+            dict
+        """
+        return {
+            'hits': self.hits,
+            'misses': self.misses,
+            'size': len(self._items)
+        }
@@ -49,7 +49,7 @@ def values():
 
     arg_parser.add_argument(
         '--market',
-        help='String literal for the market (ie. BTC-LTC)',
+        help='String literal for the market, comma separated for multiple (ie. BTC-LTC)',
         default='BTC-LTC'
     )
 
@@ -68,12 +68,32 @@ def values():
     arg_parser.add_argument(
         '--method',
         help='Moving Average calculation method (default: arithmetic)',
+        choices=['arithmetic', 'weighted', 'vwap', 'wma', 'ema'],
         default='arithmetic'
     )
 
+    arg_parser.add_argument(
+        '--window',
+        help='Moving Average window in total trades (default: 100)',
+        default='100'
+    )
+
+    arg_parser.add_argument(
+        '--period',
+        help='Moving Average window in seconds (default: 0, unlimited)',
+        default='0'
+    )
+
+    arg_parser.add_argument(
+        '--archive',
+        help='Directory to archive market trades in (optional)',
+        metavar='DIR',
+        default=None
+    )
+
     arg_parser.add_argument(
         '--delay',
-        help='Seconds to delay order status requests (default: 30)',
+        help='Maximum seconds between order status requests (default: 30)',
         default='30'
     )
 
@@ -83,6 +103,151 @@ def values():
         default=True
     )
 
+    arg_parser.add_argument(
+        '--workers',
+        help='Worker threads when trading multiple markets (default: 1 per market, max 8)',
+        default=None
+    )
+
+    arg_parser.add_argument(
+        '--pool-connections',
+        help='Total connection pools (one per host) to cache (default: 10)',
+        dest='pool_connections',
+        default='10'
+    )
+
+    arg_parser.add_argument(
+        '--pool-maxsize',
+        help='Maximum connections to keep alive per host (default: 10)',
+        dest='pool_maxsize',
+        default='10'
+    )
+
+    arg_parser.add_argument(
+        '--cache',
+        help='Cache public endpoint responses (default: false)',
+        default=False
+    )
+
+    arg_parser.add_argument(
+        '--cache-size',
+        help='Maximum responses to cache (default: 256)',
+        dest='cache_size',
+        default='256'
+    )
+
+    arg_parser.add_argument(
+        '--rate-limit',
+        help='Public requests per second, 0 to disable (default: 1)',
+        dest='rate_limit',
+        default='1'
+    )
+
+    arg_parser.add_argument(
+        '--auth-rate-limit',
+        help='Authenticated requests per second, 0 to disable (default: 1)',
+        dest='auth_rate_limit',
+        default='1'
+    )
+
+    arg_parser.add_argument(
+        '--rate-burst',
+        help='Maximum requests at once per budget (default: 10)',
+        dest='rate_burst',
+        default='10'
+    )
+
+    arg_parser.add_argument(
+        '--retries',
+        help='Total attempts per request (default: 10)',
+        default='10'
+    )
+
+    arg_parser.add_argument(
+        '--retry-deadline',
+        help='Maximum seconds to spend retrying a request, 0 to disable (default: 60)',
+        dest='retry_deadline',
+        default='60'
+    )
+
+    arg_parser.add_argument(
+        '--connect-timeout',
+        help='Seconds to wait for a connection (default: 5)',
+        dest='connect_timeout',
+        default='5'
+    )
+
+    arg_parser.add_argument(
+        '--read-timeout',
+        help='Seconds to wait between bytes of a response (default: 30)',
+        dest='read_timeout',
+        default='30'
+    )
+
+    arg_parser.add_argument(
+        '--stream',
+        help='Market data and order update stream address (ie. localhost:8765)',
+        metavar='ADDRESS',
+        default=None
+    )
+
+    arg_parser.add_argument(
+        '--depth-pricing',
+        help='Price orders against order book depth (default: false)',
+        dest='depth_pricing',
+        default=False
+    )
+
+    arg_parser.add_argument(
+        '--poll-min',
+        help='Seconds between status checks of orders near the market (default: 2)',
+        dest='poll_min',
+        default='2'
+    )
+
+    arg_parser.add_argument(
+        '--poll-budget',
+        help='Maximum order status checks per minute across markets, 0 to disable (default: 30)',
+        dest='poll_budget',
+        default='30'
+    )
+
+    arg_parser.add_argument(
+        '--journal',
+        help='Directory to journal orders in, to restore them on restart (optional)',
+        metavar='DIR',
+        default=None
+    )
+
+    arg_parser.add_argument(
+        '--order-history',
+        help='Maximum orders kept per market (default: 1000)',
+        dest='order_history',
+        default='1000'
+    )
+
+    arg_parser.add_argument(
+        '--order-spill',
+        help='Directory to append orders beyond the history to (optional)',
+        dest='order_spill',
+        metavar='DIR',
+        default=None
+    )
+
+    arg_parser.add_argument(
+        '--metrics',
+        help='Address to serve metrics on, at /metrics (ie. localhost:9108)',
+        metavar='ADDRESS',
+        default=None
+    )
+
+    arg_parser.add_argument(
+        '--trace',
+        help='File to write order submission trace spans to on exit (Chrome trace JSON)',
+        metavar='FILE',
+        default=None
+    )
+
     arg_parser.add_argument(
         '--version',
         action='version',
@@ -91,12 +256,21 @@ def values():
 
     args, _ = arg_parser.parse_known_args()
 
-    # Return configuration values from file.
+    # Return configuration values from file (falling back to defaults).
     if args.conf:
         config_parser = configparser.ConfigParser()
         config_parser.read([args.conf])
 
-        return dict(config_parser.items('config'))
+        options = vars(args)
+        options.update(config_parser.items('config'))
+
+        # Market specific overrides (ie. [BTC-LTC] section).
+        options['markets'] = dict(
+            (section, dict(config_parser.items(section)))
+            for section in config_parser.sections() if section != 'config'
+        )
+
+        return options
 
     # Return command-line argument values.
     return vars(args)
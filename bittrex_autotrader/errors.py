@@ -0,0 +1,150 @@
+"""
+  bittrex_autotrader
+  Bittrex currency exchange autotrading script in a nutshell.
+
+  Copyright 2018-2020, Marc S. Brooks (https://mbrooks.info)
+  Licensed under the MIT license:
+  http://www.opensource.org/licenses/mit-license.php
+"""
+
+class BittrexAutoTraderError(Exception):
+    """
+    Base class of failed Bittrex API requests.
+    """
+
+    def __init__(self, message, status=None, code=None, latency=None, attempts=0):
+        """
+        Create a new instance of BittrexAutoTraderError
+
+        Args:
+            message (str):
+                Error description.
+            status (int):
+                Response HTTP status (None if no response).
+            code (str):
+                Bittrex error code (ie. INSUFFICIENT_FUNDS).
+            latency (float):
+                Seconds spent on the request, including retries.
+            attempts (int):
+                Total attempts made.
+
+        Attributes:
+            status (int):
+                Response HTTP status (None if no response).
+            code (str):
+                Bittrex error code.
+            latency (float):
+                Seconds spent on the request, including retries.
+            attempts (int):
+                Total attempts made.
+        """
+        super().__init__(message)
+
+        self.status   = status
+        self.code     = code
+        self.latency  = latency
+        self.attempts = attempts
+
+    def __str__(self):
+        details = [f'{self.attempts} attempts']
+
+        if self.status:
+            details.insert(0, f'status {self.status}')
+
+        if self.latency is not None:
+            details.append(f'{self.latency:.3f}s')
+
+        return f"{self.args[0]} ({', '.join(details)})"
+
+class TransportError(BittrexAutoTraderError):
+    """
+    No response was received (connection failure or timeout).
+    """
+
+class DeadlineExceeded(TransportError):
+    """
+    Request deadline passed before a response was received.
+    """
+
+class ApiError(BittrexAutoTraderError):
+    """
+    Bittrex responded with an error.
+    """
+
+class RateLimited(ApiError):
+    """
+    Request rate limit exceeded (HTTP 429).
+    """
+
+class AuthError(ApiError):
+    """
+    API key, signature or permissions were rejected.
+    """
+
+class InsufficientFunds(ApiError):
+    """
+    Account balance is too low to place the order.
+    """
+
+class OrderNotFound(ApiError):
+    """
+    Order does not exist (HTTP 404 on an orders endpoint).
+    """
+
+# Bittrex error codes by exception type.
+ERROR_CODES = {
+    'TOO_MANY_REQUESTS': RateLimited,
+    'THROTTLED': RateLimited,
+    'APIKEY_INVALID': AuthError,
+    'INVALID_SIGNATURE': AuthError,
+    'INVALID_TIMESTAMP': AuthError,
+    'INVALID_PERMISSION': AuthError,
+    'UNAUTHORIZED': AuthError,
+    'INSUFFICIENT_FUNDS': InsufficientFunds,
+    'ORDER_NOT_FOUND': OrderNotFound
+}
+
+def from_response(uri, status=None, res=None, latency=None, attempts=0, *, error=None):
+    """
+    Returns the exception for a failed request.
+
+    Args:
+        uri (str):
+            URI that references an API service.
+        status (int):
+            Response HTTP status (None if no response).
+        res (list|dict):
+            Decoded JSON response body (None if no response).
+        latency (float):
+            Seconds spent on the request, including retries.
+        attempts (int):
+            Total attempts made.
+        error (str):
+            Transport error name of the last attempt (optional).
+
+    Returns:
+        BittrexAutoTraderError
+    """
+    if res is None and error == DeadlineExceeded.__name__:
+        return DeadlineExceeded(
+            f'Deadline exceeded: {uri}', status, None, latency, attempts
+        )
+
+    if res is None:
+        return TransportError(
+            f'Connection failure: {uri}', status, None, latency, attempts
+        )
+
+    code = res.get('code') if isinstance(res, dict) else None
+
+    error = ERROR_CODES.get(code, ApiError)
+
+    if error is ApiError:
+        if status == 429:
+            error = RateLimited
+        elif status in (401, 403):
+            error = AuthError
+        elif status == 404 and uri.startswith('orders'):
+            error = OrderNotFound
+
+    return error(f'Bittrex response: {code}', status, code, latency, attempts)
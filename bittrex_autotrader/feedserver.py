@@ -0,0 +1,401 @@
+"""
+  bittrex_autotrader
+  Bittrex currency exchange autotrading script in a nutshell.
+
+  Copyright 2018-2020, Marc S. Brooks (https://mbrooks.info)
+  Licensed under the MIT license:
+  http://www.opensource.org/licenses/mit-license.php
+"""
+
+# Standard libraries.
+import argparse
+import json
+import random
+import socketserver
+import threading
+import time
+import uuid
+
+# Package modules.
+from .orderbook import OrderBook
+
+class StreamServer(socketserver.ThreadingTCPServer):
+    """
+    Local stand-in for the Bittrex stream, used to run and test the stream
+    consumer offline.
+
+    Clients send {"subscribe": [channels]} and receive newline-delimited
+    JSON messages published to those channels, numbered in sequence per
+    channel.  Order book subscribers are sent the current book first, as a
+    snapshot.  Open
+    orders published to the order channel are filled by simulate() once the
+    simulated rate crosses their limit.
+    """
+
+    allow_reuse_address = True
+    daemon_threads      = True
+
+    def __init__(self, address):
+        """
+        Create a new instance of StreamServer
+
+        Args:
+            address (tuple):
+                Host and port to listen on (port 0 for any).
+
+        Attributes:
+            books (dict):
+                OrderBook by market.
+            orders (dict):
+                Open orders by order id.
+        """
+        super().__init__(address, _StreamHandler)
+
+        self.books  = {}
+        self.orders = {}
+
+        self._clients   = {}
+        self._sequences = {}
+        self._lock      = threading.Lock()
+
+    def publish(self, channel, data):
+        """
+        Send a message to the subscribers of a channel.
+
+        Args:
+            channel (str):
+                Channel name (ie. trade_BTC-LTC).
+            data (dict):
+                Message payload.
+        """
+        with self._lock:
+            self._sequences[channel] = self._sequences.get(channel, 0) + 1
+
+            data = dict(data, sequence=self._sequences[channel])
+            line = json.dumps({'channel': channel, 'data': data}).encode() + b'\n'
+
+            dropped = [
+                client for client, channels in self._clients.items()
+                if (channel in channels or _book_channel(channel, channels))
+                and not client.send(line)
+            ]
+
+            # Remove disconnected clients (lock held, so not unsubscribe).
+            for client in dropped:
+                self._clients.pop(client, None)
+
+    def publish_trades(self, market, trades):
+        """
+        Publish market trades (oldest first).
+
+        Args:
+            market (str):
+                String literal for the market (ie. BTC-LTC).
+            trades (list):
+                Trades in the API format.
+        """
+        self.publish(f'trade_{market}', {'marketSymbol': market, 'deltas': trades})
+
+    def publish_book(self, market, bid_deltas=None, ask_deltas=None):
+        """
+        Publish order book changes (quantity 0 removes a rate).
+
+        Args:
+            market (str):
+                String literal for the market (ie. BTC-LTC).
+            bid_deltas (list):
+                BID {quantity, rate} changes.
+            ask_deltas (list):
+                ASK {quantity, rate} changes.
+        """
+        data = {
+            'marketSymbol': market,
+            'bidDeltas': bid_deltas or [],
+            'askDeltas': ask_deltas or []
+        }
+
+        with self._lock:
+            _market_book(self.books, market).apply(data)
+
+        self.publish(f'orderbook_{market}', data)
+
+    def publish_order(self, order):
+        """
+        Publish an order update, keep open orders to simulate fills.
+
+        Args:
+            order (dict):
+                Order in the API format.
+        """
+        with self._lock:
+            if order['status'] == 'OPEN':
+                self.orders[order['id']] = order
+            else:
+                self.orders.pop(order['id'], None)
+
+        self.publish('order', {'delta': order})
+
+    def fill_orders(self, market, rate):
+        """
+        Fill open orders of a market whose limit is crossed by a trade rate.
+
+        Args:
+            market (str):
+                String literal for the market (ie. BTC-LTC).
+            rate (float):
+                Trade rate.
+        """
+        with self._lock:
+            orders = [
+                order for order in self.orders.values()
+                if order['marketSymbol'] == market and (
+                    float(order['limit']) >= rate if order['direction'] == 'BUY'
+                    else float(order['limit']) <= rate
+                )
+            ]
+
+        for order in orders:
+            self.publish_order(dict(
+                order, status='CLOSED', fillQuantity=order['quantity'],
+                closedAt=time.strftime('%Y-%m-%dT%H:%M:%S.000Z', time.gmtime())
+            ))
+
+    def subscribe(self, client, channels):
+        """
+        Register client channels, send current order books (empty if none yet).
+
+        Args:
+            client (_StreamHandler):
+                Connected client.
+            channels (list):
+                Channel names.
+        """
+        with self._lock:
+            self._clients[client] = set(channels)
+
+            for channel in channels:
+                if not channel.startswith('orderbook_'):
+                    continue
+
+                market = channel[len('orderbook_'):].rsplit('_', 1)[0]
+                book   = _market_book(self.books, market)
+
+                sent = client.send(json.dumps({'channel': f'orderbook_{market}', 'data': {
+                    'marketSymbol': market,
+                    'sequence': self._sequences.get(f'orderbook_{market}', 0),
+                    'snapshot': True,
+                    'bidDeltas': _deltas(book.bid.levels),
+                    'askDeltas': _deltas(book.ask.levels)
+                }}).encode() + b'\n')
+
+                if not sent:
+                    self._clients.pop(client, None)
+                    break
+
+    def unsubscribe(self, client):
+        """
+        Remove a disconnected client.
+
+        Args:
+            client (_StreamHandler):
+                Connected client.
+        """
+        with self._lock:
+            self._clients.pop(client, None)
+
+    def simulate(self, market, rate=0.004, interval=0.5, depth=25):
+        """
+        Publish a random walk of trades and order book changes, and fills of
+        the open orders crossed by it, forever.
+
+        Args:
+            market (str):
+                String literal for the market (ie. BTC-LTC).
+            rate (float):
+                Starting trade rate (default: 0.004).
+            interval (float):
+                Seconds between updates (default: 0.5).
+            depth (int):
+                Order book levels per side (default: 25).
+        """
+        tick = rate / 1000
+
+        while True:
+            rate = max(rate + random.gauss(0, tick), tick)
+
+            self.publish_book(
+                market,
+                _levels(rate - tick, -tick, depth, self.books.get(market), 'bid'),
+                _levels(rate + tick, tick, depth, self.books.get(market), 'ask')
+            )
+
+            self.publish_trades(market, [{
+                'id': str(uuid.uuid4()),
+                'executedAt': time.strftime('%Y-%m-%dT%H:%M:%S.000Z', time.gmtime()),
+                'quantity': format(random.uniform(0.1, 5), '.8f'),
+                'rate': format(rate, '.8f'),
+                'takerSide': random.choice(['BUY', 'SELL'])
+            }])
+
+            self.fill_orders(market, rate)
+
+            time.sleep(interval)
+
+class _StreamHandler(socketserver.StreamRequestHandler):
+    """
+    Stream client connection.
+    """
+
+    def handle(self):
+        try:
+            for line in self.rfile:
+                message = json.loads(line)
+
+                if 'subscribe' in message:
+                    self.server.subscribe(self, message['subscribe'])
+
+        except (OSError, ValueError):
+            pass
+
+        finally:
+            self.server.unsubscribe(self)
+
+    def send(self, line):
+        """
+        Send a message line.
+
+        Called with the server lock held, so a disconnected client is
+        removed by the caller.
+
+        Args:
+            line (bytes):
+                Newline terminated JSON message.
+
+        Returns:
+            bool (False if disconnected)
+        """
+        try:
+            self.wfile.write(line)
+
+        except OSError:
+            return False
+
+        return True
+
+def _book_channel(channel, channels):
+    """
+    Returns True if an order book channel is subscribed to, at any depth.
+
+    Args:
+        channel (str):
+            Order book channel name without depth (ie. orderbook_BTC-LTC).
+        channels (set):
+            Subscribed channel names (ie. orderbook_BTC-LTC_25).
+
+    Returns:
+        bool
+    """
+    return channel.startswith('orderbook_') and \
+        any(name.rsplit('_', 1)[0] == channel for name in channels)
+
+def _market_book(books, market):
+    """
+    Returns the order book of a market, created empty (and in sync) if new.
+
+    Args:
+        books (dict):
+            OrderBook by market.
+        market (str):
+            String literal for the market (ie. BTC-LTC).
+
+    Returns:
+        OrderBook
+    """
+    if market not in books:
+        books[market] = OrderBook()
+        books[market].snapshot({})
+
+    return books[market]
+
+def _deltas(levels):
+    """
+    Returns order book levels as {quantity, rate} deltas.
+
+    Args:
+        levels (dict):
+            Quantities by rate.
+
+    Returns:
+        list
+    """
+    return [{'quantity': str(quantity), 'rate': str(rate)} for rate, quantity in levels.items()]
+
+def _levels(start, step, depth, book, side):
+    """
+    Returns order book deltas that replace a side with depth random levels.
+
+    Args:
+        start (float):
+            Best rate.
+        step (float):
+            Rate change per level.
+        depth (int):
+            Total levels.
+        book (OrderBook):
+            Current order book (optional).
+        side (str):
+            bid or ask.
+
+    Returns:
+        list
+    """
+    rates  = [round(start + step * i, 8) for i in range(depth)]
+    deltas = [
+        {'quantity': '0', 'rate': str(rate)}
+        for rate in (getattr(book, side).levels if book else {})
+        if rate not in rates
+    ]
+
+    deltas += [
+        {'quantity': format(random.uniform(0.1, 10), '.8f'), 'rate': str(rate)}
+        for rate in rates
+    ]
+
+    return deltas
+
+#
+# Start program.
+#
+if __name__ == '__main__':
+    ARG_PARSER = argparse.ArgumentParser(
+        description='Serve a simulated Bittrex market stream on a local port.'
+    )
+
+    ARG_PARSER.add_argument(
+        '--address',
+        help='Address to listen on (default: localhost:8765)',
+        default='localhost:8765'
+    )
+
+    ARG_PARSER.add_argument(
+        '--market',
+        help='String literal for the market (default: BTC-LTC)',
+        default='BTC-LTC'
+    )
+
+    ARG_PARSER.add_argument(
+        '--interval',
+        help='Seconds between updates (default: 0.5)',
+        type=float,
+        default=0.5
+    )
+
+    ARGS = ARG_PARSER.parse_args()
+
+    HOST, PORT = ARGS.address.rsplit(':', 1)
+
+    SERVER = StreamServer((HOST, int(PORT)))
+
+    threading.Thread(target=SERVER.serve_forever, daemon=True).start()
+
+    SERVER.simulate(ARGS.market, interval=ARGS.interval)
@@ -0,0 +1,167 @@
+"""
+  bittrex_autotrader
+  Bittrex currency exchange autotrading script in a nutshell.
+
+  Copyright 2018-2020, Marc S. Brooks (https://mbrooks.info)
+  Licensed under the MIT license:
+  http://www.opensource.org/licenses/mit-license.php
+"""
+
+# Standard libraries.
+import asyncio
+import threading
+
+class SingleFlight:
+    """
+    Coalesces concurrent calls with the same key into a single call.
+
+    The first caller (leader) runs the call; callers arriving while it is in
+    flight wait for it and receive the same result, or exception.  Threads
+    and coroutines are coalesced separately.
+    """
+
+    def __init__(self):
+        """
+        Create a new instance of SingleFlight
+
+        Attributes:
+            calls (int):
+                Total calls made.
+            coalesced (int):
+                Total calls that shared an in-flight call.
+        """
+        self.calls     = 0
+        self.coalesced = 0
+
+        self._flights       = {}
+        self._async_flights = {}
+        self._lock          = threading.Lock()
+
+    def call(self, key, func):
+        """
+        Returns the result of func(), shared with concurrent calls of the same key.
+
+        Args:
+            key (str):
+                Call identifier (ie. request URL).
+            func (callable):
+                Function to call.
+
+        Returns:
+            object
+        """
+        with self._lock:
+            flight = self._flights.get(key)
+            leader = flight is None
+
+            if leader:
+                flight = self._flights[key] = _Flight()
+
+                self.calls += 1
+            else:
+                self.coalesced += 1
+
+        if not leader:
+            flight.done.wait()
+
+            return flight.result()
+
+        try:
+            flight.value = func()
+
+        except BaseException as err:
+            flight.error = err
+
+            raise
+
+        finally:
+            with self._lock:
+                del self._flights[key]
+
+            flight.done.set()
+
+        return flight.value
+
+    async def call_async(self, key, func):
+        """
+        Returns the result of await func(), shared with concurrent calls of the same key.
+
+        Args:
+            key (str):
+                Call identifier (ie. request URL).
+            func (callable):
+                Coroutine function to call.
+
+        Returns:
+            object
+        """
+        flight = self._async_flights.get(key)
+
+        if flight is not None:
+            self.coalesced += 1
+
+            waiter = asyncio.get_event_loop().create_future()
+            flight.waiters.append(waiter)
+
+            return await waiter
+
+        flight = self._async_flights[key] = _Flight()
+
+        self.calls += 1
+
+        try:
+            flight.value = await func()
+
+        except BaseException as err:
+            flight.error = err
+
+            raise
+
+        finally:
+            del self._async_flights[key]
+
+            for waiter in flight.waiters:
+                if waiter.cancelled():
+                    continue
+
+                if flight.error is not None:
+                    waiter.set_exception(flight.error)
+                else:
+                    waiter.set_result(flight.value)
+
+        return flight.value
+
+    def stats(self):
+        """
+        Returns call counters.
+
+        Returns:
+            dict
+        """
+        return {
+            'calls': self.calls,
+            'coalesced': self.coalesced
+        }
+
+class _Flight: # pylint: disable=too-few-public-methods
+    """
+    In-flight call shared by its leader and followers.
+    """
+
+    def __init__(self):
+        self.done    = threading.Event()
+        self.waiters = []
+        self.value   = None
+        self.error   = None
+
+    def result(self):
+        """
+        Returns the call result, raise its exception.
+
+        Returns:
+            object
+        """
+        if self.error is not None:
+            raise self.error
+
+        return self.value
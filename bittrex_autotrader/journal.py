@@ -0,0 +1,265 @@
+"""
+  bittrex_autotrader
+  Bittrex currency exchange autotrading script in a nutshell.
+
+  Copyright 2018-2020, Marc S. Brooks (https://mbrooks.info)
+  Licensed under the MIT license:
+  http://www.opensource.org/licenses/mit-license.php
+"""
+
+# Standard libraries.
+import json
+import os
+import sys
+import threading
+
+class OrderJournal:
+    """
+    Append-only journal of order events, shared by the traders of many markets.
+
+    Each event is one JSON line (journal.log), numbered in sequence.  Lines
+    are written through on append and fsync'd by a timer within sync_interval
+    seconds, so many events share one fsync.  Every SNAPSHOT_EVENTS events
+    (by sequence number) the orders of all markets are written to
+    snapshot.json (atomic rename) and the journal is truncated, so loading
+    replays only the events since the last snapshot.  Events already in the
+    snapshot are skipped on load, corrupt lines are skipped and logged, and
+    a partly written last line after a crash is discarded.  Only the latest
+    history orders of each market are kept.
+    """
+
+    # Events between snapshots.
+    SNAPSHOT_EVENTS = 1000
+
+    def __init__(self, path, sync_interval=1, history=1000):
+        """
+        Create a new instance of OrderJournal, load the orders of all markets.
+
+        Args:
+            path (str):
+                Journal directory.
+            sync_interval (float):
+                Maximum seconds before an event is fsync'd, 0 to fsync every
+                event (default: 1).
+            history (int):
+                Maximum orders kept per market (default: 1000).
+
+        Attributes:
+            path (str):
+                Journal directory.
+            sync_interval (float):
+                Maximum seconds before an event is fsync'd.
+            history (int):
+                Maximum orders kept per market.
+            orders (dict):
+                Orders by market, oldest first.
+            sequence (int):
+                Sequence number of the last event.
+        """
+        self.path          = path
+        self.sync_interval = float(sync_interval)
+        self.history       = max(int(history), 1)
+        self.orders        = {}
+        self.sequence      = 0
+
+        self._timer = None
+        self._lock  = threading.Lock()
+
+        os.makedirs(path, exist_ok=True)
+
+        self._load()
+
+        # pylint: disable=consider-using-with
+        self._file = open(os.path.join(path, 'journal.log'), 'a', encoding='utf-8')
+
+    def market_orders(self, market):
+        """
+        Returns the orders of a market, oldest first.
+
+        Args:
+            market (str):
+                String literal for the market (ie. BTC-LTC).
+
+        Returns:
+            list
+        """
+        with self._lock:
+            return list(self.orders.get(market, []))
+
+    def add(self, market, order):
+        """
+        Record a submitted order.
+
+        Args:
+            market (str):
+                String literal for the market (ie. BTC-LTC).
+            order (dict):
+                Order id, type, price and quantity.
+        """
+        self._append({'e': 'add', 'm': market, 'o': order})
+
+    def remove(self, market, order_id):
+        """
+        Record an order removed (ie. not found).
+
+        Args:
+            market (str):
+                String literal for the market (ie. BTC-LTC).
+            order_id (str):
+                Order id.
+        """
+        self._append({'e': 'remove', 'm': market, 'id': order_id})
+
+    def complete(self, market, order_id, outcome):
+        """
+        Record the outcome of a completed order.
+
+        Args:
+            market (str):
+                String literal for the market (ie. BTC-LTC).
+            order_id (str):
+                Order id.
+            outcome (str):
+                FILLED or CANCELLED.
+        """
+        self._append({'e': 'complete', 'm': market, 'id': order_id, 'outcome': outcome})
+
+    def sync(self):
+        """
+        Flush and fsync appended events.
+        """
+        with self._lock:
+            if not self._file.closed:
+                self._sync()
+
+    def close(self):
+        """
+        Sync and close the journal.
+        """
+        with self._lock:
+            self._sync()
+            self._file.close()
+
+    def _append(self, event):
+        """
+        Apply and write an event, fsync and snapshot when due.
+
+        Args:
+            event (dict):
+                Event type (e), market (m) and order (o) or order id (id)
+                and outcome.
+        """
+        with self._lock:
+            self.sequence += 1
+
+            event['n'] = self.sequence
+
+            self._apply(event)
+
+            self._file.write(json.dumps(event, separators=(',', ':')) + '\n')
+            self._file.flush()
+
+            if self.sequence % OrderJournal.SNAPSHOT_EVENTS == 0:
+                self._snapshot()
+
+            elif not self.sync_interval:
+                self._sync()
+
+            # Events appended until the timer fires share its fsync.
+            elif self._timer is None:
+                self._timer = threading.Timer(self.sync_interval, self.sync)
+                self._timer.daemon = True
+                self._timer.start()
+
+    def _apply(self, event):
+        """
+        Apply an event to the orders.
+
+        Args:
+            event (dict):
+                Journal event.
+        """
+        orders = self.orders.setdefault(event['m'], [])
+
+        if event['e'] == 'add':
+            orders.append(event['o'])
+
+            del orders[:-self.history]
+
+        elif event['e'] == 'complete':
+            for order in orders:
+                if order['id'] == event['id']:
+                    order['outcome'] = event['outcome']
+        else:
+            orders[:] = [order for order in orders if order['id'] != event['id']]
+
+    def _sync(self):
+        """
+        Flush and fsync the journal file, cancel a pending timer (lock held).
+        """
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+
+        self._file.flush()
+
+        os.fsync(self._file.fileno())
+
+    def _snapshot(self):
+        """
+        Write the orders of all markets, then truncate the journal (lock held).
+        """
+        tmp_path = os.path.join(self.path, 'snapshot.json.tmp')
+
+        with open(tmp_path, 'w', encoding='utf-8') as file:
+            json.dump({'sequence': self.sequence, 'orders': self.orders}, file)
+
+            file.flush()
+
+            os.fsync(file.fileno())
+
+        os.replace(tmp_path, os.path.join(self.path, 'snapshot.json'))
+
+        self._file.truncate(0)
+        self._sync()
+
+    def _load(self):
+        """
+        Load the last snapshot, replay the journal events that follow it.
+        """
+        snapshot_path = os.path.join(self.path, 'snapshot.json')
+        journal_path  = os.path.join(self.path, 'journal.log')
+
+        if os.path.exists(snapshot_path):
+            with open(snapshot_path, encoding='utf-8') as file:
+                snapshot = json.load(file)
+
+            self.orders   = snapshot['orders']
+            self.sequence = snapshot['sequence']
+
+        if not os.path.exists(journal_path):
+            return
+
+        with open(journal_path, 'rb+') as file:
+            offset = 0
+
+            for line in file:
+
+                # Discard a partly written last line.
+                if not line.endswith(b'\n'):
+                    file.truncate(offset)
+                    break
+
+                offset += len(line)
+
+                try:
+                    event = json.loads(line)
+
+                    if event['n'] > self.sequence:
+                        self._apply(event)
+
+                        self.sequence = event['n']
+
+                except (ValueError, KeyError, TypeError) as error:
+                    print(f'Skipped journal event at offset {offset - len(line)}: {error}',
+                          file=sys.stderr)
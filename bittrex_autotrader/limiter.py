@@ -0,0 +1,188 @@
+"""
+  bittrex_autotrader
+  Bittrex currency exchange autotrading script in a nutshell.
+
+  Copyright 2018-2020, Marc S. Brooks (https://mbrooks.info)
+  Licensed under the MIT license:
+  http://www.opensource.org/licenses/mit-license.php
+"""
+
+# Standard libraries.
+import threading
+import time
+
+# Package modules.
+from . import metrics as BittrexAutoTraderMetrics
+
+class TokenBucket:
+    """
+    Thread-safe token bucket.
+
+    Each request reserves a token, possibly in the future, and is told how
+    long to wait for it.  Callers sleep outside of the lock (time.sleep or
+    asyncio.sleep), so waiting threads and coroutines are served in order
+    of arrival without blocking each other.
+    """
+
+    def __init__(self, rate, burst=1):
+        """
+        Create a new instance of TokenBucket
+
+        Args:
+            rate (float):
+                Tokens added per second.
+            burst (int):
+                Maximum tokens available at once (default: 1).
+
+        Attributes:
+            rate (float):
+                Tokens added per second.
+            burst (int):
+                Maximum tokens available at once.
+            waits (int):
+                Total requests that had to wait for a token.
+            wait_seconds (float):
+                Total seconds spent waiting for tokens.
+        """
+        self.rate         = float(rate)
+        self.burst        = max(int(burst), 1)
+        self.waits        = 0
+        self.wait_seconds = 0.0
+
+        self._tokens  = float(self.burst)
+        self._updated = time.monotonic()
+        self._lock    = threading.Lock()
+
+    def reserve(self, timeout=None):
+        """
+        Reserve a token, returns the seconds to wait before using it.
+
+        Args:
+            timeout (float):
+                Maximum seconds to wait (optional).
+
+        Returns:
+            float (None if not reserved, the wait would exceed timeout)
+        """
+        with self._lock:
+            now = time.monotonic()
+
+            self._tokens = min(
+                self._tokens + (now - self._updated) * self.rate, self.burst
+            )
+            self._updated = now
+            self._tokens -= 1
+
+            if self._tokens >= 0:
+                return 0.0
+
+            # Negative tokens are owed by requests already waiting.
+            seconds = -self._tokens / self.rate
+
+            if timeout is not None and seconds > timeout:
+                self._tokens += 1
+
+                return None
+
+            self.waits        += 1
+            self.wait_seconds += seconds
+
+            return seconds
+
+    def stats(self):
+        """
+        Returns token bucket wait counters.
+
+        Returns:
+            dict
+        """
+        return {
+            'waits': self.waits,
+            'wait_seconds': round(self.wait_seconds, 6)
+        }
+
+class RateLimiter:
+    """
+    Client-side request rate limiter with separate budgets for public and
+    authenticated endpoints, shared by every caller of an API client.
+    """
+
+    def __init__(self, public_rate=1, auth_rate=1, burst=10):
+        """
+        Create a new instance of RateLimiter
+
+        Args:
+            public_rate (float):
+                Public requests per second, 0 to disable (default: 1).
+            auth_rate (float):
+                Authenticated requests per second, 0 to disable (default: 1).
+            burst (int):
+                Maximum requests at once per budget (default: 10).
+
+        Attributes:
+            public (TokenBucket):
+                Public endpoint budget (None if unlimited).
+            auth (TokenBucket):
+                Authenticated endpoint budget (None if unlimited).
+        """
+        public_rate = float(public_rate or 0)
+        auth_rate   = float(auth_rate or 0)
+
+        self.public = TokenBucket(public_rate, burst) if public_rate > 0 else None
+        self.auth   = TokenBucket(auth_rate, burst) if auth_rate > 0 else None
+
+    def reserve(self, auth=False, timeout=None):
+        """
+        Reserve a request, returns the seconds to wait before sending it.
+
+        Args:
+            auth (bool):
+                Authenticated request (default: False).
+            timeout (float):
+                Maximum seconds to wait (optional).
+
+        Returns:
+            float (None if not reserved, the wait would exceed timeout)
+        """
+        bucket  = self.auth if auth is True else self.public
+        seconds = bucket.reserve(timeout) if bucket else 0.0
+
+        if seconds:
+            BittrexAutoTraderMetrics.RATE_LIMIT_WAIT_SECONDS.inc(
+                'auth' if auth is True else 'public', amount=seconds
+            )
+
+        return seconds
+
+    def wait(self, auth=False, timeout=None):
+        """
+        Block the calling thread until a request can be sent.
+
+        Args:
+            auth (bool):
+                Authenticated request (default: False).
+            timeout (float):
+                Maximum seconds to wait (optional).
+
+        Returns:
+            bool (False if the wait would exceed timeout, without waiting)
+        """
+        seconds = self.reserve(auth, timeout)
+
+        if seconds:
+            time.sleep(seconds)
+
+        return seconds is not None
+
+    def stats(self):
+        """
+        Returns wait counters per budget.
+
+        Returns:
+            dict
+        """
+        return {
+            name: bucket.stats()
+            for name, bucket in (('public', self.public), ('auth', self.auth))
+            if bucket
+        }
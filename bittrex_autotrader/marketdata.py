@@ -0,0 +1,201 @@
+"""
+  bittrex_autotrader
+  Bittrex currency exchange autotrading script in a nutshell.
+
+  Copyright 2018-2020, Marc S. Brooks (https://mbrooks.info)
+  Licensed under the MIT license:
+  http://www.opensource.org/licenses/mit-license.php
+"""
+
+# External modules.
+import numpy
+
+# Package modules.
+from .archive import TradeArchive
+from .        import trades as BittrexAutoTraderTrades
+
+class MarketData:
+    """
+    Buffered trades of a market and the rates an order is priced from.
+
+    Dependencies:
+        numpy
+    """
+
+    def __init__(self, options):
+        """
+        Create a new instance of MarketData
+
+        Args:
+            options (dict):
+                Dictionary of options.
+
+        Attributes:
+            market (str):
+                String literal for the market (ie. BTC-LTC).
+            method (str):
+                Moving Average calculation method.
+            trades (TradeBuffer):
+                Latest market trades (window / period).
+            archive (TradeArchive):
+                Market trades archive (optional).
+            depth_pricing (bool):
+                Price orders against order book depth.
+        """
+        self.market  = options['market']
+        self.method  = options['method']
+        self.trades  = BittrexAutoTraderTrades.TradeBuffer(
+            options.get('window') or 100, options.get('period')
+        )
+        self.archive = TradeArchive(options['archive']) if options.get('archive') else None
+
+        self.depth_pricing = options.get('depth_pricing')
+
+        # Exponential Moving Average per taker side.
+        self._ema = dict.fromkeys((BittrexAutoTraderTrades.BUY, BittrexAutoTraderTrades.SELL))
+
+    def extend(self, market_history):
+        """
+        Add trades not seen before to the buffer (and archive).
+
+        Args:
+            market_history (list):
+                Trades as returned by the API, newest first.
+
+        Returns:
+            ndarray (new trades; id, timestamp, rate, quantity, side)
+        """
+        if self.archive:
+            self.archive.append(self.market, market_history)
+
+        trades = self.trades.extend(market_history)
+
+        # Update Exponential Moving Average from new trades only.
+        if self.method == 'ema':
+            for side, ema in self._ema.items():
+                rates = trades['rate'][trades['side'] == side]
+
+                if rates.size:
+                    self._ema[side] = MarketData._numpy_calc_ema(
+                        rates, self.trades.capacity, ema
+                    )
+
+        return trades
+
+    def totals(self, trade_type='BUY', column='rate'):
+        """
+        Returns BUY/SELL order market totals (buffered trades) as ndarray.
+
+        Args:
+            trade_type (str):
+                BUY or SELL (default: BUY).
+            column (str):
+                Trade column to return (default: rate).
+
+        Returns:
+            ndarray
+        """
+        return self.trades.values(
+            BittrexAutoTraderTrades.side_of(trade_type), column
+        )
+
+    def moving_average(self, trade_type='BUY'):
+        """
+        Returns BUY/SELL Moving Average of buffered trades by calculation method.
+
+        Methods:
+            arithmetic:
+                Arithmetic mean of trade rates (default).
+            weighted, vwap:
+                Volume-weighted average of trade rates.
+            wma:
+                Linearly weighted average, recent trades weigh more.
+            ema:
+                Exponential Moving Average (span: window).
+
+        Args:
+            trade_type (str):
+                BUY or SELL (default: BUY).
+
+        Returns:
+            float (nan if there are no trades)
+        """
+        side = BittrexAutoTraderTrades.side_of(trade_type)
+
+        if self.method in ('weighted', 'vwap'):
+            return MarketData._numpy_calc_vwap(
+                self.totals(trade_type),
+                self.totals(trade_type, 'quantity')
+            )
+
+        if self.method == 'wma':
+            return MarketData._numpy_calc_wma(
+                self.totals(trade_type)
+            )
+
+        if self.method == 'ema':
+            return self._ema[side] if self._ema[side] is not None else float('nan')
+
+        return self.trades.mean(side)
+
+    @staticmethod
+    def _numpy_calc_vwap(arr, weights):
+        """
+        Return Volume-Weighted Average for a given data sequence.
+
+        Args:
+            arr (ndarray):
+                One-dimensional input array (rates).
+            weights (ndarray):
+                One-dimensional weights array (quantities).
+
+        Returns:
+            float (nan if there is no volume)
+        """
+        volume = weights.sum()
+
+        return float(numpy.dot(arr, weights) / volume) if volume else float('nan')
+
+    @staticmethod
+    def _numpy_calc_wma(arr):
+        """
+        Return linearly Weighted Moving Average for a given data sequence.
+
+        Args:
+            arr (ndarray):
+                One-dimensional input array (oldest first).
+
+        Returns:
+            float (nan if empty)
+        """
+        num = arr.size
+
+        if not num:
+            return float('nan')
+
+        return float(numpy.dot(arr, numpy.arange(1, num + 1)) / (num * (num + 1) / 2))
+
+    @staticmethod
+    def _numpy_calc_ema(arr, span, previous=None):
+        """
+        Return Exponential Moving Average for a given data sequence.
+
+        Args:
+            arr (ndarray):
+                One-dimensional input array (oldest first).
+            span (int):
+                Number of values (n-value), smoothing factor 2 / (span + 1).
+            previous (float):
+                Exponential Moving Average preceding the sequence (optional).
+
+        Returns:
+            float
+        """
+        alpha = 2 / (float(span) + 1)
+
+        if previous is None:
+            previous, arr = arr[0], arr[1:]
+
+        decay = (1 - alpha) ** numpy.arange(arr.size - 1, -1, -1)
+
+        return float((1 - alpha) ** arr.size * previous + alpha * numpy.dot(decay, arr))
@@ -0,0 +1,440 @@
+"""
+  bittrex_autotrader
+  Bittrex currency exchange autotrading script in a nutshell.
+
+  Copyright 2018-2020, Marc S. Brooks (https://mbrooks.info)
+  Licensed under the MIT license:
+  http://www.opensource.org/licenses/mit-license.php
+"""
+
+# Standard libraries.
+import bisect
+import http.server
+import socketserver
+import threading
+
+class Metric: # pylint: disable=too-few-public-methods
+    """
+    Metric family; one value per set of label values.
+
+    Updates take no lock: each label set is created once (under the lock)
+    and then updated in place, so updates cost a dictionary lookup and an
+    addition.  Concurrent updates of the same label set may rarely be lost,
+    which is acceptable for monitoring.  Samples are read from a snapshot
+    taken under the lock, so label sets can be added while rendering.
+    """
+
+    TYPE = 'untyped'
+
+    def __init__(self, name, documentation, labels=()):
+        """
+        Create a new instance of Metric
+
+        Args:
+            name (str):
+                Metric name (ie. bittrex_requests_total).
+            documentation (str):
+                Metric description.
+            labels (tuple):
+                Label names (optional).
+
+        Attributes:
+            name (str):
+                Metric name.
+            documentation (str):
+                Metric description.
+            labels (tuple):
+                Label names.
+            values (dict):
+                Values by label values.
+        """
+        self.name          = name
+        self.documentation = documentation
+        self.labels        = tuple(labels)
+        self.values        = {}
+
+        self._lock = threading.Lock()
+
+    def samples(self):
+        """
+        Returns (name suffix, labels, value) samples, in the text format order.
+
+        Returns:
+            list
+        """
+        return [
+            ('', dict(zip(self.labels, label_values)), value[0])
+            for label_values, value in self._snapshot()
+        ]
+
+    def _snapshot(self):
+        """
+        Returns a copy of the values, sorted by label values.
+
+        Returns:
+            list
+        """
+        with self._lock:
+            items = [(label_values, list(value)) for label_values, value in self.values.items()]
+
+        return sorted(items)
+
+    def _value(self, label_values):
+        """
+        Returns the mutable value of a label set, create it if necessary.
+
+        Args:
+            label_values (tuple):
+                Label values.
+
+        Returns:
+            list
+        """
+        value = self.values.get(label_values)
+
+        if value is None:
+            with self._lock:
+                value = self.values.setdefault(label_values, [0.0])
+
+        return value
+
+class Counter(Metric):
+    """
+    Monotonically increasing total.
+    """
+
+    TYPE = 'counter'
+
+    def inc(self, *label_values, amount=1):
+        """
+        Increment the total of a label set.
+
+        Args:
+            label_values (str):
+                Label values, in label name order.
+            amount (float):
+                Amount to add (default: 1).
+        """
+        self._value(label_values)[0] += amount
+
+class Gauge(Metric):
+    """
+    Value that can go up and down.
+    """
+
+    TYPE = 'gauge'
+
+    def set(self, value, *label_values):
+        """
+        Set the value of a label set.
+
+        Args:
+            value (float):
+                Current value.
+            label_values (str):
+                Label values, in label name order.
+        """
+        self._value(label_values)[0] = value
+
+    def inc(self, *label_values, amount=1):
+        """
+        Add to the value of a label set.
+
+        Args:
+            label_values (str):
+                Label values, in label name order.
+            amount (float):
+                Amount to add, negative to subtract (default: 1).
+        """
+        self._value(label_values)[0] += amount
+
+class Histogram(Metric):
+    """
+    Distribution of observed values in preallocated buckets.
+    """
+
+    TYPE = 'histogram'
+
+    # Request latency bucket upper bounds, in seconds.
+    LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30, 60)
+
+    def __init__(self, name, documentation, labels=(), buckets=LATENCY_BUCKETS):
+        """
+        Create a new instance of Histogram
+
+        Args:
+            name (str):
+                Metric name (ie. bittrex_request_seconds).
+            documentation (str):
+                Metric description.
+            labels (tuple):
+                Label names (optional).
+            buckets (tuple):
+                Bucket upper bounds, ascending (default: LATENCY_BUCKETS).
+
+        Attributes:
+            buckets (tuple):
+                Bucket upper bounds.
+        """
+        super().__init__(name, documentation, labels)
+
+        self.buckets = tuple(float(bound) for bound in buckets)
+
+    def observe(self, value, *label_values):
+        """
+        Count a value in its bucket.
+
+        Args:
+            value (float):
+                Observed value.
+            label_values (str):
+                Label values, in label name order.
+        """
+        counts = self.values.get(label_values)
+
+        # Bucket counts, then the +Inf count and the sum.
+        if counts is None:
+            with self._lock:
+                counts = self.values.setdefault(
+                    label_values, [0] * (len(self.buckets) + 1) + [0.0]
+                )
+
+        counts[bisect.bisect_left(self.buckets, value)] += 1
+        counts[-1] += value
+
+    def samples(self):
+        """
+        Returns (name suffix, labels, value) samples, in the text format order.
+
+        Returns:
+            list
+        """
+        samples = []
+
+        for label_values, counts in self._snapshot():
+            labels = dict(zip(self.labels, label_values))
+            total  = 0
+
+            for bound, count in zip(self.buckets + (float('inf'),), counts):
+                total += count
+
+                le = '+Inf' if bound == float('inf') else format(bound, 'g')
+
+                samples.append(('_bucket', dict(labels, le=le), total))
+
+            samples.append(('_sum', labels, counts[-1]))
+            samples.append(('_count', labels, total))
+
+        return samples
+
+class MetricsRegistry:
+    """
+    Named metrics, rendered in the Prometheus text exposition format.
+    """
+
+    def __init__(self):
+        """
+        Create a new instance of MetricsRegistry
+
+        Attributes:
+            metrics (dict):
+                Metric by name.
+        """
+        self.metrics = {}
+
+    def counter(self, name, documentation, labels=()):
+        """
+        Returns a new counter.
+
+        Returns:
+            Counter
+        """
+        return self._register(Counter(name, documentation, labels))
+
+    def gauge(self, name, documentation, labels=()):
+        """
+        Returns a new gauge.
+
+        Returns:
+            Gauge
+        """
+        return self._register(Gauge(name, documentation, labels))
+
+    def histogram(self, name, documentation, labels=(), buckets=Histogram.LATENCY_BUCKETS):
+        """
+        Returns a new histogram.
+
+        Returns:
+            Histogram
+        """
+        return self._register(Histogram(name, documentation, labels, buckets))
+
+    def render(self):
+        """
+        Returns all metrics in the Prometheus text exposition format.
+
+        Returns:
+            str
+        """
+        lines = []
+
+        for metric in list(self.metrics.values()):
+            lines.append(f'# HELP {metric.name} {metric.documentation}')
+            lines.append(f'# TYPE {metric.name} {metric.TYPE}')
+
+            for suffix, labels, value in metric.samples():
+                lines.append(
+                    f'{metric.name}{suffix}{MetricsRegistry._format_labels(labels)} {value!r}'
+                )
+
+        return '\n'.join(lines) + '\n'
+
+    def serve(self, address):
+        """
+        Serve the metrics (GET /metrics) in a background thread.
+
+        Args:
+            address (str):
+                Address to listen on (ie. localhost:9108).
+
+        Returns:
+            http.server.HTTPServer
+        """
+        host, port = address.rsplit(':', 1)
+
+        registry = self
+
+        class Handler(http.server.BaseHTTPRequestHandler):
+            """
+            Metrics HTTP request handler.
+            """
+
+            def do_GET(self): # pylint: disable=invalid-name
+                """
+                Send the rendered metrics.
+                """
+                if self.path.split('?')[0] != '/metrics':
+                    self.send_error(404)
+                    return
+
+                body = registry.render().encode()
+
+                self.send_response(200)
+                self.send_header('Content-Type', 'text/plain; version=0.0.4')
+                self.send_header('Content-Length', str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, *args): # pylint: disable=arguments-differ
+                pass
+
+        class Server(socketserver.ThreadingMixIn, http.server.HTTPServer):
+            """
+            Metrics HTTP server, a thread per request.
+            """
+
+            daemon_threads = True
+
+        server = Server((host, int(port)), Handler)
+
+        threading.Thread(target=server.serve_forever, daemon=True).start()
+
+        return server
+
+    def _register(self, metric):
+        """
+        Add a metric, returns it.
+
+        Args:
+            metric (Metric):
+                Metric to add.
+
+        Returns:
+            Metric
+        """
+        self.metrics[metric.name] = metric
+
+        return metric
+
+    @staticmethod
+    def _format_labels(labels):
+        """
+        Returns labels as {name="value",...} (empty if no labels).
+
+        Args:
+            labels (dict):
+                Label values by name.
+
+        Returns:
+            str
+        """
+        if not labels:
+            return ''
+
+        pairs = ','.join(
+            f'{name}="{MetricsRegistry._escape(value)}"' for name, value in labels.items()
+        )
+
+        return '{' + pairs + '}'
+
+    @staticmethod
+    def _escape(value):
+        """
+        Returns a label value with backslashes, quotes and newlines escaped.
+
+        Args:
+            value (str):
+                Label value.
+
+        Returns:
+            str
+        """
+        return str(value).replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n')
+
+#
+# Package metrics.
+#
+REGISTRY = MetricsRegistry()
+
+REQUEST_SECONDS = REGISTRY.histogram(
+    'bittrex_request_seconds',
+    'API request latency, including retries.',
+    ('method', 'endpoint', 'status')
+)
+
+REQUEST_RETRIES = REGISTRY.counter(
+    'bittrex_request_retries_total',
+    'API request attempts retried.',
+    ('method', 'endpoint')
+)
+
+RATE_LIMIT_WAIT_SECONDS = REGISTRY.counter(
+    'bittrex_rate_limit_wait_seconds_total',
+    'Seconds requests waited for the client-side rate limiter.',
+    ('budget',)
+)
+
+ORDERS_SUBMITTED = REGISTRY.counter(
+    'bittrex_orders_submitted_total',
+    'Orders submitted.',
+    ('market', 'type')
+)
+
+ORDER_POLLS = REGISTRY.counter(
+    'bittrex_order_polls_total',
+    'Order status polls.',
+    ('market',)
+)
+
+ORDER_FILL_SECONDS = REGISTRY.histogram(
+    'bittrex_order_fill_seconds',
+    'Time from order submission to the order no longer being open.',
+    ('market', 'type'),
+    (5, 15, 30, 60, 120, 300, 600, 1800, 3600, 14400, 86400)
+)
+
+REALIZED_PNL = REGISTRY.gauge(
+    'bittrex_realized_pnl',
+    'Realized PnL of filled SELL orders against the preceding BUY, net of fees (quote currency).',
+    ('market',)
+)
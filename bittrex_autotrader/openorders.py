@@ -0,0 +1,94 @@
+"""
+  bittrex_autotrader
+  Bittrex currency exchange autotrading script in a nutshell.
+
+  Copyright 2018-2020, Marc S. Brooks (https://mbrooks.info)
+  Licensed under the MIT license:
+  http://www.opensource.org/licenses/mit-license.php
+"""
+
+# Standard libraries.
+import threading
+import time
+
+class OpenOrders:
+    """
+    Open orders of all markets, shared by the traders of many markets.
+
+    The orders are refreshed with one orders/open request once older than
+    max_age, rather than one orders/{id} request per market.  An order
+    missing from the refreshed orders has been filled or cancelled, so only
+    then are its details requested.  Cached reads never refresh the orders.
+    """
+
+    def __init__(self, api_req, max_age=1):
+        """
+        Create a new instance of OpenOrders
+
+        Args:
+            api_req (BittrexAutoTraderRequest):
+                Instance of BittrexAutoTraderRequest.
+            max_age (float):
+                Seconds before the orders are refreshed (default: 1).
+
+        Attributes:
+            api_req (BittrexAutoTraderRequest):
+                Instance of BittrexAutoTraderRequest.
+            max_age (float):
+                Seconds before the orders are refreshed.
+            orders (dict):
+                Open orders by order id (None until the first request).
+            created (float):
+                Monotonic time the orders were refreshed.
+        """
+        self.api_req = api_req
+        self.max_age = float(max_age)
+        self.orders  = None
+        self.created = 0.0
+
+        self._lock = threading.Lock()
+
+    def order(self, order_id, cached=False):
+        """
+        Returns the current state of an order, refresh the orders if expired.
+
+        Args:
+            order_id (str):
+                Order id.
+            cached (bool):
+                Read the current orders, even if expired (default: False).
+
+        Returns:
+            dict (None if no longer open or not yet requested)
+        """
+        orders = self.orders if cached else self.latest()
+
+        return orders.get(order_id) if orders is not None else None
+
+    def latest(self):
+        """
+        Returns the open orders by order id, refresh them if expired.
+
+        Returns:
+            dict
+        """
+        with self._lock:
+            if self.orders is None or time.monotonic() - self.created > self.max_age:
+                self.orders  = {
+                    order['id']: order for order in self.api_req.market_open_orders()
+                }
+                self.created = time.monotonic()
+
+            return self.orders
+
+    def track(self, order):
+        """
+        Add an order submitted since the last refresh.
+
+        Args:
+            order (dict):
+                Order as returned by the API.
+        """
+        with self._lock:
+            if self.orders is not None:
+                self.orders[order['id']] = order
@@ -0,0 +1,312 @@
+"""
+  bittrex_autotrader
+  Bittrex currency exchange autotrading script in a nutshell.
+
+  Copyright 2018-2020, Marc S. Brooks (https://mbrooks.info)
+  Licensed under the MIT license:
+  http://www.opensource.org/licenses/mit-license.php
+"""
+
+# Standard libraries.
+import bisect
+
+# External modules.
+import numpy
+
+class OrderBookSide:
+    """
+    Price levels of one side of an order book.
+
+    Rates are kept in ascending order (binary search on update) alongside
+    a quantity per rate, so the best rate is read from either end of the
+    list.  Depth queries use NumPy arrays built once per change.
+    """
+
+    def __init__(self, descending=False):
+        """
+        Create a new instance of OrderBookSide
+
+        Args:
+            descending (bool):
+                Best rate is the highest (BID side).
+
+        Attributes:
+            descending (bool):
+                Best rate is the highest.
+            levels (dict):
+                Quantities by rate.
+        """
+        self.descending = descending
+        self.levels     = {}
+
+        self._rates  = []
+        self._arrays = None
+
+    def __len__(self):
+        return len(self._rates)
+
+    def copy(self):
+        """
+        Returns a copy of the price levels.
+
+        Returns:
+            OrderBookSide
+        """
+        side = OrderBookSide(self.descending)
+
+        side.levels = dict(self.levels)
+        side._rates = list(self._rates) # pylint: disable=protected-access
+
+        return side
+
+    def update(self, rate, quantity):
+        """
+        Set the quantity of a rate (0 removes it).
+
+        Args:
+            rate (float):
+                Price level rate.
+            quantity (float):
+                Total quantity at the rate.
+        """
+        exists = rate in self.levels
+
+        if quantity:
+            if not exists:
+                bisect.insort(self._rates, rate)
+
+            self.levels[rate] = quantity
+
+        elif exists:
+            del self.levels[rate]
+            del self._rates[bisect.bisect_left(self._rates, rate)]
+
+        self._arrays = None
+
+    def clear(self):
+        """
+        Remove all price levels.
+        """
+        self.levels.clear()
+        self._rates.clear()
+
+        self._arrays = None
+
+    def best(self):
+        """
+        Returns the best rate.
+
+        Returns:
+            float (None if empty)
+        """
+        if not self._rates:
+            return None
+
+        return self._rates[-1] if self.descending else self._rates[0]
+
+    def arrays(self):
+        """
+        Returns rates, quantities and cumulative quantities, best rate first.
+
+        Returns:
+            tuple (ndarray, ndarray, ndarray)
+        """
+        if self._arrays is None:
+            rates = numpy.array(self._rates, dtype='f8')
+
+            if self.descending:
+                rates = rates[::-1]
+
+            quantities = numpy.fromiter(
+                (self.levels[rate] for rate in rates), dtype='f8', count=rates.size
+            )
+
+            self._arrays = (rates, quantities, numpy.cumsum(quantities))
+
+        return self._arrays
+
+class OrderBook:
+    """
+    In-memory L2 order book of a market.
+
+    Built from a snapshot then kept up to date by sequenced deltas; a delta
+    that skips a sequence number marks the book as out of sync, and every
+    delta is rejected until the next snapshot.  A sequence of 0 is unknown
+    (ie. a snapshot without one), so the next delta is not checked for a gap.
+    """
+
+    def __init__(self):
+        """
+        Create a new instance of OrderBook
+
+        Attributes:
+            bid (OrderBookSide):
+                BID price levels.
+            ask (OrderBookSide):
+                ASK price levels.
+            sequence (int):
+                Sequence number of the last applied update (0 if unknown).
+            synced (bool):
+                True from a snapshot until a delta is missed.
+        """
+        self.bid      = OrderBookSide(descending=True)
+        self.ask      = OrderBookSide()
+        self.sequence = 0
+        self.synced   = False
+
+    def copy(self):
+        """
+        Returns a copy of the order book.
+
+        Returns:
+            OrderBook
+        """
+        book = OrderBook()
+
+        book.bid      = self.bid.copy()
+        book.ask      = self.ask.copy()
+        book.sequence = self.sequence
+        book.synced   = self.synced
+
+        return book
+
+    def snapshot(self, data, sequence=0):
+        """
+        Replace all price levels.
+
+        Args:
+            data (dict):
+                Order book as returned by the API (bid, ask) or a stream
+                snapshot (bidDeltas, askDeltas).
+            sequence (int):
+                Sequence number of the snapshot (default: data sequence).
+        """
+        for side in (self.bid, self.ask):
+            side.clear()
+
+        self._update(
+            data.get('bid') or data.get('bidDeltas'),
+            data.get('ask') or data.get('askDeltas')
+        )
+
+        self.sequence = int(sequence or data.get('sequence') or 0)
+        self.synced   = True
+
+    def apply(self, data):
+        """
+        Apply an order book delta (quantity 0 removes a rate).
+
+        Args:
+            data (dict):
+                Order book delta (sequence, bidDeltas, askDeltas).
+
+        Returns:
+            bool (False if the book is out of sync)
+        """
+        if not self.synced:
+            return False
+
+        sequence = int(data.get('sequence') or 0)
+
+        # Deltas already included in the snapshot.
+        if sequence and sequence <= self.sequence:
+            return True
+
+        if sequence and self.sequence and sequence != self.sequence + 1:
+            self.synced = False
+
+            return False
+
+        self._update(data.get('bidDeltas'), data.get('askDeltas'))
+
+        self.sequence = sequence or self.sequence
+
+        return True
+
+    def best_bid(self):
+        """
+        Returns the highest BID rate.
+
+        Returns:
+            float (None if empty)
+        """
+        return self.bid.best()
+
+    def best_ask(self):
+        """
+        Returns the lowest ASK rate.
+
+        Returns:
+            float (None if empty)
+        """
+        return self.ask.best()
+
+    def depth(self, side, levels=None):
+        """
+        Returns price levels of a side, best rate first.
+
+        Args:
+            side (str):
+                bid or ask.
+            levels (int):
+                Maximum levels to return (optional).
+
+        Returns:
+            tuple (rates, quantities, cumulative quantities ndarrays)
+        """
+        return tuple(values[:levels] for values in getattr(self, side).arrays())
+
+    def liquidity(self, side, rate):
+        """
+        Returns total quantity at rates as good as or better than a rate.
+
+        Args:
+            side (str):
+                bid or ask.
+            rate (float):
+                Limit rate.
+
+        Returns:
+            float
+        """
+        rates, _, cumulative = getattr(self, side).arrays()
+
+        if side == 'bid':
+            total = numpy.searchsorted(-rates, -rate, side='right')
+        else:
+            total = numpy.searchsorted(rates, rate, side='right')
+
+        return float(cumulative[total - 1]) if total else 0.
+
+    def price_to_fill(self, trade_type, quantity):
+        """
+        Returns the rate a taker order must reach to fill a quantity.
+
+        Args:
+            trade_type (str):
+                Taker order type; BUY fills against ASK, SELL against BID.
+            quantity (float):
+                Total units to fill.
+
+        Returns:
+            float (None if the book is not deep enough)
+        """
+        rates, _, cumulative = (self.ask if trade_type == 'BUY' else self.bid).arrays()
+
+        index = int(numpy.searchsorted(cumulative, quantity, side='left'))
+
+        return float(rates[index]) if index < rates.size else None
+
+    def _update(self, bid_deltas, ask_deltas):
+        """
+        Update price levels from {quantity, rate} deltas.
+
+        Args:
+            bid_deltas (list):
+                BID changes.
+            ask_deltas (list):
+                ASK changes.
+        """
+        for side, deltas in ((self.bid, bid_deltas), (self.ask, ask_deltas)):
+            for delta in deltas or []:
+                side.update(float(delta['rate']), float(delta['quantity']))
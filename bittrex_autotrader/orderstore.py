@@ -0,0 +1,227 @@
+"""
+  bittrex_autotrader
+  Bittrex currency exchange autotrading script in a nutshell.
+
+  Copyright 2018-2020, Marc S. Brooks (https://mbrooks.info)
+  Licensed under the MIT license:
+  http://www.opensource.org/licenses/mit-license.php
+"""
+
+# Standard libraries.
+import collections
+import json
+import os
+import time
+
+# External modules.
+import numpy
+
+class OrderRecord:
+    """
+    Submitted order details.
+    """
+
+    __slots__ = ('id', 'type', 'price', 'quantity', 'created', 'outcome')
+
+    def __init__(self, order_id, trade_type, price, quantity, created=None, *, outcome=None):
+        """
+        Create a new instance of OrderRecord
+
+        Args:
+            order_id (str):
+                Order id.
+            trade_type (str):
+                BUY or SELL.
+            price (float):
+                Order limit price.
+            quantity (float):
+                Order units.
+            created (float):
+                Time the order was submitted (default: now).
+            outcome (str):
+                FILLED or CANCELLED once completed (default: None).
+        """
+        self.id       = order_id
+        self.type     = trade_type
+        self.price    = price
+        self.quantity = quantity
+        self.created  = time.time() if created is None else created
+        self.outcome  = outcome
+
+    @staticmethod
+    def from_dict(order):
+        """
+        Returns a record of an order as stored or returned by the API.
+
+        Args:
+            order (dict):
+                Order (id, type, price, quantity, created, outcome) or API
+                order (id, direction, limit, quantity, createdAt).
+
+        Returns:
+            OrderRecord
+        """
+        trade_type = order.get('direction') or ('SELL' if 'SELL' in order['type'] else 'BUY')
+
+        created = order.get('created')
+
+        if created is None and order.get('createdAt'):
+            created = numpy.datetime64(order['createdAt'].rstrip('Z'), 'ms')
+
+            created = int(created.astype('int64')) / 1000
+
+        return OrderRecord(
+            order['id'], trade_type, order.get('price', order.get('limit')), order['quantity'],
+            created, outcome=order.get('outcome')
+        )
+
+    def as_dict(self):
+        """
+        Returns the order details as a dictionary.
+
+        Returns:
+            dict
+        """
+        return {
+            'id': self.id,
+            'type': self.type,
+            'price': self.price,
+            'quantity': self.quantity,
+            'created': self.created,
+            'outcome': self.outcome
+        }
+
+class OrderStore:
+    """
+    Bounded history of the orders of a market, newest last.
+
+    The latest order of each side is indexed on insert, so lookups do not
+    scan the history.  Orders beyond the history size are dropped, or
+    appended to a spill file (one JSON line per order) if set.
+    """
+
+    def __init__(self, history=1000, spill_path=None):
+        """
+        Create a new instance of OrderStore
+
+        Args:
+            history (int):
+                Maximum orders kept in memory (default: 1000).
+            spill_path (str):
+                File to append orders dropped from the history to (optional).
+
+        Attributes:
+            history (int):
+                Maximum orders kept in memory.
+            spill_path (str):
+                File to append orders dropped from the history to.
+        """
+        self.history    = max(int(history), 1)
+        self.spill_path = spill_path
+
+        self._records = collections.deque()
+        self._latest  = {}
+        self._file    = None
+
+    def __bool__(self):
+        return bool(self._records)
+
+    def __iter__(self):
+        return iter(self._records)
+
+    def __len__(self):
+        return len(self._records)
+
+    def append(self, order):
+        """
+        Add an order as the latest.
+
+        Args:
+            order (OrderRecord|dict):
+                Order record or dictionary.
+
+        Returns:
+            OrderRecord
+        """
+        record = order if isinstance(order, OrderRecord) else OrderRecord.from_dict(order)
+
+        self._records.append(record)
+
+        self._latest[None]        = record
+        self._latest[record.type] = record
+
+        if len(self._records) > self.history:
+            self._spill(self._records.popleft())
+
+        return record
+
+    def extend(self, orders):
+        """
+        Add orders, oldest first.
+
+        Args:
+            orders (list):
+                Order records or dictionaries.
+        """
+        for order in orders:
+            self.append(order)
+
+    def pop(self):
+        """
+        Remove the latest order.
+
+        Returns:
+            OrderRecord
+        """
+        record = self._records.pop()
+
+        # Rare (order not found), so the side index is rebuilt from the history.
+        self._latest = {}
+
+        for item in self._records:
+            self._latest[None]      = item
+            self._latest[item.type] = item
+
+        return record
+
+    def last(self, trade_type=None):
+        """
+        Returns the latest order by type.
+
+        Args:
+            trade_type (str):
+                BUY or SELL (optional).
+
+        Returns:
+            OrderRecord (None if not found)
+        """
+        return self._latest.get(trade_type)
+
+    def close(self):
+        """
+        Close the spill file (reopened if another order is spilled).
+        """
+        if self._file is not None:
+            self._file.close()
+
+            self._file = None
+
+    def _spill(self, record):
+        """
+        Append an order dropped from the history to the spill file.
+
+        Args:
+            record (OrderRecord):
+                Order record.
+        """
+        if not self.spill_path:
+            return
+
+        if self._file is None:
+            os.makedirs(os.path.dirname(self.spill_path) or '.', exist_ok=True)
+
+            # pylint: disable=consider-using-with
+            self._file = open(self.spill_path, 'a', encoding='utf-8')
+
+        self._file.write(json.dumps(record.as_dict(), separators=(',', ':')) + '\n')
+        self._file.flush()
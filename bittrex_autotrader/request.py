@@ -8,30 +8,26 @@
 """
 
 # Standard libraries.
-import hashlib
-import hmac
-import json
-import sys
 import time
 
 # External modules.
 import requests
+import requests.adapters
+import urllib3.exceptions
 
-class BittrexAutoTraderRequest:
+# Package modules.
+from .api import BittrexAutoTraderApi
+
+class BittrexAutoTraderRequest(BittrexAutoTraderApi):
     """
     Bittrex API request handler.
-    """
-
-    # Bittrex API URL
-    BASE_URL = 'https://api.bittrex.com/v3'
-
-    # Total retries on failed connection.
-    CONNECT_RETRIES = 10
 
-    # Delay between failed requests.
-    CONNECT_WAIT = 5
+    Requests are sent over a pooled keep-alive session which is reused
+    across calls.  Use the instance as a context manager, or call close(),
+    to release the pooled connections.
+    """
 
-    def __init__(self, apikey, secret):
+    def __init__(self, apikey, secret, options=None):
         """
         Create a new instance of the Api
 
@@ -40,393 +36,81 @@ class BittrexAutoTraderRequest:
                 Bittrex issued API key.
             secret (str):
                 Bittrex issued API secret.
+            options (dict):
+                Dictionary of options (optional).
+
+        Options:
+            pool_connections (int):
+                Total connection pools (one per host) to cache (default: 10).
+            pool_maxsize (int):
+                Maximum connections to keep alive per host (default: 10).
+            cache (bool):
+                Cache public endpoint responses (default: False).
+            cache_size (int):
+                Maximum responses to cache (default: 256).
+            rate_limit (float):
+                Public requests per second, 0 to disable (default: 1).
+            auth_rate_limit (float):
+                Authenticated requests per second, 0 to disable (default: 1).
+            rate_burst (int):
+                Maximum requests at once per budget (default: 10).
+            retries (int):
+                Total attempts per request (default: 10).
+            retry_deadline (float):
+                Maximum seconds to spend retrying a request (default: 60).
+            connect_timeout (float):
+                Seconds to wait for a connection (default: 5).
+            read_timeout (float):
+                Seconds to wait between bytes of a response (default: 30).
 
         Attributes:
             apikey (str):
                 Bittrex issued API key.
             secret (str):
                 Bittrex issued API secret.
+            cache (ResponseCache):
+                Public endpoint response cache (None if disabled).
+            limiter (RateLimiter):
+                Request rate limiter, shared by all callers.
+            retry (RetryPolicy):
+                Failed request retry policy.
+            timeout (tuple):
+                Connect and read timeouts in seconds.
+            flight (SingleFlight):
+                Coalesces concurrent identical public requests.
+            session (requests.Session):
+                Pooled keep-alive HTTP session.
         """
-        self.apikey = apikey
-        self.secret = secret
-
-    def public_markets(self):
-        """
-        Get the open and available trading markets along with other meta data.
+        super().__init__(apikey, secret, options)
 
-        Returns:
-            list
+        options = options or {}
 
-        .. seealso:: https://bittrex.github.io/api/v3#/definitions/Market
-        """
-        return self.get('markets')
+        self.session = BittrexAutoTraderRequest._create_session(
+            int(options.get('pool_connections') or BittrexAutoTraderRequest.POOL_CONNECTIONS),
+            int(options.get('pool_maxsize') or BittrexAutoTraderRequest.POOL_MAXSIZE)
+        )
 
-    def public_currencies(self):
-        """
-        Get all supported currencies along with other meta data.
+    def __enter__(self):
+        return self
 
-        Returns:
-            list
+    def __exit__(self, *args):
+        self.close()
 
-        .. seealso:: https://bittrex.github.io/api/v3#/definitions/Currency
+    def close(self):
         """
-        return self.get('currencies')
-
-    def public_ticker(self, market_symbol):
+        Close the session and release pooled connections.
         """
-        Get the current tick values for a market.
+        self.session.close()
 
-        Args:
-            market_symbol (str):
-                String literal (ie. BTC-LTC).
-
-        Returns:
-            list
-
-        .. seealso:: https://bittrex.github.io/api/v3#/definitions/Ticker
-        """
-        return self.get(f'markets/{market_symbol}/ticker')
-
-    def public_market_summaries(self):
+    def _send(self, retry, url, values=None, headers=None, auth=False):
         """
-        Get the last 24 hour summary of all active exchanges.
-
-        Returns:
-            list
-
-        .. seealso:: https://bittrex.github.io/api/v3#/definitions/MarketSummary
-        """
-        return self.get('markets/summaries')
-
-    def public_market_summary(self, market_symbol):
-        """
-        Get the last 24 hour summary of all active exchanges.
-
-        Args:
-            market_symbol (str):
-                String literal (ie. BTC-LTC). If omitted, return all markets.
-
-        Returns:
-            list
-
-        .. seealso:: https://bittrex.github.io/api/v3#/definitions/MarketSummary
-        """
-        return self.get(f'markets/{market_symbol}/summary')
-
-    def public_market_history(self, market_symbol):
-        """
-        Get the latest trades that have occured for a specific market.
-
-        Args:
-            market_symbol (str):
-                String literal (ie. BTC-LTC). If omitted, return all markets.
-
-        Returns:
-            list
-
-        .. seealso:: https://bittrex.github.io/api/v3#/definitions/Trade
-        """
-        return self.get(f'markets/{market_symbol}/trades')
-
-    def public_order_book(self, market_symbol, depth=25):
-        """
-        Get the orderbook for a given market.
+        Send a HTTP request, retrying failed attempts.
 
         Args:
-            market_symbol (str):
-                String literal (ie. BTC-LTC). If omitted, return all markets.
-            depth (int):
-                Maximum depth to return (allowed values are [1, 25, 500])
-
-        Returns:
-            list
-
-        .. seealso:: https://bittrex.github.io/api/v3#/definitions/OrderBook
-        """
-        return self.get(f'markets/{market_symbol}/orderbook', {
-            'depth': depth
-        })
-
-    def market_buy_limit(self, market_symbol, quantity, rate, time_in_force='GOOD_TIL_CANCELLED'):
-        """
-        Send a buy order in a specific market.
-
-        Args:
-            market_symbol (str):
-                String literal (ie. BTC-LTC). If omitted, return all markets.
-            quantity (float):
-                The amount to purchase.
-            rate (float):
-                Rate at which to place the order.
-
-        Returns:
-            list
-
-        .. seealso:: https://bittrex.github.io/api/v3#/definitions/Order
-        """
-        return self.post('orders', {
-            'marketSymbol': market_symbol,
-            'direction': 'BUY',
-            'type': 'LIMIT',
-            'quantity': quantity,
-            'limit': rate,
-            'timeInForce': time_in_force
-        }, auth=True)
-
-    def market_sell_limit(self, market_symbol, quantity, rate, time_in_force='GOOD_TIL_CANCELLED'):
-        """
-        Send a sell order in a specific market.
-
-        Args:
-            market_symbol (str):
-                String literal (ie. BTC-LTC). If omitted, return all markets.
-            quantity (float):
-                The amount to sell.
-            rate: (float)
-                Rate at which to place the order.
-
-        Returns:
-            list
-
-        .. seealso:: https://bittrex.github.io/api/v3#/definitions/Order
-        """
-        return self.post('orders', {
-            'marketSymbol': market_symbol,
-            'direction': 'SELL',
-            'type': 'LIMIT',
-            'quantity': quantity,
-            'limit': rate,
-            'timeInForce': time_in_force
-        }, auth=True)
-
-    def market_cancel(self, orderid):
-        """
-        Send a cancel a buy or sell order.
-
-        Args:
-            orderid (str):
-                ID of buy or sell order.
-
-        .. seealso:: https://bittrex.github.io/api/v3#/definitions/Order
-        """
-        return self.delete(f'orders/{orderid}', auth=True)
-
-    def market_open_orders(self, market_symbol):
-        """
-        Get all orders that you currently have opened.
-
-        Args:
-            market_symbol (str):
-                String literal (ie. BTC-LTC). If omitted, return all markets.
-
-        Returns:
-            list
-
-        .. seealso:: https://bittrex.github.io/api/v3#/definitions/Order
-        """
-        return self.get('orders/open', {
-            'marketSymbol': market_symbol
-        }, auth=True)
-
-    def account_balances(self):
-        """
-        Get all balances from your account.
-
-        Returns:
-            list
-
-        .. seealso:: https://bittrex.github.io/api/v3#/definitions/Balance
-        """
-        return self.get('balances', auth=True)
-
-    def account_balance(self, currency_symbol):
-        """
-        Get the balance from your account for a specific currency.
-
-        Args:
-            currency_symbol (str):
-                String literal (ie. BTC). If omitted, return all currency.
-
-        Returns:
-            list
-
-        .. seealso:: https://bittrex.github.io/api/v3#/definitions/Balance
-        """
-        return self.get(f'balances/{currency_symbol}', auth=True)
-
-    def account_deposit_address(self, currency_symbol):
-        """
-        Get existing, or generate new address for a specific currency.
-
-        Args:
-            currency_symbol (str):
-                String literal (ie. BTC). If omitted, return all currency.
-
-        Returns:
-            list
-
-        .. seealso:: https://bittrex.github.io/api/v3#/definitions/Address
-        """
-        return self.get(f'addresses/{currency_symbol}', auth=True)
-
-    def account_withdraw(self, currency_symbol, quantity, crypto_address, paymentid):
-        """
-        Send request to withdraw funds from your account.
-
-        Args:
-            currency_symbol (str):
-                String literal (ie. BTC). If omitted, return all currency.
-            quantity (str):
-                The amount to withdrawl.
-            crypto_address (str):
-                The address where to send the funds.
-            paymentid (str):
-                CryptoNotes/BitShareX/Nxt field (memo/paymentid optional).
-
-        Returns:
-            list
-
-        .. seealso:: https://bittrex.github.io/api/v3#/definitions/Withdrawal
-        """
-        return self.post('withdrawals', {
-            'currencySymbol': currency_symbol,
-            'quantity': quantity,
-            'cryptoAddress': crypto_address,
-            'cryptoAddressTag': paymentid
-        }, auth=True)
-
-    def account_order(self, orderid):
-        """
-        Get a single order by ID.
-
-        Args:
-            orderid (str):
-                ID of buy or sell order.
-
-        Return:
-            list
-
-        .. seealso:: https://bittrex.github.io/api/v3#/definitions/Order
-        """
-        return self.get(f'orders/{orderid}', auth=True)
-
-    def account_order_history(self, market_symbol):
-        """
-        Get order history.
-
-        Args:
-            market_symbol (str):
-                String literal (ie. BTC-LTC). If omitted, return all markets.
-
-        Returns:
-            list
-
-        .. seealso:: https://bittrex.github.io/api/v3#/definitions/Order
-        """
-        return self.get('orders/closed', {
-            'marketSymbol': market_symbol
-        }, auth=True)
-
-    def account_deposit_history(self, currency_symbol):
-        """
-        Get deposit history.
-
-        Args:
-            currency_symbol (str):
-                String literal (ie. BTC). If omitted, return all currency.
-
-        Returns:
-            list
-
-        .. seealso:: https://bittrex.github.io/api/v3#/definitions/Withdrawal
-        """
-        return self.get('deposits/closed', {
-            'currencySymbol': currency_symbol
-        }, auth=True)
-
-    def account_withdrawl_history(self, currency_symbol):
-        """
-        Get withdrawl history.
-
-        Args:
-            currency_symbol (str):
-                String literal (ie. BTC). If omitted, return all currency.
-
-        Returns:
-            list
-
-        .. seealso:: https://bittrex.github.io/api/v3#/definitions/Withdrawal
-        """
-        return self.get('withdrawals/closed', {
-            'currencySymbol': currency_symbol
-        }, auth=True)
-
-    def get(self, uri, params=None, headers=None, auth=False):
-        """
-        Construct and send a HTTP GET request to the Bittrex API.
-
-        Args:
-            uri (str):
-                URI that references an API service.
-            params (dict):
-                Dictionary that contains HTTP request name/value parameters (optional).
-            headers (dict):
-                Dictionary that contains HTTP request header key/values (optional).
-            auth (bool):
-                Authenticate with a signed request (default: False).
-
-        Returns:
-            list
-        """
-        return self.send_request('GET', uri, params, headers, auth)
-
-    def post(self, uri, body=None, headers=None, auth=False):
-        """
-        Construct and send a HTTP POST request to the Bittrex API.
-
-        Args:
-            uri (str):
-                URI that references an API service.
-            body (dict):
-                Dictionary that contains HTTP request body key/values (optional).
-            headers (dict):
-                Dictionary that contains HTTP request header key/values (optional).
-            auth (bool):
-                Authenticate with a signed request (default: False).
-
-        Returns:
-            list
-        """
-        return self.send_request('POST', uri, body, headers, auth)
-
-    def delete(self, uri, body=None, headers=None, auth=False):
-        """
-        Construct and send a HTTP DELETE request to the Bittrex API.
-
-        Args:
-            uri (str):
-                URI that references an API service.
-            body (dict):
-                Dictionary that contains HTTP request body key/values (optional).
-            headers (dict):
-                Dictionary that contains HTTP request header key/values (optional).
-            auth (bool):
-                Authenticate with a signed request (default: False).
-
-        Returns:
-            list
-        """
-        return self.send_request('DELETE', uri, body, headers, auth)
-
-    def send_request(self, method, uri, values=None, headers=None, auth=False):
-        """
-        Construct and send a HTTP request to the Bittrex API.
-
-        Args:
-            method (str):
-                HTTP request method (e.g. GET, POST, DELETE).
-            uri (str):
-                URI that references an API service.
+            retry (RetryState):
+                Retry state of the request.
+            url (str):
+                Request URL.
             values (dict):
                 Dictionary that contains request values (optional).
             headers (dict):
@@ -437,118 +121,107 @@ class BittrexAutoTraderRequest:
         Returns:
             list
         """
-        url = BittrexAutoTraderRequest.BASE_URL + '/' + uri
-
-        data = ''
-
-        if method == 'GET':
-            if values:
-                url += BittrexAutoTraderRequest._create_query_str(values)
-        else:
-            data = json.dumps(values)
-
         req = None
 
-        for _ in range(BittrexAutoTraderRequest.CONNECT_RETRIES):
-
-            # Sign authentication requests.
-            if auth is True:
-                timestamp = str(round(time.time() * 1000))
-
-                content_hash = BittrexAutoTraderRequest._hash_content(data)
+        for step in self._attempts(retry, url, values, headers, auth):
 
-                signature = BittrexAutoTraderRequest._sign_request(
-                    self.secret, method, url, timestamp, content_hash
-                )
-
-                if headers is None:
-                    headers = {}
+            # Wait for the rate limiter or between attempts.
+            if not isinstance(step, tuple):
+                time.sleep(step)
+                continue
 
-                headers['Api-Key']          = self.apikey
-                headers['Api-Timestamp']    = timestamp
-                headers['Api-Signature']    = signature
-                headers['Api-Content-Hash'] = content_hash
+            headers, timeout = step
 
             try:
-                if method == 'GET':
-                    req = requests.get(url, headers=headers)
+                if retry.method == 'GET':
+                    req = self.session.get(url, headers=headers, timeout=timeout)
                 else:
-                    req = requests.request(
-                        method, url, json=values, headers=headers
+                    req = self.session.request(
+                        retry.method, url, json=values, headers=headers, timeout=timeout
                     )
 
-            except requests.exceptions.ConnectionError:
-                time.sleep(BittrexAutoTraderRequest.CONNECT_WAIT)
-            else:
-                break
-
-        res = req.json()
-
-        if res is None:
-            print('Script failure: Connection timeout', file=sys.stderr)
+            # Any client failure (ie. ChunkedEncodingError) is a transport error.
+            except requests.exceptions.RequestException as err:
+                req = None
 
-            sys.exit(1)
-
-        if req.ok is False:
-            print("Bittex response: %s" % res['code'], file=sys.stderr)
+                retry.record(
+                    error=type(err).__name__, sent=BittrexAutoTraderRequest._request_sent(err)
+                )
 
-            sys.exit(1)
+            else:
+                retry.record(req.status_code, retry_after=req.headers.get('Retry-After'))
 
-        # Return list of dicts.
-        return res
+        return BittrexAutoTraderRequest._parse_response(
+            req is not None and req.ok, BittrexAutoTraderRequest._decode_response(req), retry
+        )
 
     @staticmethod
-    def _create_query_str(data):
+    def _request_sent(err):
         """
-        Returns a query string of name/value pairs.
+        Returns True if a failed request may have been sent.
+
+        Only a connect timeout or a failure to open a connection ensure that
+        nothing was sent; a dropped connection (ie. ProtocolError,
+        RemoteDisconnected) or read timeout may follow a complete request.
 
         Args:
-            data (dict):
-                Dictionary that contains request data.
+            err (requests.exceptions.RequestException):
+                Transport error.
 
         Returns:
-            str
+            bool
         """
-        params = []
-        for name, value in data.items():
-            params.append(name + '=' + str(value))
+        if isinstance(err, requests.exceptions.ConnectTimeout):
+            return False
+
+        # Connection errors wrap urllib3 MaxRetryError(reason=...) or the error itself.
+        reason = err.args[0] if err.args else None
+        reason = getattr(reason, 'reason', reason)
 
-        return '?' + '&'.join(params)
+        return not isinstance(reason, urllib3.exceptions.NewConnectionError)
 
     @staticmethod
-    def _hash_content(data):
+    def _decode_response(req):
         """
-        Returns hex-encoded SHA-512 hash for the given data.
+        Returns the decoded JSON response body.
 
         Args:
-            data (dict):
-                Dictionary that contains request data.
+            req (requests.Response):
+                Response of the last attempt (None if no response).
 
         Returns:
-            str
+            list|dict (None if no response)
         """
-        return hashlib.sha512(str(data).encode('utf-8')).hexdigest()
+        if req is None:
+            return None
+
+        try:
+            return req.json()
+
+        except ValueError:
+            return {'code': str(req.status_code)}
 
     @staticmethod
-    def _sign_request(secret, method, url, timestamp, content_hash=None):
+    def _create_session(pool_connections, pool_maxsize):
         """
-        Returns signed request using the HMAC SHA-512 algorithm.
+        Returns a keep-alive session with pooled HTTP(S) connections.
 
         Args:
-            secret (str):
-                Bittrex issued API secret.
-            method (str):
-                HTTP request method (e.g. GET, POST, DELETE).
-            url (str):
-                Request URL (including query string).
-            timestamp (str):
-                Epoch timestamp in milliseconds.
-            content_hash (str):
-                Hex-encoded SHA-512 hash of the request body (optional).
+            pool_connections (int):
+                Total connection pools (one per host) to cache.
+            pool_maxsize (int):
+                Maximum connections to keep alive per host.
 
         Returns:
-            str
+            requests.Session
         """
-        message = f'{timestamp}{url}{method}{content_hash}'
+        adapter = requests.adapters.HTTPAdapter(
+            pool_connections=pool_connections,
+            pool_maxsize=pool_maxsize
+        )
+
+        session = requests.Session()
+        session.mount('https://', adapter)
+        session.mount('http://', adapter)
 
-        return hmac.new(secret.encode('utf-8'), message.encode('utf-8'), hashlib.sha512).hexdigest()
+        return session
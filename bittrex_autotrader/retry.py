@@ -0,0 +1,294 @@
+"""
+  bittrex_autotrader
+  Bittrex currency exchange autotrading script in a nutshell.
+
+  Copyright 2018-2020, Marc S. Brooks (https://mbrooks.info)
+  Licensed under the MIT license:
+  http://www.opensource.org/licenses/mit-license.php
+"""
+
+# Standard libraries.
+import collections
+import random
+import time
+
+class RetryPolicy:
+    """
+    Classifies failed requests and schedules retries with exponential
+    backoff (full jitter), bounded by a total attempts and a deadline.
+
+    Requests that failed before being sent (ie. connection refused, connect
+    timeout) are always retried.  POST requests that may have been sent
+    (read timeouts, dropped connections, server errors) are not retried, as
+    they may have been executed, while rate limited responses (429) are
+    retried after any Retry-After delay.
+    """
+
+    # Server errors retried for idempotent requests.
+    SERVER_ERRORS = (500, 502, 503, 504)
+
+    # Rate limited response status.
+    TOO_MANY_REQUESTS = 429
+
+    def __init__(self, retries=10, backoff=0.1, max_backoff=5, deadline=60):
+        """
+        Create a new instance of RetryPolicy
+
+        Args:
+            retries (int):
+                Total attempts per request (default: 10).
+            backoff (float):
+                Initial retry delay in seconds (default: 0.1).
+            max_backoff (float):
+                Maximum retry delay in seconds (default: 5).
+            deadline (float):
+                Maximum seconds to spend on a request, 0 to disable (default: 60).
+
+        Attributes:
+            retries (int):
+                Total attempts per request.
+            backoff (float):
+                Initial retry delay in seconds.
+            max_backoff (float):
+                Maximum retry delay in seconds.
+            deadline (float):
+                Maximum seconds to spend on a request (None if unlimited).
+            history (collections.deque):
+                Timing of the most recent attempts.
+        """
+        deadline = float(deadline or 0)
+
+        self.retries     = max(int(retries), 1)
+        self.backoff     = float(backoff)
+        self.max_backoff = float(max_backoff)
+        self.deadline    = deadline if deadline > 0 else None
+        self.history     = collections.deque(maxlen=100)
+
+    def start(self, method, uri, deadline=None):
+        """
+        Returns the retry state of a new request.
+
+        Args:
+            method (str):
+                HTTP request method (e.g. GET, POST, DELETE).
+            uri (str):
+                URI that references an API service.
+            deadline (float):
+                Maximum seconds to spend on the request (default: policy deadline).
+
+        Returns:
+            RetryState
+        """
+        return RetryState(self, method, uri, self.deadline if deadline is None else deadline)
+
+    def retryable(self, method, status=None, sent=False):
+        """
+        Returns True if an attempt can be retried.
+
+        Args:
+            method (str):
+                HTTP request method (e.g. GET, POST, DELETE).
+            status (int):
+                Response HTTP status (None if no response).
+            sent (bool):
+                Request may have been sent without a response (ie. read
+                timeout, connection dropped).
+
+        Returns:
+            bool
+        """
+        if status == RetryPolicy.TOO_MANY_REQUESTS:
+            return True
+
+        # Requests that may have been executed are not repeated.
+        if method == 'POST' and (sent or status):
+            return False
+
+        return status is None or status in RetryPolicy.SERVER_ERRORS
+
+    def delay(self, attempt, retry_after=None):
+        """
+        Returns seconds to wait before the next attempt.
+
+        Args:
+            attempt (int):
+                Total attempts made.
+            retry_after (str):
+                Retry-After response header (optional).
+
+        Returns:
+            float
+        """
+        seconds = random.uniform(
+            0, min(self.max_backoff, self.backoff * 2 ** (attempt - 1))
+        )
+
+        try:
+            return max(seconds, float(retry_after))
+
+        except (TypeError, ValueError):
+            return seconds
+
+class RetryState:
+    """
+    Attempts and timing of a single request.
+    """
+
+    def __init__(self, policy, method, uri, deadline=None):
+        """
+        Create a new instance of RetryState
+
+        Args:
+            policy (RetryPolicy):
+                Retry policy.
+            method (str):
+                HTTP request method (e.g. GET, POST, DELETE).
+            uri (str):
+                URI that references an API service.
+            deadline (float):
+                Maximum seconds to spend on the request (optional).
+
+        Attributes:
+            method (str):
+                HTTP request method.
+            uri (str):
+                URI that references an API service.
+            deadline (float):
+                Maximum seconds to spend on the request (None if unlimited).
+            attempts (list):
+                Status (or error) and seconds of each attempt.
+            backoff (float):
+                Seconds to wait before the next attempt (None if complete).
+        """
+        self.method   = method
+        self.uri      = uri
+        self.deadline = float(deadline) if deadline else None
+        self.attempts = []
+        self.backoff  = None
+
+        self._policy  = policy
+        self._started = time.monotonic()
+        self._attempt = self._started
+
+    def begin(self):
+        """
+        Mark the start of an attempt.
+        """
+        self._attempt = time.monotonic()
+
+    def record(self, status=None, error=None, sent=False, retry_after=None):
+        """
+        Record an attempt, returns seconds to wait before retrying.
+
+        Args:
+            status (int):
+                Response HTTP status (None if no response).
+            error (str):
+                Transport error name (optional).
+            sent (bool):
+                Request may have been sent without a response (ie. read
+                timeout, connection dropped).
+            retry_after (str):
+                Retry-After response header (optional).
+
+        Returns:
+            float (None if the request is complete or must not be retried)
+        """
+        self._record(status or error)
+
+        self.backoff = self._backoff(status, sent, retry_after)
+
+        return self.backoff
+
+    def elapsed(self):
+        """
+        Returns seconds since the request started.
+
+        Returns:
+            float
+        """
+        return time.monotonic() - self._started
+
+    def status(self):
+        """
+        Returns the response HTTP status of the last attempt.
+
+        Returns:
+            int (None if no response)
+        """
+        result = self.attempts[-1]['result'] if self.attempts else None
+
+        return result if isinstance(result, int) else None
+
+    def error(self):
+        """
+        Returns the transport error name of the last attempt.
+
+        Returns:
+            str (None if a response was received)
+        """
+        result = self.attempts[-1]['result'] if self.attempts else None
+
+        return result if isinstance(result, str) else None
+
+    def remaining(self):
+        """
+        Returns seconds left before the deadline.
+
+        Returns:
+            float (None if unlimited)
+        """
+        if self.deadline is None:
+            return None
+
+        return max(self.deadline - self.elapsed(), 0.001)
+
+    def _backoff(self, status=None, sent=False, retry_after=None):
+        """
+        Returns seconds to wait before retrying the recorded attempt.
+
+        Args:
+            status (int):
+                Response HTTP status (None if no response).
+            sent (bool):
+                Request may have been sent without a response.
+            retry_after (str):
+                Retry-After response header (optional).
+
+        Returns:
+            float (None if the request is complete or must not be retried)
+        """
+        policy = self._policy
+
+        if not policy.retryable(self.method, status, sent) or \
+                len(self.attempts) >= policy.retries:
+            return None
+
+        seconds = policy.delay(len(self.attempts), retry_after)
+
+        # Do not start an attempt that would begin past the deadline.
+        if self.deadline is not None and \
+                self.elapsed() + seconds >= self.deadline:
+            return None
+
+        return seconds
+
+    def _record(self, result):
+        """
+        Record the result and duration of the current attempt.
+
+        Args:
+            result (int|str):
+                Response HTTP status or transport error name.
+        """
+        attempt = {
+            'method': self.method,
+            'uri': self.uri,
+            'attempt': len(self.attempts) + 1,
+            'result': result,
+            'seconds': round(time.monotonic() - self._attempt, 6)
+        }
+
+        self.attempts.append(attempt)
+
+        self._policy.history.append(attempt)
@@ -0,0 +1,181 @@
+"""
+  bittrex_autotrader
+  Bittrex currency exchange autotrading script in a nutshell.
+
+  Copyright 2018-2020, Marc S. Brooks (https://mbrooks.info)
+  Licensed under the MIT license:
+  http://www.opensource.org/licenses/mit-license.php
+"""
+
+# Standard libraries.
+import bisect
+import threading
+import time
+
+class PollScheduler:
+    """
+    Adaptive order status polling, shared by the traders of many markets.
+
+    Orders near the market (or partly filled) are polled every min_delay
+    seconds, orders far from the market are polled with an exponential
+    backoff up to max_delay.  Orders are polled every max_delay seconds
+    while the market rate is unknown.  Polls requested from the API are
+    spread so that no more than budget polls are made per minute; polls
+    read from a shared snapshot are not counted.
+    """
+
+    # Relative distance from the market rate an order is considered near.
+    NEAR = 0.0025
+
+    def __init__(self, min_delay=2, max_delay=30, budget=30):
+        """
+        Create a new instance of PollScheduler
+
+        Args:
+            min_delay (float):
+                Seconds between polls of orders near the market (default: 2).
+            max_delay (float):
+                Maximum seconds between polls (default: 30).
+            budget (float):
+                Maximum polls per minute across markets, 0 to disable (default: 30).
+
+        Attributes:
+            min_delay (float):
+                Seconds between polls of orders near the market.
+            max_delay (float):
+                Maximum seconds between polls.
+            interval (float):
+                Minimum seconds between polls across markets.
+            polls (int):
+                Total polls scheduled.
+            deferred (int):
+                Total polls delayed by the budget.
+        """
+        self.min_delay = float(min_delay)
+        self.max_delay = max(float(max_delay), self.min_delay)
+        self.interval  = 60 / float(budget) if float(budget) else 0
+        self.polls     = 0
+        self.deferred  = 0
+
+        self._backoff = {}
+        self._slots   = []
+        self._lock    = threading.Lock()
+
+    def delay(self, order, ticker=None, cached=False):
+        """
+        Returns seconds to wait before the next status poll of an open order.
+
+        Args:
+            order (dict):
+                Order as returned by the API.
+            ticker (dict):
+                Current tick values of the order market (optional).
+            cached (bool):
+                The poll reads a shared snapshot, not counted against the
+                budget (default: False).
+
+        Returns:
+            float
+        """
+        filled   = float(order.get('fillQuantity') or 0) > 0
+        distance = PollScheduler._distance(order, ticker)
+
+        with self._lock:
+
+            # Without a market rate, poll as if the order were far from it.
+            if not filled and distance == float('inf'):
+                seconds = self.max_delay
+
+            else:
+                near = filled or distance <= PollScheduler.NEAR
+
+                backoff = 0 if near else self._backoff.get(order['id'], 0)
+
+                self._backoff[order['id']] = backoff + 1 if not near else 0
+
+                seconds = min(self.min_delay * 2 ** backoff, self.max_delay)
+
+            self.polls += 1
+
+            return seconds if cached else self._reserve(seconds)
+
+    def forget(self, order_id):
+        """
+        Remove the backoff state of a completed order.
+
+        Args:
+            order_id (str):
+                Order id.
+        """
+        with self._lock:
+            self._backoff.pop(order_id, None)
+
+    def stats(self):
+        """
+        Returns poll counters.
+
+        Returns:
+            dict
+        """
+        return {
+            'polls': self.polls,
+            'deferred': self.deferred
+        }
+
+    def _reserve(self, seconds):
+        """
+        Reserve the first poll slot at least interval seconds from the others.
+
+        Args:
+            seconds (float):
+                Requested seconds before the poll.
+
+        Returns:
+            float (seconds before the reserved slot)
+        """
+        now = time.monotonic()
+        due = now + seconds
+
+        if not self.interval:
+            return seconds
+
+        # Slots are sorted, so a single pass moves the poll past every conflict.
+        self._slots = [slot for slot in self._slots if slot > now - self.interval]
+
+        for slot in self._slots:
+            if due - self.interval < slot < due + self.interval:
+                due = slot + self.interval
+
+        if due > now + seconds:
+            self.deferred += 1
+
+        bisect.insort(self._slots, due)
+
+        return due - now
+
+    @staticmethod
+    def _distance(order, ticker):
+        """
+        Returns the relative distance of the market from the order limit.
+
+        Args:
+            order (dict):
+                Order as returned by the API.
+            ticker (dict):
+                Current tick values of the order market (optional).
+
+        Returns:
+            float (0 if the market reached the limit, inf if unknown)
+        """
+        if not ticker or not order.get('limit'):
+            return float('inf')
+
+        limit = float(order['limit'])
+
+        # BUY fills against the ASK, SELL against the BID.
+        if order.get('direction') == 'BUY':
+            distance = float(ticker['askRate']) - limit
+        else:
+            distance = limit - float(ticker['bidRate'])
+
+        return max(distance / limit, 0)
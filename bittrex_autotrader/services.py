@@ -0,0 +1,133 @@
+"""
+  bittrex_autotrader
+  Bittrex currency exchange autotrading script in a nutshell.
+
+  Copyright 2018-2020, Marc S. Brooks (https://mbrooks.info)
+  Licensed under the MIT license:
+  http://www.opensource.org/licenses/mit-license.php
+"""
+
+# Package modules.
+from .async_request import AsyncBittrexAutoTraderRequest, AsyncBittrexAutoTraderRunner
+from .journal       import OrderJournal
+from .openorders    import OpenOrders
+from .request       import BittrexAutoTraderRequest
+from .scheduler     import PollScheduler
+from .stream        import StreamClient
+from .tickers       import MarketTickers
+
+class TraderServices:
+    """
+    API client, polling schedule, stream and order journal of a trader,
+    shared by the traders of many markets when run from a single process.
+
+    Only traders of many markets share a ticker snapshot and open orders;
+    a single market requests its own ticker and order status.
+    """
+
+    def __init__(self, options, api_req=None, markets=None, on_order=None):
+        """
+        Create a new instance of TraderServices
+
+        Args:
+            options (dict):
+                Dictionary of options.
+            api_req (BittrexAutoTraderRequest):
+                Instance of BittrexAutoTraderRequest, used for every request
+                (optional).
+            markets (list):
+                String literals for the markets sharing the services (optional).
+            on_order (callable):
+                Called with each streamed order update (optional).
+
+        Attributes:
+            api_req (BittrexAutoTraderRequest):
+                Instance of BittrexAutoTraderRequest.
+            async_req (AsyncBittrexAutoTraderRunner):
+                Requests made at the same time (None if api_req is given).
+            scheduler (PollScheduler):
+                Order status polling schedule.
+            tickers (MarketTickers):
+                Shared ticker snapshot (None to request the market ticker).
+            open_orders (OpenOrders):
+                Shared open orders (None to request the order status).
+            stream (StreamClient):
+                Market data and order update stream (optional).
+            journal (OrderJournal):
+                Order journal (optional).
+        """
+        self.api_req = api_req or BittrexAutoTraderRequest(
+            options['apikey'], options['secret'], options
+        )
+
+        self.async_req = None if api_req else TraderServices._async_req(self.api_req, options)
+
+        self.scheduler = PollScheduler(
+            options.get('poll_min') or 2,
+            options.get('delay') or 30,
+            options.get('poll_budget') if options.get('poll_budget') is not None else 30
+        )
+
+        # Refreshed at most once per poll cycle, by the engine.
+        self.tickers = MarketTickers(self.api_req, self.scheduler.min_delay) \
+            if markets else None
+
+        self.open_orders = OpenOrders(self.api_req, self.scheduler.min_delay) \
+            if markets else None
+
+        self.stream = StreamClient(
+            options['stream'], markets or [options['market']], on_order=on_order
+        ) if options.get('stream') else None
+
+        self.journal = OrderJournal(
+            options['journal'], history=options.get('order_history') or 1000
+        ) if options.get('journal') else None
+
+    def refresh(self):
+        """
+        Refresh the shared ticker snapshot and open orders, if older than a
+        poll cycle.
+        """
+        if self.tickers:
+            self.tickers.latest()
+
+        if self.open_orders:
+            self.open_orders.latest()
+
+    def close(self):
+        """
+        Close the API clients, stream and order journal.
+        """
+        self.api_req.close()
+
+        if self.async_req:
+            self.async_req.close()
+
+        if self.stream:
+            self.stream.close()
+
+        if self.journal:
+            self.journal.close()
+
+    @staticmethod
+    def _async_req(api_req, options):
+        """
+        Returns a runner of asyncio requests that share the rate limits, cache
+        and retry policy of the synchronous client.
+
+        Args:
+            api_req (BittrexAutoTraderRequest):
+                Instance of BittrexAutoTraderRequest.
+            options (dict):
+                Dictionary of options.
+
+        Returns:
+            AsyncBittrexAutoTraderRunner
+        """
+        async_req = AsyncBittrexAutoTraderRequest(options['apikey'], options['secret'], options)
+
+        async_req.limiter = api_req.limiter
+        async_req.cache   = api_req.cache
+        async_req.retry   = api_req.retry
+
+        return AsyncBittrexAutoTraderRunner(async_req)
@@ -0,0 +1,439 @@
+"""
+  bittrex_autotrader
+  Bittrex currency exchange autotrading script in a nutshell.
+
+  Copyright 2018-2020, Marc S. Brooks (https://mbrooks.info)
+  Licensed under the MIT license:
+  http://www.opensource.org/licenses/mit-license.php
+"""
+
+# Standard libraries.
+import collections
+import json
+import socket
+import sys
+import threading
+import time
+
+# Package modules.
+from .orderbook import OrderBook
+
+class StreamClient:
+    """
+    Push-based market data and order update consumer.
+
+    Connects to a stream of newline-delimited JSON messages, subscribes to
+    the trade, order book and order channels of its markets, and keeps a
+    trade tape and order book per market plus the latest state of each
+    order.  Messages carry the Bittrex v3 websocket payloads:
+
+        {"channel": "trade_BTC-LTC", "data": {"marketSymbol": ..., "deltas": [...]}}
+        {"channel": "orderbook_BTC-LTC_25", "data": {"bidDeltas": [...], "askDeltas": [...]}}
+        {"channel": "order", "data": {"sequence": ..., "delta": {...}}}
+
+    Order book snapshots, sent on subscribe, are marked "snapshot": true.
+
+    The connection is re-established (with backoff) if it is lost.  One
+    client can be shared by the traders of many markets.
+    """
+
+    # Maximum delay between reconnection attempts.
+    RECONNECT_WAIT = 30
+
+    def __init__(self, address, markets, depth=25, on_order=None):
+        """
+        Create a new instance of StreamClient
+
+        Args:
+            address (str):
+                Stream server address (ie. localhost:8765).
+            markets (list):
+                String literals for the markets (ie. BTC-LTC).
+            depth (int):
+                Order book depth to subscribe to (default: 25).
+            on_order (callable):
+                Called with each order update, from the stream thread (optional).
+
+        Attributes:
+            address (tuple):
+                Stream server host and port.
+            depth (int):
+                Order book depth.
+            orders (OrderUpdates):
+                Latest order states.
+            connected (threading.Event):
+                Set while subscribed to the stream.
+        """
+        host, port = address.rsplit(':', 1)
+
+        self.address   = (host, int(port))
+        self.depth     = int(depth)
+        self.orders    = OrderUpdates(on_order)
+        self.connected = threading.Event()
+
+        self._feeds  = {market: _MarketFeed() for market in markets}
+        self._socket = None
+        self._thread = None
+        self._closed = False
+
+    @property
+    def markets(self):
+        """
+        Returns the markets subscribed to.
+
+        Returns:
+            list
+        """
+        return list(self._feeds)
+
+    def start(self):
+        """
+        Connect and consume the stream in a background thread.
+
+        Returns:
+            StreamClient
+        """
+        if self._thread is None:
+            self._thread = threading.Thread(target=self._run, daemon=True)
+            self._thread.start()
+
+        return self
+
+    def close(self):
+        """
+        Disconnect from the stream.
+        """
+        self._closed = True
+
+        if self._socket is not None:
+            try:
+                self._socket.shutdown(socket.SHUT_RDWR)
+
+            except OSError:
+                pass
+
+    def channels(self):
+        """
+        Returns channel names to subscribe to.
+
+        Returns:
+            list
+        """
+        channels = ['order']
+
+        for market in self._feeds:
+            channels.append(f'trade_{market}')
+            channels.append(f'orderbook_{market}_{self.depth}')
+
+        return channels
+
+    def trades(self, market):
+        """
+        Returns trades received since the last call, newest first (as the API).
+
+        Args:
+            market (str):
+                String literal for the market (ie. BTC-LTC).
+
+        Returns:
+            list
+        """
+        return self._feeds[market].trades()
+
+    def book(self, market):
+        """
+        Returns a copy of the order book of a market.
+
+        Args:
+            market (str):
+                String literal for the market (ie. BTC-LTC).
+
+        Returns:
+            OrderBook (None until the order book is in sync)
+        """
+        return self._feeds[market].book_copy()
+
+    def ticker(self, market):
+        """
+        Returns the current tick values of a market from its order book.
+
+        Args:
+            market (str):
+                String literal for the market (ie. BTC-LTC).
+
+        Returns:
+            dict (None until the order book and a trade are received)
+        """
+        rates = self._feeds[market].rates()
+
+        if None in rates:
+            return None
+
+        return {
+            'symbol': market,
+            'bidRate': rates[0],
+            'askRate': rates[1],
+            'lastTradeRate': rates[2]
+        }
+
+    def _run(self):
+        """
+        Consume the stream, reconnect when the connection is lost.
+        """
+        wait = 1
+
+        while not self._closed:
+            try:
+                with socket.create_connection(self.address) as sock:
+                    self._socket = sock
+
+                    self._consume(sock)
+
+                    wait = 1
+
+            except OSError:
+                pass
+
+            # Reconnect, rather than end the thread, on anything unexpected.
+            except Exception as error: # pylint: disable=broad-except
+                print(f'Stream {type(error).__name__}: {error}', file=sys.stderr)
+
+            finally:
+                self._socket = None
+                self.connected.clear()
+
+            if not self._closed:
+                time.sleep(wait)
+
+                wait = min(wait * 2, StreamClient.RECONNECT_WAIT)
+
+    def _consume(self, sock):
+        """
+        Subscribe to the market channels and dispatch messages until disconnected.
+
+        Args:
+            sock (socket.socket):
+                Connected stream socket.
+        """
+        # Order books are rebuilt from the snapshot sent on subscribe.
+        for feed in self._feeds.values():
+            feed.reset()
+
+        sock.sendall(json.dumps({'subscribe': self.channels()}).encode() + b'\n')
+
+        self.connected.set()
+
+        with sock.makefile('r', encoding='utf-8') as lines:
+            for line in lines:
+                if not line.strip():
+                    continue
+
+                # Skip a malformed message (or a failing order callback).
+                try:
+                    self._dispatch(json.loads(line))
+
+                except Exception as error: # pylint: disable=broad-except
+                    print(f'Stream {type(error).__name__}: {error}', file=sys.stderr)
+
+    def _dispatch(self, message):
+        """
+        Apply a stream message.
+
+        Args:
+            message (dict):
+                Channel name and payload.
+        """
+        channel = message['channel']
+        data    = message['data']
+
+        if channel == 'order':
+            self.orders.update(data['delta'])
+
+        elif channel.startswith('trade_'):
+            self._feeds[data['marketSymbol']].add_trades(data['deltas'])
+
+        # Resubscribe for a new snapshot when a delta is missed.
+        elif channel.startswith('orderbook_'):
+            if not self._feeds[data['marketSymbol']].apply_book(data):
+                self._socket.shutdown(socket.SHUT_RDWR)
+
+class OrderUpdates:
+    """
+    Latest state of the orders reported by a stream, and the threads waiting
+    for them to complete.
+    """
+
+    def __init__(self, on_order=None):
+        """
+        Create a new instance of OrderUpdates
+
+        Args:
+            on_order (callable):
+                Called with each order update (optional).
+
+        Attributes:
+            on_order (callable):
+                Called with each order update (optional).
+        """
+        self.on_order = on_order
+
+        self._orders  = {}
+        self._updated = threading.Condition()
+
+    def update(self, order):
+        """
+        Store the latest state of an order and wake waiting threads.
+
+        Args:
+            order (dict):
+                Order in the API format.
+        """
+        with self._updated:
+            self._orders[order['id']] = order
+
+            self._updated.notify_all()
+
+        if self.on_order:
+            self.on_order(order)
+
+    def wait(self, order_id, timeout=None):
+        """
+        Block until an order is no longer open.
+
+        Args:
+            order_id (str):
+                Order id.
+            timeout (float):
+                Maximum seconds to wait (optional).
+
+        Returns:
+            dict (latest order state, None if still open on timeout)
+        """
+        def closed():
+            order = self._orders.get(order_id)
+
+            return order if order and order['status'] != 'OPEN' else None
+
+        with self._updated:
+            return self._updated.wait_for(closed, timeout)
+
+    def closed(self, order_id):
+        """
+        Returns the final state of an order, once reported no longer open.
+
+        Args:
+            order_id (str):
+                Order id.
+
+        Returns:
+            dict (None if open or not reported)
+        """
+        with self._updated:
+            order = self._orders.get(order_id)
+
+            if order is None or order['status'] == 'OPEN':
+                return None
+
+            del self._orders[order_id]
+
+        return order
+
+class _MarketFeed:
+    """
+    Trade tape, order book and last trade rate of a streamed market.
+    """
+
+    # Maximum trades kept per market tape.
+    TAPE_SIZE = 1000
+
+    def __init__(self):
+        """
+        Create a new instance of _MarketFeed
+
+        Attributes:
+            book (OrderBook):
+                Order book, in sync once a snapshot is received.
+            tape (collections.deque):
+                Trades received since last read (oldest first).
+            rate (float):
+                Last trade rate (None until a trade is received).
+        """
+        self.book = OrderBook()
+        self.tape = collections.deque(maxlen=_MarketFeed.TAPE_SIZE)
+        self.rate = None
+
+        self._lock = threading.Lock()
+
+    def reset(self):
+        """
+        Discard the order book, rebuilt from the next snapshot.
+        """
+        with self._lock:
+            self.book = OrderBook()
+
+    def add_trades(self, trades):
+        """
+        Add trades to the tape (oldest first).
+
+        Args:
+            trades (list):
+                Trades in the API format.
+        """
+        with self._lock:
+            self.tape.extend(trades)
+
+            if trades:
+                self.rate = float(trades[-1]['rate'])
+
+    def apply_book(self, data):
+        """
+        Apply an order book snapshot, or a delta once in sync.
+
+        Args:
+            data (dict):
+                Sequence number, BID and ASK deltas (snapshot if marked).
+
+        Returns:
+            bool (False if out of sync, until the next snapshot)
+        """
+        with self._lock:
+            if data.get('snapshot'):
+                self.book.snapshot(data)
+
+                return True
+
+            return self.book.apply(data)
+
+    def trades(self):
+        """
+        Returns and clears the tape, newest first.
+
+        Returns:
+            list
+        """
+        with self._lock:
+            trades = list(reversed(self.tape))
+
+            self.tape.clear()
+
+        return trades
+
+    def book_copy(self):
+        """
+        Returns a copy of the order book.
+
+        Returns:
+            OrderBook (None until in sync)
+        """
+        with self._lock:
+            return self.book.copy() if self.book.synced else None
+
+    def rates(self):
+        """
+        Returns the best BID, best ASK and last trade rates.
+
+        Returns:
+            tuple (None for each rate not yet received)
+        """
+        with self._lock:
+            return self.book.best_bid(), self.book.best_ask(), self.rate
@@ -0,0 +1,191 @@
+"""
+  bittrex_autotrader
+  Bittrex currency exchange autotrading script in a nutshell.
+
+  Copyright 2018-2020, Marc S. Brooks (https://mbrooks.info)
+  Licensed under the MIT license:
+  http://www.opensource.org/licenses/mit-license.php
+"""
+
+# Standard libraries.
+import concurrent.futures
+import itertools
+import os
+import tempfile
+
+# External modules.
+import humanfriendly.tables
+import numpy
+
+# Package modules.
+from .backtest import BittrexAutoTraderBacktest
+
+# Trade rates memory-mapped by each worker process, by file path.
+WORKER_RATES = {}
+
+#
+# Bittrex API autotrader parameter sweep.
+#
+class BittrexAutoTraderSweep:
+    """
+    Backtest every combination of markup, markdown and units in parallel.
+
+    Trade rates are written once to a temporary .npy file which each worker
+    process memory-maps, rather than pickling the series per task.
+
+    Dependencies:
+        humanfriendly
+        numpy
+    """
+
+    def __init__(self, options):
+        """
+        Create a new instance of BittrexAutoTraderSweep
+
+        Args:
+            options (dict):
+                Dictionary of options.
+
+        Attributes:
+            markup (list):
+                SELL markup percentages.
+            markdown (list):
+                BUY markdown percentages.
+            units (list):
+                BUY/SELL total units.
+            start (str):
+                Type of the first order, BUY or SELL (default: SELL).
+            workers (int):
+                Total worker processes (default: CPU count).
+        """
+        self.markup   = options['markup'].split(',')
+        self.markdown = options['markdown'].split(',')
+        self.units    = options['units'].split(',')
+        self.start    = options.get('start') or 'SELL'
+        self.workers  = int(options.get('workers') or os.cpu_count() or 1)
+
+    def run(self, trades):
+        """
+        Backtest all parameter combinations, return results ranked by PnL.
+
+        Args:
+            trades (ndarray):
+                Trades (structured array, oldest first) or trade rates.
+
+        Returns:
+            list
+        """
+        rates = trades['rate'] if trades.dtype.names else trades
+
+        params = self.combinations()
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            path = os.path.join(tmpdir, 'rates.npy')
+
+            numpy.save(path, numpy.ascontiguousarray(rates, dtype='f8'))
+
+            with concurrent.futures.ProcessPoolExecutor(self.workers) as executor:
+                results = list(executor.map(_run_worker, itertools.repeat(path), params))
+
+        return sorted(results, key=lambda result: result['pnl'], reverse=True)
+
+    def combinations(self):
+        """
+        Returns backtest options for every parameter combination.
+
+        Returns:
+            list
+        """
+        return [
+            {'spread': f'{markup}/{markdown}', 'units': units, 'start': self.start}
+            for markup, markdown, units in itertools.product(self.markup, self.markdown, self.units)
+        ]
+
+def _worker_rates(path):
+    """
+    Returns the shared trade rates, memory-mapped once per worker process.
+
+    Args:
+        path (str):
+            Trade rates .npy file.
+
+    Returns:
+        numpy.memmap
+    """
+    rates = WORKER_RATES.get(path)
+
+    if rates is None:
+        rates = WORKER_RATES[path] = numpy.load(path, mmap_mode='r')
+
+    return rates
+
+def _run_worker(path, params):
+    """
+    Backtest a single parameter combination in a worker process.
+
+    Args:
+        path (str):
+            Trade rates .npy file.
+        params (dict):
+            Backtest options (spread, units, start).
+
+    Returns:
+        dict
+    """
+    results = BittrexAutoTraderBacktest(params).run(_worker_rates(path))
+    results.update(params)
+
+    return results
+
+#
+# Start program.
+#
+if __name__ == '__main__':
+    ARG_PARSER = BittrexAutoTraderBacktest.arg_parser(
+        'Backtest combinations of spread and units in parallel.'
+    )
+
+    ARG_PARSER.add_argument(
+        '--markup',
+        help='Comma separated SELL markup percentages (default: 0.1)',
+        default='0.1'
+    )
+
+    ARG_PARSER.add_argument(
+        '--markdown',
+        help='Comma separated BUY markdown percentages (default: 0.1)',
+        default='0.1'
+    )
+
+    ARG_PARSER.add_argument(
+        '--units',
+        help='Comma separated BUY/SELL total units (default: 1.0)',
+        default='1.0'
+    )
+
+    ARG_PARSER.add_argument(
+        '--workers',
+        help='Total worker processes (default: CPU count)',
+        default=None
+    )
+
+    ARG_PARSER.add_argument(
+        '--top',
+        help='Total results to output (default: 20)',
+        type=int,
+        default=20
+    )
+
+    ARGS = ARG_PARSER.parse_args()
+
+    RESULTS = BittrexAutoTraderSweep(vars(ARGS)).run(
+        BittrexAutoTraderBacktest.load(ARGS.history)
+    )
+
+    COLUMNS = ['spread', 'units', 'pnl', 'fill_rate', 'max_drawdown', 'orders', 'fills']
+
+    # Output human-friendly results.
+    print(humanfriendly.tables.format_pretty_table(
+        [[result[name] for name in COLUMNS] for result in RESULTS[:ARGS.top]],
+        COLUMNS
+    ))
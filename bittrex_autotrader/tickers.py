@@ -0,0 +1,116 @@
+"""
+  bittrex_autotrader
+  Bittrex currency exchange autotrading script in a nutshell.
+
+  Copyright 2018-2020, Marc S. Brooks (https://mbrooks.info)
+  Licensed under the MIT license:
+  http://www.opensource.org/licenses/mit-license.php
+"""
+
+# Standard libraries.
+import threading
+import time
+
+class TickerSnapshot:
+    """
+    Tick values of all markets from a single markets/tickers response,
+    indexed by market symbol.
+    """
+
+    def __init__(self, data):
+        """
+        Create a new instance of TickerSnapshot
+
+        Args:
+            data (list):
+                Tickers as returned by the API (markets/tickers).
+
+        Attributes:
+            tickers (dict):
+                Tickers by market symbol.
+            created (float):
+                Monotonic time the snapshot was created.
+        """
+        self.tickers = {item['symbol']: item for item in data}
+        self.created = time.monotonic()
+
+    def __contains__(self, market_symbol):
+        return market_symbol in self.tickers
+
+    def __getitem__(self, market_symbol):
+        return self.tickers[market_symbol]
+
+    def __len__(self):
+        return len(self.tickers)
+
+    def age(self):
+        """
+        Returns seconds since the snapshot was created.
+
+        Returns:
+            float
+        """
+        return time.monotonic() - self.created
+
+class MarketTickers:
+    """
+    Latest ticker snapshot shared by the traders of many markets.
+
+    The snapshot is refreshed with one markets/tickers request once it is
+    older than max_age, rather than one markets/{symbol}/ticker request per
+    market.  Cached reads never refresh it.
+    """
+
+    def __init__(self, api_req, max_age=1):
+        """
+        Create a new instance of MarketTickers
+
+        Args:
+            api_req (BittrexAutoTraderRequest):
+                Instance of BittrexAutoTraderRequest.
+            max_age (float):
+                Seconds before the snapshot is refreshed (default: 1).
+
+        Attributes:
+            api_req (BittrexAutoTraderRequest):
+                Instance of BittrexAutoTraderRequest.
+            max_age (float):
+                Seconds before the snapshot is refreshed.
+            snapshot (TickerSnapshot):
+                Latest snapshot (None until the first request).
+        """
+        self.api_req  = api_req
+        self.max_age  = float(max_age)
+        self.snapshot = None
+
+        self._lock = threading.Lock()
+
+    def ticker(self, market_symbol, cached=False):
+        """
+        Returns the current tick values for a market.
+
+        Args:
+            market_symbol (str):
+                String literal (ie. BTC-LTC).
+            cached (bool):
+                Read the current snapshot, even if expired (default: False).
+
+        Returns:
+            dict (None if the market is not in the snapshot)
+        """
+        snapshot = self.snapshot if cached else self.latest()
+
+        return snapshot.tickers.get(market_symbol) if snapshot else None
+
+    def latest(self):
+        """
+        Returns the latest snapshot, refresh it if expired.
+
+        Returns:
+            TickerSnapshot
+        """
+        with self._lock:
+            if self.snapshot is None or self.snapshot.age() > self.max_age:
+                self.snapshot = TickerSnapshot(self.api_req.public_tickers())
+
+            return self.snapshot
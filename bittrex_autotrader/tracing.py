@@ -0,0 +1,163 @@
+"""
+  bittrex_autotrader
+  Bittrex currency exchange autotrading script in a nutshell.
+
+  Copyright 2018-2020, Marc S. Brooks (https://mbrooks.info)
+  Licensed under the MIT license:
+  http://www.opensource.org/licenses/mit-license.php
+"""
+
+# Standard libraries.
+import collections
+import functools
+import json
+import os
+import threading
+import time
+
+class Tracer:
+    """
+    Records timed spans to a ring buffer, dumped as Chrome trace events
+    (chrome://tracing, Perfetto).
+
+    Spans are timed with the monotonic performance counter.  While disabled
+    a span is a shared no-op context manager, so tracing costs an attribute
+    check.
+    """
+
+    def __init__(self, size=10000):
+        """
+        Create a new instance of Tracer
+
+        Args:
+            size (int):
+                Maximum spans kept, oldest are dropped (default: 10000).
+
+        Attributes:
+            enabled (bool):
+                Record spans.
+            spans (collections.deque):
+                Recorded (name, thread id, start, duration, args) spans.
+        """
+        self.enabled = False
+        self.spans   = collections.deque(maxlen=int(size))
+
+    def span(self, name, **args):
+        """
+        Returns a context manager that records a span while enabled.
+
+        Args:
+            name (str):
+                Span name (ie. fetch_ticker).
+            args (dict):
+                Span arguments shown in the trace viewer (optional).
+
+        Returns:
+            context manager
+        """
+        return _Span(self, name, args) if self.enabled else _NO_SPAN
+
+    def traced(self, name):
+        """
+        Returns a decorator that records a span for each call.
+
+        Args:
+            name (str):
+                Span name (ie. sign).
+
+        Returns:
+            callable
+        """
+        def decorator(func):
+            @functools.wraps(func)
+            def wrapper(*args, **kwargs):
+                with self.span(name):
+                    return func(*args, **kwargs)
+
+            return wrapper
+
+        return decorator
+
+    def events(self):
+        """
+        Returns the recorded spans as Chrome trace events.
+
+        Returns:
+            list
+        """
+        pid = os.getpid()
+
+        return [
+            {
+                'name': name,
+                'ph': 'X',
+                'ts': round(start * 1e6, 3),
+                'dur': round(duration * 1e6, 3),
+                'pid': pid,
+                'tid': tid,
+                'args': args
+            }
+            for name, tid, start, duration, args in list(self.spans)
+        ]
+
+    def dump(self, path):
+        """
+        Write the recorded spans to a Chrome trace JSON file (atomic rename).
+
+        Args:
+            path (str):
+                Trace file path.
+        """
+        tmp_path = path + '.tmp'
+
+        with open(tmp_path, 'w', encoding='utf-8') as file:
+            json.dump({'traceEvents': self.events(), 'displayTimeUnit': 'ms'}, file)
+
+        os.replace(tmp_path, path)
+
+class _Span:
+    """
+    Span being timed.
+    """
+
+    __slots__ = ('tracer', 'name', 'args', 'start')
+
+    def __init__(self, tracer, name, args):
+        self.tracer = tracer
+        self.name   = name
+        self.args   = args
+        self.start  = 0.0
+
+    def __enter__(self):
+        self.start = time.perf_counter()
+
+        return self
+
+    def __exit__(self, *exc_info):
+        self.tracer.spans.append((
+            self.name,
+            threading.get_ident(),
+            self.start,
+            time.perf_counter() - self.start,
+            self.args
+        ))
+
+class _NoSpan:
+    """
+    Span of a disabled tracer.
+    """
+
+    __slots__ = ()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        pass
+
+_NO_SPAN = _NoSpan()
+
+#
+# Package tracer.
+#
+TRACER = Tracer()
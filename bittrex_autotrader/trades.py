@@ -0,0 +1,359 @@
+"""
+  bittrex_autotrader
+  Bittrex currency exchange autotrading script in a nutshell.
+
+  Copyright 2018-2020, Marc S. Brooks (https://mbrooks.info)
+  Licensed under the MIT license:
+  http://www.opensource.org/licenses/mit-license.php
+"""
+
+# Standard libraries.
+import collections
+
+# External modules.
+import numpy
+
+# Trade taker side values.
+BUY  = 1
+SELL = -1
+
+# Structured array type of a market trade.
+TRADE_DTYPE = numpy.dtype([
+    ('id', 'U36'),
+    ('timestamp', 'M8[ms]'),
+    ('rate', 'f8'),
+    ('quantity', 'f8'),
+    ('side', 'i1')
+])
+
+def side_of(trade_type):
+    """
+    Returns the taker side value for a trade type.
+
+    Args:
+        trade_type (str):
+            BUY or SELL.
+
+    Returns:
+        int
+    """
+    return BUY if trade_type == 'BUY' else SELL
+
+def to_array(data, record=False):
+    """
+    Returns list of trade dictionaries as a structured ndarray.
+
+    The array is allocated once and each column is filled from a list of
+    the parsed JSON values, converted by numpy in bulk.
+
+    Args:
+        data (list):
+            Trades as returned by the API (markets/{symbol}/trades).
+        record (bool):
+            Return a record array with attribute column access (default: False).
+
+    Returns:
+        ndarray
+
+    .. seealso:: https://bittrex.github.io/api/v3#/definitions/Trade
+    """
+    trades = numpy.empty(len(data), dtype=TRADE_DTYPE)
+
+    trades['id']        = [item['id'] for item in data]
+    trades['timestamp'] = [item['executedAt'].rstrip('Z') for item in data]
+    trades['rate']      = [item['rate'] for item in data]
+    trades['quantity']  = [item['quantity'] for item in data]
+    trades['side']      = [BUY if item['takerSide'] == 'BUY' else SELL for item in data]
+
+    return trades.view(numpy.recarray) if record else trades
+
+class TradeBuffer:
+    """
+    Fixed capacity ring buffer of market trades, deduplicated by trade id.
+
+    Average and maximum rates per taker side are kept up to date as trades
+    are added and expire, so each update costs O(new trades).
+    """
+
+    def __init__(self, capacity=100, period=None):
+        """
+        Create a new instance of TradeBuffer
+
+        Args:
+            capacity (int):
+                Maximum number of trades to keep (default: 100).
+            period (float):
+                Seconds of trades to keep, relative to the latest trade (optional).
+
+        Attributes:
+            capacity (int):
+                Maximum number of trades to keep.
+            period (timedelta64):
+                Time window of trades to keep (None if unlimited).
+        """
+        period = float(period or 0)
+
+        self.capacity = int(capacity)
+        self.period   = numpy.timedelta64(int(period * 1000), 'ms') if period > 0 else None
+
+        # Trade seq is stored at index seq % capacity.
+        self._trades = numpy.zeros(self.capacity, dtype=TRADE_DTYPE)
+        self._ids    = set()
+        self._count  = 0
+        self._seq    = 0
+
+        # Running [rate sum, count] and monotonic (seq, rate) maxima queues per side.
+        self._totals = {BUY: [0.0, 0], SELL: [0.0, 0]}
+        self._maxima = {BUY: collections.deque(), SELL: collections.deque()}
+
+    def __len__(self):
+        return self._count
+
+    @property
+    def _start(self):
+        """
+        Returns the index of the oldest buffered trade.
+
+        Returns:
+            int
+        """
+        return (self._seq - self._count) % self.capacity
+
+    def extend(self, data):
+        """
+        Append trades that have not been seen before, expire old trades.
+
+        Args:
+            data (list):
+                Trades as returned by the API (markets/{symbol}/trades).
+
+        Returns:
+            ndarray (new trades, oldest first)
+        """
+        # Every trade of the first batch is new.
+        if self._ids:
+            data = [item for item in data if item['id'] not in self._ids]
+
+        # API trades are newest first, keep same time trades in order.
+        trades = to_array(data)[::-1]
+
+        timestamps = trades['timestamp']
+
+        if (timestamps[1:] < timestamps[:-1]).any():
+            trades = trades[numpy.argsort(timestamps, kind='stable')]
+
+        # Keep the buffer in time order, older trades are not inserted.
+        if self._count:
+            trades = trades[trades['timestamp'] >= self._latest()['timestamp']]
+
+        trades = trades[-self.capacity:]
+
+        if trades.size:
+            self._evict(self._count + trades.size - self.capacity)
+            self._insert(trades)
+
+        if self.period is not None and self._count:
+            self._expire(self._latest()['timestamp'] - self.period)
+
+        return trades
+
+    def mean(self, side):
+        """
+        Returns the average trade rate for a taker side.
+
+        Args:
+            side (int):
+                Taker side (BUY or SELL).
+
+        Returns:
+            float (nan if there are no trades)
+        """
+        total, count = self._totals[side]
+
+        return total / count if count else float('nan')
+
+    def max(self, side):
+        """
+        Returns the maximum trade rate for a taker side.
+
+        Args:
+            side (int):
+                Taker side (BUY or SELL).
+
+        Returns:
+            float (nan if there are no trades)
+        """
+        maxima = self._maxima[side]
+
+        return maxima[0][1] if maxima else float('nan')
+
+    def array(self):
+        """
+        Returns buffered trades as a structured ndarray.
+
+        Returns:
+            ndarray (oldest first)
+        """
+        end = self._start + self._count
+
+        if end <= self.capacity:
+            return self._trades[self._start:end].copy()
+
+        return numpy.concatenate((
+            self._trades[self._start:],
+            self._trades[:end - self.capacity]
+        ))
+
+    def values(self, side, column='rate'):
+        """
+        Returns a column of buffered trades for a taker side.
+
+        Args:
+            side (int):
+                Taker side (BUY or SELL).
+            column (str):
+                Trade column to return (default: rate).
+
+        Returns:
+            ndarray (oldest first)
+        """
+        end = self._start + self._count
+
+        # Select from the buffer in place unless it wraps around.
+        trades = self._trades[self._start:end] if end <= self.capacity else self.array()
+
+        return trades[column][trades['side'] == side]
+
+    def _latest(self):
+        """
+        Returns the most recent buffered trade.
+
+        Returns:
+            numpy.void
+        """
+        return self._trades[(self._start + self._count - 1) % self.capacity]
+
+    def _insert(self, trades):
+        """
+        Append trades to the free space after the newest trade.
+
+        Trades are copied in at most two slices and totals are updated per
+        batch; the maxima queues are extended in one pass over the new
+        trades, newest first.
+
+        Args:
+            trades (ndarray):
+                Trades to append (oldest first, at most the free space).
+        """
+        total = trades.size
+        start = (self._start + self._count) % self.capacity
+        split = min(total, self.capacity - start)
+
+        self._trades[start:start + split] = trades[:split]
+        self._trades[:total - split]      = trades[split:]
+
+        self._ids.update(trades['id'].tolist())
+        self._count += total
+
+        self._add_totals(trades, 1)
+
+        rates = trades['rate'].tolist()
+        sides = trades['side'].tolist()
+
+        # Newest first, a trade stays queued only if above every later trade of its side.
+        later = {BUY: float('-inf'), SELL: float('-inf')}
+        kept  = {BUY: [], SELL: []}
+
+        for i in range(total - 1, -1, -1):
+            rate = rates[i]
+
+            if rate > later[sides[i]]:
+                later[sides[i]] = rate
+
+                kept[sides[i]].append((self._seq + i, rate))
+
+        # Queued trades at or below the highest new trade are superseded.
+        for side, maxima in self._maxima.items():
+            if kept[side]:
+                while maxima and maxima[-1][1] <= later[side]:
+                    maxima.pop()
+
+                maxima.extend(reversed(kept[side]))
+
+        self._seq += total
+
+    def _evict(self, total):
+        """
+        Evict the oldest trades.
+
+        Args:
+            total (int):
+                Total trades to evict (none if zero or less).
+        """
+        if total <= 0:
+            return
+
+        stop = self._start + total
+
+        if stop <= self.capacity:
+            trades = self._trades[self._start:stop]
+        else:
+            trades = numpy.concatenate((
+                self._trades[self._start:],
+                self._trades[:stop - self.capacity]
+            ))
+
+        self._ids.difference_update(trades['id'].tolist())
+        self._add_totals(trades, -1)
+
+        self._count -= total
+
+        oldest = self._seq - self._count
+
+        for maxima in self._maxima.values():
+            while maxima and maxima[0][0] < oldest:
+                maxima.popleft()
+
+        # Resynchronize running totals once per buffer cycle.
+        if stop >= self.capacity:
+            trades = self.array()
+
+            for side, totals in self._totals.items():
+                totals[0] = float(trades['rate'][trades['side'] == side].sum())
+
+    def _add_totals(self, trades, sign):
+        """
+        Add trades to (or subtract them from) the running totals.
+
+        Args:
+            trades (ndarray):
+                Trades to count.
+            sign (int):
+                1 to add, -1 to subtract.
+        """
+        for side, totals in self._totals.items():
+            mask = trades['side'] == side
+
+            totals[0] += sign * float(trades['rate'][mask].sum())
+            totals[1] += sign * int(numpy.count_nonzero(mask))
+
+    def _expire(self, timestamp):
+        """
+        Evict trades older than the given time.
+
+        Args:
+            timestamp (datetime64):
+                Oldest trade time to keep.
+        """
+        end = self._start + self._count
+
+        # Buffered timestamps are ascending in each of the two ring slices.
+        timestamps = self._trades['timestamp']
+
+        head  = timestamps[self._start:min(end, self.capacity)]
+        total = int(numpy.searchsorted(head, timestamp))
+
+        if total == head.size and end > self.capacity:
+            total += int(numpy.searchsorted(timestamps[:end - self.capacity], timestamp))
+
+        self._evict(total)
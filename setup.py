@@ -23,6 +23,12 @@ setuptools.setup(
     download_url='https://github.com/nuxy/bittrex_autotrader/archive/{0}.tar.gz'.format(VERSION),
     packages=setuptools.find_packages(),
     scripts=['bin/bittrex_autotrader'],
+    install_requires=[
+        'aiohttp>=3.7',
+        'humanfriendly>=9.1',
+        'numpy>=1.19',
+        'requests>=2.25'
+    ],
     keywords=['trading-bot', 'api-client', 'cryptocurrency', 'bittrex'],
     python_requires='>=3.6',
     classifiers=[